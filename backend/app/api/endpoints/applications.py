@@ -2,11 +2,12 @@
 """
 応募管理API
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from sqlalchemy import exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import uuid
 from datetime import datetime
-import json
 
 from app.schemas.application import (
     ApplicationCreate,
@@ -20,10 +21,11 @@ from app.schemas.application import (
 from app.models.application import Application, ApplicationStatus
 from app.models.job import Job
 from app.models.user import UserRole, User
-from app.db.session import get_db
-from app.core.dependencies import CurrentUser
+from app.models.resume import Resume
+from app.db.session import get_db, get_async_db
+from app.core.dependencies import CurrentUser, AsyncCurrentUser
 from app.core.subscription import verify_subscription_limit
-from app.repositories.resume_repository import ResumeRepository
+from app.utils.normalization import to_str_tuple
 
 router = APIRouter()
 
@@ -103,8 +105,8 @@ def application_to_detail(application: Application, job: Job) -> ApplicationDeta
 
 @router.get("/", response_model=ApplicationListResponse)
 async def get_applications(
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    current_user: AsyncCurrentUser,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     自分の応募一覧を取得
@@ -122,17 +124,15 @@ async def get_applications(
             detail="求職者のみアクセス可能です"
         )
 
-    # 応募を取得
-    applications = db.query(Application).filter(
-        Application.seeker_id == current_user.id
-    ).order_by(Application.applied_at.desc()).all()
+    # 応募と求人情報を結合して取得（求人が削除された応募は除外）
+    rows = await db.execute(
+        select(Application, Job)
+        .join(Job, Job.id == Application.job_id)
+        .where(Application.seeker_id == current_user.id)
+        .order_by(Application.applied_at.desc())
+    )
 
-    # 求人情報を結合
-    items = []
-    for application in applications:
-        job = db.query(Job).filter(Job.id == application.job_id).first()
-        if job:
-            items.append(application_to_item(application, job))
+    items = [application_to_item(application, job) for application, job in rows]
 
     return ApplicationListResponse(
         applications=items,
@@ -140,13 +140,29 @@ async def get_applications(
     )
 
 
+# 企業向け応募一覧の並び替えキー
+EMPLOYER_APPLICATION_SORTS = {
+    "applied_at": Application.applied_at,
+    "updated_at": Application.updated_at,
+    "match_score": Application.match_score,
+    "status": Application.status,
+}
+
+
 @router.get("/employer", response_model=EmployerApplicationListResponse)
 async def get_employer_applications(
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    current_user: AsyncCurrentUser,
+    db: AsyncSession = Depends(get_async_db),
+    page: int = Query(1, ge=1),
+    per_page: int = Query(100, ge=1, le=500),
+    sort: str = Query("applied_at", pattern="^(applied_at|updated_at|match_score|status)$"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
 ):
     """
     企業向け応募一覧を取得
+
+    自社求人への応募だけを求人・求職者と結合した1クエリで取得する。
+    履歴書の有無は EXISTS サブクエリ、総件数はウィンドウ関数で同じクエリから得る。
     """
     if current_user.role != UserRole.EMPLOYER:
         raise HTTPException(
@@ -154,68 +170,112 @@ async def get_employer_applications(
             detail="企業ユーザーのみアクセス可能です"
         )
 
-    applications = db.query(Application).order_by(Application.applied_at.desc()).all()
-    resume_repo = ResumeRepository(db)
-    items = []
-
-    for application in applications:
-        job = db.query(Job).filter(Job.id == application.job_id).first()
-        if not job or job.employer_id != current_user.id:
-            continue
-
-        seeker = db.query(User).filter(User.id == application.seeker_id).first()
-        if not seeker:
-            continue
-
-        skills = []
-        if seeker.skills:
-            try:
-                skills = json.loads(seeker.skills)
-            except Exception:
-                skills = [seeker.skills]
-
-        desired_salary = ""
-        if seeker.desired_salary_min and seeker.desired_salary_max:
-            desired_salary = f"{seeker.desired_salary_min}万円〜{seeker.desired_salary_max}万円"
-        elif seeker.desired_salary_min:
-            desired_salary = f"{seeker.desired_salary_min}万円〜"
-
-        salary = job.salary_text or ""
-        if not salary and job.salary_min and job.salary_max:
-            salary = f"{job.salary_min}万円～{job.salary_max}万円"
-
-        items.append(EmployerApplicationItem(
-            applicationId=application.id,
-            seekerId=seeker.id,
-            seekerName=seeker.name,
-            jobId=job.id,
-            jobTitle=job.title,
-            company=job.company,
-            location=job.location,
-            salary=salary,
-            matchScore=application.match_score,
-            status=application.status.value,
-            statusDetail=application.status_detail,
-            statusColor=application.status_color or get_status_color(application.status),
-            appliedDate=application.applied_at.strftime("%Y-%m-%d") if application.applied_at else "",
-            lastUpdate=application.updated_at.strftime("%Y-%m-%d") if application.updated_at else "",
-            desiredLocation=seeker.desired_location,
-            desiredSalary=desired_salary,
-            desiredEmploymentType=seeker.desired_employment_type,
-            experienceYears=seeker.experience_years,
-            profileCompletion=seeker.profile_completion,
-            skills=skills[:5] if isinstance(skills, list) else [],
-            hasResume=resume_repo.exists_for_user(seeker.id),
-            documents={
-                "resume": application.resume_submitted == "true",
-                "portfolio": application.portfolio_submitted == "true",
-                "coverLetter": bool(application.cover_letter),
-            }
-        ))
+    has_resume = exists().where(Resume.user_id == Application.seeker_id)
+    sort_column = EMPLOYER_APPLICATION_SORTS[sort]
+    sort_order = sort_column.asc() if order == "asc" else sort_column.desc()
+
+    query = (
+        select(
+            Application.id,
+            Application.match_score,
+            Application.status,
+            Application.status_detail,
+            Application.status_color,
+            Application.applied_at,
+            Application.updated_at,
+            Application.resume_submitted,
+            Application.portfolio_submitted,
+            (func.coalesce(func.length(Application.cover_letter), 0) > 0).label("has_cover_letter"),
+            Job.id.label("job_id"),
+            Job.title,
+            Job.company,
+            Job.location,
+            Job.salary_text,
+            Job.salary_min,
+            Job.salary_max,
+            User.id.label("seeker_id"),
+            User.name,
+            User.desired_location,
+            User.desired_salary_min,
+            User.desired_salary_max,
+            User.desired_employment_type,
+            User.experience_years,
+            User.profile_completion,
+            User.skills,
+            has_resume.label("has_resume"),
+            func.count().over().label("total_count"),
+        )
+        .join(Job, Job.id == Application.job_id)
+        .join(User, User.id == Application.seeker_id)
+        .where(Job.employer_id == current_user.id)
+        .order_by(sort_order, Application.id)
+        .offset((page - 1) * per_page)
+        .limit(per_page)
+    )
+
+    rows = (await db.execute(query)).all()
+
+    if rows:
+        total = rows[0].total_count
+    else:
+        # ページ範囲外の場合のみ件数を別途取得
+        total = await db.scalar(
+            select(func.count())
+            .select_from(Application)
+            .join(Job, Job.id == Application.job_id)
+            .join(User, User.id == Application.seeker_id)
+            .where(Job.employer_id == current_user.id)
+        ) if page > 1 else 0
 
     return EmployerApplicationListResponse(
-        applications=items,
-        total=len(items),
+        applications=[employer_application_row_to_item(row) for row in rows],
+        total=total,
+        page=page,
+        perPage=per_page,
+    )
+
+
+def employer_application_row_to_item(row) -> EmployerApplicationItem:
+    """結合クエリの行を企業向け応募項目に変換"""
+    skills = list(to_str_tuple(row.skills))
+
+    desired_salary = ""
+    if row.desired_salary_min and row.desired_salary_max:
+        desired_salary = f"{row.desired_salary_min}万円〜{row.desired_salary_max}万円"
+    elif row.desired_salary_min:
+        desired_salary = f"{row.desired_salary_min}万円〜"
+
+    salary = row.salary_text or ""
+    if not salary and row.salary_min and row.salary_max:
+        salary = f"{row.salary_min}万円～{row.salary_max}万円"
+
+    return EmployerApplicationItem(
+        applicationId=row.id,
+        seekerId=row.seeker_id,
+        seekerName=row.name,
+        jobId=row.job_id,
+        jobTitle=row.title,
+        company=row.company,
+        location=row.location,
+        salary=salary,
+        matchScore=row.match_score,
+        status=row.status.value,
+        statusDetail=row.status_detail,
+        statusColor=row.status_color or get_status_color(row.status),
+        appliedDate=row.applied_at.strftime("%Y-%m-%d") if row.applied_at else "",
+        lastUpdate=row.updated_at.strftime("%Y-%m-%d") if row.updated_at else "",
+        desiredLocation=row.desired_location,
+        desiredSalary=desired_salary,
+        desiredEmploymentType=row.desired_employment_type,
+        experienceYears=row.experience_years,
+        profileCompletion=row.profile_completion,
+        skills=skills[:5] if isinstance(skills, list) else [],
+        hasResume=bool(row.has_resume),
+        documents={
+            "resume": row.resume_submitted == "true",
+            "portfolio": row.portfolio_submitted == "true",
+            "coverLetter": bool(row.has_cover_letter),
+        }
     )
 
 
@@ -289,8 +349,8 @@ async def create_application(
 @router.get("/{application_id}", response_model=ApplicationDetail)
 async def get_application(
     application_id: str,
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    current_user: AsyncCurrentUser,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     応募詳細を取得
@@ -303,9 +363,9 @@ async def get_application(
     Returns:
         応募詳細
     """
-    application = db.query(Application).filter(
-        Application.id == application_id
-    ).first()
+    application = await db.scalar(
+        select(Application).where(Application.id == application_id)
+    )
 
     if not application:
         raise HTTPException(
@@ -314,7 +374,7 @@ async def get_application(
         )
 
     # 求職者本人または求人の企業のみアクセス可能
-    job = db.query(Job).filter(Job.id == application.job_id).first()
+    job = await db.scalar(select(Job).where(Job.id == application.job_id))
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
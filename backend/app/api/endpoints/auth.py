@@ -5,7 +5,6 @@
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
 import uuid
-import json
 from datetime import datetime, timedelta
 import bcrypt
 from jose import jwt, JWTError
@@ -23,6 +22,8 @@ from app.models.user import User, UserRole
 from app.db.session import get_db
 from app.core.config import get_settings
 from app.core.dependencies import CurrentUser
+from app.core.threadpool import run_blocking
+from app.utils.normalization import to_str_tuple
 
 router = APIRouter()
 settings = get_settings()
@@ -88,7 +89,7 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     user = User(
         id=str(uuid.uuid4()),
         email=request.email,
-        password_hash=get_password_hash(request.password),
+        password_hash=await run_blocking(get_password_hash, request.password),
         name=request.name,
         role=UserRole(request.role),
         company_name=request.companyName if request.role == "employer" else None,
@@ -138,7 +139,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     # ユーザーを検索
     user = db.query(User).filter(User.email == request.email).first()
 
-    if not user or not verify_password(request.password, user.password_hash):
+    if not user or not await run_blocking(verify_password, request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="メールアドレスまたはパスワードが正しくありません"
@@ -157,13 +158,7 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     # トークンを生成
     access_token, expires_in = create_access_token(user.id)
 
-    # スキルをJSON解析
-    skills = None
-    if user.skills:
-        try:
-            skills = json.loads(user.skills)
-        except:
-            pass
+    skills = list(to_str_tuple(user.skills)) if user.skills else None
 
     # レスポンスを作成
     user_response = UserResponse(
@@ -233,12 +228,7 @@ async def link_line(
     db.refresh(current_user)
 
     # レスポンスを作成
-    skills = None
-    if current_user.skills:
-        try:
-            skills = json.loads(current_user.skills)
-        except:
-            pass
+    skills = list(to_str_tuple(current_user.skills)) if current_user.skills else None
 
     user_response = UserResponse(
         id=current_user.id,
@@ -326,7 +316,7 @@ async def register_with_line(
     user = User(
         id=str(uuid.uuid4()),
         email=email,
-        password_hash=get_password_hash(str(uuid.uuid4())),  # ランダムパスワード生成
+        password_hash=await run_blocking(get_password_hash, str(uuid.uuid4())),  # ランダムパスワード生成
         name=request.name,
         role=UserRole(request.role),
         line_user_id=request.lineUserId,
@@ -345,7 +335,7 @@ async def register_with_line(
     access_token, expires_in = create_access_token(user.id)
 
     # レスポンスを作成
-    skills = json.loads(user.skills) if user.skills else []
+    skills = list(to_str_tuple(user.skills))
 
     user_response = UserResponse(
         id=user.id,
@@ -422,12 +412,7 @@ async def login_with_line(
     db.refresh(user)
 
     # レスポンスを作成
-    skills = None
-    if user.skills:
-        try:
-            skills = json.loads(user.skills)
-        except:
-            pass
+    skills = list(to_str_tuple(user.skills)) if user.skills else None
 
     user_response = UserResponse(
         id=user.id,
@@ -474,13 +459,7 @@ async def get_current_user_info(current_user: CurrentUser):
     Returns:
         ユーザー情報とトークン情報
     """
-    # スキルをJSON解析
-    skills = None
-    if current_user.skills:
-        try:
-            skills = json.loads(current_user.skills)
-        except:
-            pass
+    skills = list(to_str_tuple(current_user.skills)) if current_user.skills else None
 
     # レスポンスを作成
     user_response = UserResponse(
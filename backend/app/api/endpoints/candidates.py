@@ -3,7 +3,7 @@
 候補者API（企業向け）
 """
 from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 
 from app.schemas.candidate import (
@@ -12,31 +12,47 @@ from app.schemas.candidate import (
     CandidateListResponse,
     CandidateSearchRequest,
 )
-from app.services.candidate_service import CandidateService
-from app.core.dependencies import CurrentUser
-from app.db.session import get_db
+from app.services.candidate_service import AsyncCandidateService
+from app.core.dependencies import AsyncCurrentUser
+from app.db.session import get_async_db
+from app.utils.pagination import decode_cursor
 
 router = APIRouter()
 
 
-def get_candidate_service(db: Session = Depends(get_db)) -> CandidateService:
+def validate_cursor(cursor: Optional[str]) -> None:
+    """カーソルの形式を検証（不正な場合は400）"""
+    if not cursor:
+        return
+    try:
+        decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="無効なカーソルです"
+        )
+
+
+def get_candidate_service(db: AsyncSession = Depends(get_async_db)) -> AsyncCandidateService:
     """候補者サービスを取得"""
-    return CandidateService(db)
+    return AsyncCandidateService(db)
 
 
 @router.get("/", response_model=CandidateListResponse)
 async def get_candidates(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    current_user: CurrentUser = None,
-    service: CandidateService = Depends(get_candidate_service),
+    cursor: Optional[str] = Query(None, description="前ページの nextCursor"),
+    current_user: AsyncCurrentUser = None,
+    service: AsyncCandidateService = Depends(get_candidate_service),
 ):
     """
     候補者一覧を取得（企業向け）
 
     Args:
-        page: ページ番号
+        page: ページ番号（cursor 未指定時のみ使用）
         per_page: 1ページあたりの件数
+        cursor: 続きを取得するカーソル
         current_user: 現在のユーザー（企業のみ）
         service: 候補者サービス
 
@@ -50,21 +66,23 @@ async def get_candidates(
             detail="企業ユーザーのみアクセス可能です"
         )
 
-    result = service.get_candidates(page=page, per_page=per_page)
+    validate_cursor(cursor)
+    result = await service.get_candidates(page=page, per_page=per_page, cursor=cursor)
 
     return CandidateListResponse(
         candidates=[CandidateItem(**c) for c in result["candidates"]],
         total=result["total"],
         page=result["page"],
         perPage=result["per_page"],
+        nextCursor=result["next_cursor"],
     )
 
 
 @router.get("/{candidate_id}", response_model=CandidateDetail)
 async def get_candidate(
     candidate_id: str,
-    current_user: CurrentUser = None,
-    service: CandidateService = Depends(get_candidate_service),
+    current_user: AsyncCurrentUser = None,
+    service: AsyncCandidateService = Depends(get_candidate_service),
 ):
     """
     候補者詳細を取得（企業向け）
@@ -84,7 +102,7 @@ async def get_candidate(
             detail="企業ユーザーのみアクセス可能です"
         )
 
-    result = service.get_candidate_detail(candidate_id)
+    result = await service.get_candidate_detail(candidate_id)
 
     if not result:
         raise HTTPException(
@@ -98,8 +116,8 @@ async def get_candidate(
 @router.post("/search", response_model=CandidateListResponse)
 async def search_candidates(
     request: CandidateSearchRequest,
-    current_user: CurrentUser = None,
-    service: CandidateService = Depends(get_candidate_service),
+    current_user: AsyncCurrentUser = None,
+    service: AsyncCandidateService = Depends(get_candidate_service),
 ):
     """
     候補者を検索（企業向け）
@@ -119,7 +137,8 @@ async def search_candidates(
             detail="企業ユーザーのみアクセス可能です"
         )
 
-    result = service.search_candidates(
+    validate_cursor(request.cursor)
+    result = await service.search_candidates(
         query=request.query,
         skills=request.skills,
         location=request.location,
@@ -129,6 +148,7 @@ async def search_candidates(
         salary_max=request.salaryMax,
         page=request.page,
         per_page=request.perPage,
+        cursor=request.cursor,
     )
 
     return CandidateListResponse(
@@ -136,4 +156,5 @@ async def search_candidates(
         total=result["total"],
         page=result["page"],
         perPage=result["per_page"],
+        nextCursor=result["next_cursor"],
     )
@@ -18,6 +18,7 @@ from app.core.dependencies import (
 )
 from app.core.exceptions import OpenAIError, StorageError, NotFoundError
 from app.core.subscription import verify_subscription_limit
+from app.core.threadpool import run_blocking
 from app.models.user import User, UserRole
 from app.services.chat_service import ChatService
 from app.services.employer_chat_service import EmployerChatService
@@ -92,7 +93,9 @@ async def chat(
             chat_service = ChatService()
 
         # メッセージ処理
-        result = chat_service.process_message(
+        # OpenAI呼び出しを含むためスレッドプールで実行
+        result = await run_blocking(
+            chat_service.process_message,
             user_id=request.user_id,
             user_message=request.message,
             session_id=request.conversation_id
@@ -174,7 +177,7 @@ async def get_conversations(
                     logger.info(f"[Seeker Chat] Starting chat for seeker: {current_user.id}")
                     chat_service = ChatService()
                 
-                result = chat_service.start_chat(user_id=user_id)
+                result = await run_blocking(chat_service.start_chat, user_id=user_id)
                 
                 # 新規会話オブジェクトを作成
                 new_conversation = {
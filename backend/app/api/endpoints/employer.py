@@ -8,15 +8,17 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
-import json
 
 from app.db.session import get_db
 from app.models.user import User, UserRole
 from app.models.job import Job, JobStatus, EmploymentType
-from app.models.application import Application, ApplicationStatus
+from app.models.application import Application
 from app.core.dependencies import CurrentUser
+from app.repositories.job_repository import JobRepository
+from app.services.employer_stats_service import EmployerStatsService
 from app.services.auth_service import AuthService
 from app.services.openai_service import get_openai_service
+from app.utils.normalization import to_str_tuple
 
 router = APIRouter()
 
@@ -150,20 +152,8 @@ class DashboardStats(BaseModel):
 
 def job_to_response(job: Job, applications_count: int = 0) -> JobResponse:
     """JobモデルをJobResponseに変換"""
-    required_skills = None
-    preferred_skills = None
-
-    if job.required_skills:
-        try:
-            required_skills = json.loads(job.required_skills)
-        except:
-            pass
-
-    if job.preferred_skills:
-        try:
-            preferred_skills = json.loads(job.preferred_skills)
-        except:
-            pass
+    required_skills = list(to_str_tuple(job.required_skills)) if job.required_skills else None
+    preferred_skills = list(to_str_tuple(job.preferred_skills)) if job.preferred_skills else None
 
     return JobResponse(
         id=job.id,
@@ -271,8 +261,8 @@ async def create_job(
         employment_type=EmploymentType(request.employmentType),
         salary_min=request.salaryMin,
         salary_max=request.salaryMax,
-        required_skills=json.dumps(request.requiredSkills) if request.requiredSkills else None,
-        preferred_skills=json.dumps(request.preferredSkills) if request.preferredSkills else None,
+        required_skills=request.requiredSkills or None,
+        preferred_skills=request.preferredSkills or None,
         requirements=request.requirements,
         benefits=request.benefits,
         status=JobStatus(request.status),
@@ -301,20 +291,23 @@ async def get_employer_jobs(
             detail="企業ユーザーのみアクセス可能です"
         )
 
-    query = db.query(Job).filter(Job.employer_id == current_user.id)
+    job_status = JobStatus(status) if status else None
 
-    if status:
-        query = query.filter(Job.status == JobStatus(status))
+    query = db.query(Job).filter(Job.employer_id == current_user.id)
+    if job_status is not None:
+        query = query.filter(Job.status == job_status)
 
     total = query.count()
     total_pages = (total + limit - 1) // limit
 
-    jobs = query.order_by(Job.created_at.desc()).offset((page - 1) * limit).limit(limit).all()
-
-    items = []
-    for job in jobs:
-        app_count = db.query(Application).filter(Application.job_id == job.id).count()
-        items.append(job_to_response(job, app_count))
+    # 求人ページと応募数を1クエリで取得
+    rows = JobRepository(db).get_by_employer_with_application_counts(
+        current_user.id,
+        status=job_status,
+        skip=(page - 1) * limit,
+        limit=limit,
+    )
+    items = [job_to_response(job, app_count) for job, app_count in rows]
 
     return JobListResponse(
         items=items,
@@ -385,9 +378,9 @@ async def update_job(
     if request.salaryMax is not None:
         job.salary_max = request.salaryMax
     if request.requiredSkills is not None:
-        job.required_skills = json.dumps(request.requiredSkills)
+        job.required_skills = request.requiredSkills
     if request.preferredSkills is not None:
-        job.preferred_skills = json.dumps(request.preferredSkills)
+        job.preferred_skills = request.preferredSkills
     if request.requirements is not None:
         job.requirements = request.requirements
     if request.benefits is not None:
@@ -504,53 +497,16 @@ async def get_dashboard_stats(
             detail="企業ユーザーのみアクセス可能です"
         )
 
-    # 求人統計
-    total_jobs = db.query(Job).filter(Job.employer_id == current_user.id).count()
-    published_jobs = db.query(Job).filter(
-        Job.employer_id == current_user.id,
-        Job.status == JobStatus.PUBLISHED
-    ).count()
-    draft_jobs = db.query(Job).filter(
-        Job.employer_id == current_user.id,
-        Job.status == JobStatus.DRAFT
-    ).count()
-    closed_jobs = db.query(Job).filter(
-        Job.employer_id == current_user.id,
-        Job.status == JobStatus.CLOSED
-    ).count()
-
-    # 応募統計（自社の求人への応募）
-    employer_job_ids = [j.id for j in db.query(Job.id).filter(Job.employer_id == current_user.id).all()]
-
-    if employer_job_ids:
-        total_applications = db.query(Application).filter(
-            Application.job_id.in_(employer_job_ids)
-        ).count()
-        pending_applications = db.query(Application).filter(
-            Application.job_id.in_(employer_job_ids),
-            Application.status == ApplicationStatus.SCREENING
-        ).count()
-        interview_applications = db.query(Application).filter(
-            Application.job_id.in_(employer_job_ids),
-            Application.status == ApplicationStatus.INTERVIEW
-        ).count()
-        offer_applications = db.query(Application).filter(
-            Application.job_id.in_(employer_job_ids),
-            Application.status == ApplicationStatus.OFFERED
-        ).count()
-    else:
-        total_applications = 0
-        pending_applications = 0
-        interview_applications = 0
-        offer_applications = 0
+    # 企業統計の1行を読む（未作成の場合は1クエリで集計）
+    stats = EmployerStatsService(db).get_dashboard_stats(current_user.id)
 
     return DashboardStats(
-        totalJobs=total_jobs,
-        publishedJobs=published_jobs,
-        draftJobs=draft_jobs,
-        closedJobs=closed_jobs,
-        totalApplications=total_applications,
-        pendingApplications=pending_applications,
-        interviewApplications=interview_applications,
-        offerApplications=offer_applications
+        totalJobs=stats["total_jobs"],
+        publishedJobs=stats["published_jobs"],
+        draftJobs=stats["draft_jobs"],
+        closedJobs=stats["closed_jobs"],
+        totalApplications=stats["total_applications"],
+        pendingApplications=stats["pending_applications"],
+        interviewApplications=stats["interview_applications"],
+        offerApplications=stats["offer_applications"]
     )
@@ -3,9 +3,9 @@
 求人API（求職者向け）
 """
 from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-import json
 
 from app.schemas.job import (
     JobListItem,
@@ -13,21 +13,20 @@ from app.schemas.job import (
     JobSearchRequest,
     JobListResponse,
 )
-from app.models.job import Job, JobStatus
-from app.db.session import get_db
+from app.models.job import Job, JobStatus, job_load_options
+from app.db.session import get_async_db
+from app.db.counter_buffer import record_job_view
+from app.db.job_search import get_job_search_backend
+from app.utils.normalization import salary_to_yen, to_str_tuple
+from app.utils.count_cache import CountCache, get_count_cache
+from app.utils.pagination import keyset_after, keyset_order, next_cursor
 
 router = APIRouter()
 
 
 def job_to_list_item(job: Job) -> JobListItem:
     """JobモデルをJobListItemに変換"""
-    # タグをJSON解析
-    tags = []
-    if job.tags:
-        try:
-            tags = json.loads(job.tags)
-        except:
-            pass
+    tags = list(to_str_tuple(job.tags))
 
     # 給与情報を文字列化
     salary = job.salary_text or ""
@@ -45,7 +44,7 @@ def job_to_list_item(job: Job) -> JobListItem:
         employmentType=job.employment_type.value,
         remote=job.remote,
         tags=tags,
-        description=job.description,
+        description=job.description_summary(),
         postedDate=job.posted_date.isoformat() if job.posted_date else None,
         featured=job.featured,
     )
@@ -53,13 +52,7 @@ def job_to_list_item(job: Job) -> JobListItem:
 
 def job_to_detail(job: Job) -> JobDetail:
     """JobモデルをJobDetailに変換"""
-    # タグをJSON解析
-    tags = []
-    if job.tags:
-        try:
-            tags = json.loads(job.tags)
-        except:
-            pass
+    tags = list(to_str_tuple(job.tags))
 
     # 要件をリスト化
     requirements = []
@@ -95,46 +88,91 @@ def job_to_detail(job: Job) -> JobDetail:
     )
 
 
+async def _paginate_jobs(
+    db: AsyncSession,
+    query,
+    count_key,
+    page: int,
+    per_page: int,
+    cursor: Optional[str],
+    relevance_order: Optional[list] = None,
+) -> JobListResponse:
+    """
+    公開求人のクエリを (posted_date, id) のキーセットでページング
+
+    cursor 指定時は page を無視して続きを取得する。総件数は件数キャッシュから返す。
+    relevance_order（全文検索の関連度順）を指定した場合はページ番号でページングし、カーソルは返さない。
+    求人は一覧カードのカラムのみ読み込む。
+    """
+    total = await get_count_cache().aget_or_compute(
+        "jobs",
+        count_key,
+        lambda: db.scalar(select(func.count()).select_from(query.subquery())),
+    )
+    query = query.options(*job_load_options("card"))
+
+    offset = (page - 1) * per_page
+    if relevance_order is not None:
+        rows = (await db.scalars(query.order_by(*relevance_order).offset(offset).limit(per_page))).all()
+        return JobListResponse(
+            jobs=[job_to_list_item(job) for job in rows],
+            total=total,
+            page=page,
+            perPage=per_page,
+        )
+
+    if cursor:
+        try:
+            query = query.where(keyset_after(Job.posted_date, Job.id, cursor))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="無効なカーソルです"
+            )
+        offset = 0
+
+    # 次ページの有無を判定するため1件多く取得
+    rows = (await db.scalars(
+        query.order_by(*keyset_order(Job.posted_date, Job.id)).offset(offset).limit(per_page + 1)
+    )).all()
+    jobs, cursor_for_next = next_cursor(rows, per_page, "posted_date")
+
+    return JobListResponse(
+        jobs=[job_to_list_item(job) for job in jobs],
+        total=total,
+        page=page,
+        perPage=per_page,
+        nextCursor=cursor_for_next,
+    )
+
+
 @router.get("/", response_model=JobListResponse)
 async def get_jobs(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="前ページの nextCursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     求人一覧を取得
 
     Args:
-        page: ページ番号
+        page: ページ番号（cursor 未指定時のみ使用）
         per_page: 1ページあたりの件数
+        cursor: 続きを取得するカーソル
         db: データベースセッション
 
     Returns:
         求人一覧
     """
     # 公開中の求人のみを取得
-    query = db.query(Job).filter(Job.status == JobStatus.PUBLISHED)
+    query = select(Job).where(Job.status == JobStatus.PUBLISHED)
 
-    # 総件数を取得
-    total = query.count()
-
-    # ページネーション
-    offset = (page - 1) * per_page
-    jobs = query.order_by(Job.posted_date.desc()).offset(offset).limit(per_page).all()
-
-    # レスポンスを作成
-    job_items = [job_to_list_item(job) for job in jobs]
-
-    return JobListResponse(
-        jobs=job_items,
-        total=total,
-        page=page,
-        perPage=per_page,
-    )
+    return await _paginate_jobs(db, query, CountCache.make_key(), page, per_page, cursor)
 
 
 @router.get("/{job_id}", response_model=JobDetail)
-async def get_job(job_id: str, db: Session = Depends(get_db)):
+async def get_job(job_id: str, db: AsyncSession = Depends(get_async_db)):
     """
     求人詳細を取得
 
@@ -145,10 +183,12 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
     Returns:
         求人詳細
     """
-    job = db.query(Job).filter(
-        Job.id == job_id,
-        Job.status == JobStatus.PUBLISHED
-    ).first()
+    job = await db.scalar(
+        select(Job).where(
+            Job.id == job_id,
+            Job.status == JobStatus.PUBLISHED
+        )
+    )
 
     if not job:
         raise HTTPException(
@@ -156,6 +196,8 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
             detail="求人が見つかりません"
         )
 
+    record_job_view(job.id)
+
     return job_to_detail(job)
 
 
@@ -164,31 +206,29 @@ async def search_jobs(
     request: JobSearchRequest,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="前ページの nextCursor"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     求人を検索
 
     Args:
         request: 検索条件
-        page: ページ番号
+        page: ページ番号（cursor 未指定時のみ使用）
         per_page: 1ページあたりの件数
+        cursor: 続きを取得するカーソル
         db: データベースセッション
 
     Returns:
         検索結果
     """
     # クエリを構築
-    query = db.query(Job).filter(Job.status == JobStatus.PUBLISHED)
-
-    # キーワード検索
-    if request.query:
-        search_pattern = f"%{request.query}%"
-        query = query.filter(
-            (Job.title.like(search_pattern)) |
-            (Job.company.like(search_pattern)) |
-            (Job.description.like(search_pattern))
-        )
+    query = select(Job).where(Job.status == JobStatus.PUBLISHED)
+
+    # キーワード検索（全文検索インデックス。使えない場合は LIKE）
+    relevance_order = None
+    if request.query and request.query.strip():
+        query, relevance_order = get_job_search_backend().apply(query, request.query.strip())
 
     # 勤務地フィルター
     if request.location:
@@ -202,23 +242,16 @@ async def search_jobs(
     if request.remote is not None:
         query = query.filter(Job.remote == request.remote)
 
-    # 最低年収フィルター
-    if request.salaryMin:
-        query = query.filter(Job.salary_min >= request.salaryMin)
-
-    # 総件数を取得
-    total = query.count()
-
-    # ページネーション
-    offset = (page - 1) * per_page
-    jobs = query.order_by(Job.posted_date.desc()).offset(offset).limit(per_page).all()
-
-    # レスポンスを作成
-    job_items = [job_to_list_item(job) for job in jobs]
-
-    return JobListResponse(
-        jobs=job_items,
-        total=total,
-        page=page,
-        perPage=per_page,
+    # 最低年収フィルター（円単位の正規化カラムで比較）
+    salary_min_yen = salary_to_yen(request.salaryMin)
+    if salary_min_yen:
+        query = query.filter(Job.salary_min_yen >= salary_min_yen)
+
+    count_key = CountCache.make_key(
+        query=request.query,
+        location=request.location,
+        employment_type=request.employmentType,
+        remote=request.remote,
+        salary_min_yen=salary_min_yen,
     )
+    return await _paginate_jobs(db, query, count_key, page, per_page, cursor, relevance_order)
@@ -19,6 +19,7 @@ from app.schemas.matching import (
 )
 from app.core.dependencies import ConversationServiceDep
 from app.core.exceptions import OpenAIError
+from app.core.threadpool import run_blocking
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -114,7 +115,8 @@ async def analyze_job(
         seeker_profile = request.seeker_profile.model_dump()
         job_data = request.job.model_dump()
 
-        analysis = conversation_service.generate_job_analysis(
+        analysis = await run_blocking(
+            conversation_service.generate_job_analysis,
             seeker_profile=seeker_profile,
             job_data=job_data,
             match_score=request.match_score
@@ -155,7 +157,8 @@ async def career_chat(
             for msg in request.conversation_history
         ]
 
-        reply = conversation_service.chat_about_career(
+        reply = await run_blocking(
+            conversation_service.chat_about_career,
             message=request.message,
             conversation_history=conversation_history,
             seeker_profile=seeker_profile
@@ -199,7 +202,8 @@ async def explain_matching(
             for rec in request.recommendations
         ]
 
-        explanation = conversation_service.generate_matching_explanation(
+        explanation = await run_blocking(
+            conversation_service.generate_matching_explanation,
             seeker_profile=seeker_profile,
             recommendations=recommendations
         )
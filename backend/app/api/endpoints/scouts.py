@@ -3,7 +3,9 @@
 スカウトAPI
 """
 from fastapi import APIRouter, HTTPException, status, Depends, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -18,9 +20,10 @@ from app.schemas.scout import (
 )
 from app.models.scout import Scout, ScoutStatus
 from app.models.user import User, UserRole
-from app.db.session import get_db
-from app.core.dependencies import CurrentUser
+from app.db.session import get_db, get_async_db
+from app.core.dependencies import CurrentUser, AsyncCurrentUser
 from app.core.subscription import verify_subscription_limit
+from app.utils.pagination import keyset_after, keyset_order, next_cursor
 
 router = APIRouter()
 
@@ -76,16 +79,23 @@ def scout_to_detail(scout: Scout, user_role: str, employer: User = None, seeker:
 
 @router.get("/", response_model=ScoutListResponse)
 async def get_scouts(
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    current_user: AsyncCurrentUser,
+    db: AsyncSession = Depends(get_async_db),
     status_filter: Optional[str] = Query(None, alias="status"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="前ページの nextCursor"),
 ):
     """
     スカウト一覧を取得（求職者：受信、企業：送信）
 
+    作成日時の新しい順に、(created_at, id) のキーセットでページングする。
+    送信者・受信者は JOIN で同時に読み込むため、件数によらずクエリ数は一定。
+
     Args:
         current_user: 認証済みユーザー
         status_filter: ステータスフィルター
+        limit: 1ページの件数
+        cursor: 続きを取得するカーソル
         db: データベースセッション
 
     Returns:
@@ -93,34 +103,49 @@ async def get_scouts(
     """
     user_role = current_user.role.value
 
-    # ユーザーロールに応じてクエリを変更
+    # ユーザーロールに応じて条件を変更
     if current_user.role == UserRole.SEEKER:
         # 求職者：受信したスカウト
-        query = db.query(Scout).filter(Scout.seeker_id == current_user.id)
+        conditions = [Scout.seeker_id == current_user.id]
     else:
         # 企業：送信したスカウト
-        query = db.query(Scout).filter(Scout.employer_id == current_user.id)
+        conditions = [Scout.employer_id == current_user.id]
 
     # ステータスフィルター
     if status_filter and status_filter != "all":
         try:
-            query = query.filter(Scout.status == ScoutStatus(status_filter))
+            conditions.append(Scout.status == ScoutStatus(status_filter))
         except ValueError:
             pass
 
-    # スカウトを取得
-    scouts = query.order_by(Scout.created_at.desc()).all()
+    total = await db.scalar(select(func.count()).select_from(Scout).where(*conditions))
+
+    query = (
+        select(Scout)
+        .options(joinedload(Scout.employer), joinedload(Scout.seeker))
+        .where(*conditions)
+    )
+    if cursor:
+        try:
+            query = query.where(keyset_after(Scout.created_at, Scout.id, cursor))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="無効なカーソルです"
+            )
+
+    # 次ページの有無を判定するため1件多く取得
+    rows = (await db.scalars(
+        query.order_by(*keyset_order(Scout.created_at, Scout.id)).limit(limit + 1)
+    )).all()
+    scouts, cursor_for_next = next_cursor(rows, limit, "created_at")
 
-    # ユーザー情報を結合
-    items = []
-    for scout in scouts:
-        employer = db.query(User).filter(User.id == scout.employer_id).first()
-        seeker = db.query(User).filter(User.id == scout.seeker_id).first()
-        items.append(scout_to_item(scout, user_role, employer, seeker))
+    items = [scout_to_item(scout, user_role, scout.employer, scout.seeker) for scout in scouts]
 
     return ScoutListResponse(
         scouts=items,
-        total=len(items),
+        total=total or 0,
+        nextCursor=cursor_for_next,
     )
 
 
@@ -185,8 +210,8 @@ async def create_scout(
 @router.get("/{scout_id}", response_model=ScoutDetail)
 async def get_scout(
     scout_id: str,
-    current_user: CurrentUser,
-    db: Session = Depends(get_db),
+    current_user: AsyncCurrentUser,
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     スカウト詳細を取得
@@ -199,7 +224,11 @@ async def get_scout(
     Returns:
         スカウト詳細
     """
-    scout = db.query(Scout).filter(Scout.id == scout_id).first()
+    scout = await db.scalar(
+        select(Scout)
+        .options(joinedload(Scout.employer), joinedload(Scout.seeker))
+        .where(Scout.id == scout_id)
+    )
 
     if not scout:
         raise HTTPException(
@@ -219,15 +248,15 @@ async def get_scout(
             detail="このスカウトにアクセスする権限がありません"
         )
 
+    # refresh でリレーションが破棄されるため、先に取り出しておく
+    employer, seeker = scout.employer, scout.seeker
+
     # 求職者が閲覧した場合、既読にする
     if current_user.role == UserRole.SEEKER and scout.status == ScoutStatus.NEW:
         scout.status = ScoutStatus.READ
         scout.read_at = datetime.utcnow()
-        db.commit()
-        db.refresh(scout)
-
-    employer = db.query(User).filter(User.id == scout.employer_id).first()
-    seeker = db.query(User).filter(User.id == scout.seeker_id).first()
+        await db.commit()
+        await db.refresh(scout)
 
     return scout_to_detail(scout, current_user.role.value, employer, seeker)
 
@@ -251,7 +280,12 @@ async def update_scout(
     Returns:
         更新後のスカウト
     """
-    scout = db.query(Scout).filter(Scout.id == scout_id).first()
+    scout = (
+        db.query(Scout)
+        .options(joinedload(Scout.employer), joinedload(Scout.seeker))
+        .filter(Scout.id == scout_id)
+        .first()
+    )
 
     if not scout:
         raise HTTPException(
@@ -281,10 +315,9 @@ async def update_scout(
             detail="無効なステータスです"
         )
 
+    employer, seeker = scout.employer, scout.seeker
+
     db.commit()
     db.refresh(scout)
 
-    employer = db.query(User).filter(User.id == scout.employer_id).first()
-    seeker = db.query(User).filter(User.id == scout.seeker_id).first()
-
     return scout_to_detail(scout, current_user.role.value, employer, seeker)
@@ -4,12 +4,12 @@
 """
 from fastapi import APIRouter, HTTPException, status, Depends
 from sqlalchemy.orm import Session
-import json
 
 from app.schemas.user import PreferencesRequest, ProfileUpdateRequest
 from app.schemas.auth import UserResponse
 from app.core.dependencies import CurrentUser
 from app.db.session import get_db
+from app.utils.normalization import salary_to_yen, to_str_tuple
 
 from sqlalchemy import text
 from datetime import datetime
@@ -30,7 +30,7 @@ async def save_preferences(
         current_user.desired_salary_max = str(request.salary)
 
     if request.jobType:
-        current_user.skills = json.dumps(request.jobType, ensure_ascii=False)
+        current_user.skills = request.jobType
 
     if request.desiredLocation:
         current_user.desired_location = request.desiredLocation
@@ -50,6 +50,7 @@ async def save_preferences(
         location_prefecture = request.desiredLocations[0]
 
     salary_min = request.salary  # 単位はDBに合わせる（万円ならそのまま）
+    salary_min_yen = salary_to_yen(salary_min)  # 検索用の円単位
 
     # ✅ UserモデルがUUID(user_id)を持つ可能性に備える
     user_id_for_pref = getattr(current_user, "user_id", None) or str(current_user.id)
@@ -57,13 +58,14 @@ async def save_preferences(
     db.execute(
         text("""
             INSERT INTO user_preferences_profile
-                (user_id, job_title, location_prefecture, salary_min, updated_at)
+                (user_id, job_title, location_prefecture, salary_min, salary_min_yen, updated_at)
             VALUES
-                (:user_id, :job_title, :location_prefecture, :salary_min, :updated_at)
+                (:user_id, :job_title, :location_prefecture, :salary_min, :salary_min_yen, :updated_at)
             ON CONFLICT (user_id) DO UPDATE SET
                 job_title = EXCLUDED.job_title,
                 location_prefecture = EXCLUDED.location_prefecture,
                 salary_min = EXCLUDED.salary_min,
+                salary_min_yen = EXCLUDED.salary_min_yen,
                 updated_at = EXCLUDED.updated_at
         """),
         {
@@ -71,6 +73,7 @@ async def save_preferences(
             "job_title": job_title,
             "location_prefecture": location_prefecture,
             "salary_min": salary_min,
+            "salary_min_yen": salary_min_yen,
             "updated_at": datetime.utcnow(),
         }
     )
@@ -78,13 +81,7 @@ async def save_preferences(
     db.commit()
     db.refresh(current_user)
 
-    # スキルをJSON解析
-    skills = None
-    if current_user.skills:
-        try:
-            skills = json.loads(current_user.skills)
-        except:
-            pass
+    skills = list(to_str_tuple(current_user.skills)) if current_user.skills else None
 
     return UserResponse(
         id=current_user.id,
@@ -131,7 +128,7 @@ async def update_profile(
     # 求職者用フィールド
     if current_user.role.value == "seeker":
         if request.skills is not None:
-            current_user.skills = json.dumps(request.skills)
+            current_user.skills = request.skills
         if request.experienceYears is not None:
             current_user.experience_years = request.experienceYears
         if request.desiredSalaryMin is not None:
@@ -192,13 +189,7 @@ async def update_profile(
     db.commit()
     db.refresh(current_user)
 
-    # スキルをJSON解析
-    skills = None
-    if current_user.skills:
-        try:
-            skills = json.loads(current_user.skills)
-        except:
-            pass
+    skills = list(to_str_tuple(current_user.skills)) if current_user.skills else None
 
     return UserResponse(
         id=current_user.id,
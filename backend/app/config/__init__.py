@@ -5,7 +5,12 @@ Configモジュール
 from app.config.database import (
     DatabaseConfig,
     db_config,
+    ConnectionPool,
+    get_pool,
+    close_pool,
     get_db_conn,
+    db_connection,
+    PreparedStatement,
     get_db_cursor,
     get_db,
     test_connection
@@ -14,7 +19,12 @@ from app.config.database import (
 __all__ = [
     "DatabaseConfig",
     "db_config",
+    "ConnectionPool",
+    "get_pool",
+    "close_pool",
     "get_db_conn",
+    "db_connection",
+    "PreparedStatement",
     "get_db_cursor",
     "get_db",
     "test_connection"
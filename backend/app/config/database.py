@@ -4,12 +4,20 @@ Iizumiロジック移植用
 """
 
 import os
-from typing import Generator, Optional
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 import psycopg2
+from psycopg2 import extensions
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError
 import logging
 
+from app.core.query_log import instrumentation_active, record_statement
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,21 +64,424 @@ class DatabaseConfig:
 db_config = DatabaseConfig()
 
 
+class TimedCursorMixin:
+    """execute / executemany の実行時間をクエリログ（と N+1 検知）に記録するカーソル"""
+
+    def execute(self, query, vars=None):
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            self._record(query, started, vars)
+
+    def executemany(self, query, vars_list):
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            self._record(query, started)
+
+    def _record(self, query, started: float, params=None) -> None:
+        if not isinstance(query, (str, bytes)):
+            # psycopg2.sql.Composed など
+            query = query.as_string(self.connection)
+        if isinstance(query, bytes):
+            query = query.decode("utf-8", "replace")
+        record_statement(
+            query, time.perf_counter() - started, self.rowcount,
+            source="psycopg2", params=params, dialect="postgresql",
+        )
+
+
+# カーソルクラス → 計測付きのサブクラス
+_timed_cursor_classes: Dict[type, type] = {}
+
+
+def timed_cursor_class(cursor_class: type) -> type:
+    """カーソルクラスに計測を付けたサブクラス（RealDictCursor なども同じ方法で計測する）"""
+    timed = _timed_cursor_classes.get(cursor_class)
+    if timed is None:
+        timed = type(f"Timed{cursor_class.__name__}", (TimedCursorMixin, cursor_class), {})
+        _timed_cursor_classes[cursor_class] = timed
+    return timed
+
+
+class PooledConnection(extensions.connection):
+    """
+    プールから貸し出される接続（close() でプールに返却される）
+
+    クエリログか N+1 検知が有効な場合、cursor() はカーソルファクトリに計測を付けたものを返す
+    """
+
+    _pool: Optional["ConnectionPool"] = None
+    _checked_out: bool = False
+    # この接続で PREPARE 済みの文の名前（PreparedStatement）
+    _prepared: Optional[Set[str]] = None
+
+    def cursor(self, *args, **kwargs):
+        if instrumentation_active():
+            cursor_class = kwargs.get("cursor_factory") or self.cursor_factory or extensions.cursor
+            kwargs["cursor_factory"] = timed_cursor_class(cursor_class)
+        return super().cursor(*args, **kwargs)
+
+    def close(self):
+        pool = self._pool
+        if pool is None:
+            super().close()
+        elif self._checked_out:
+            pool.putconn(self)
+
+    def __del__(self):
+        # close() されずに破棄された接続の枠をプールに戻す
+        pool = self._pool
+        if pool is not None and self._checked_out:
+            self._checked_out = False
+            pool._release_lost()
+
+    def discard(self):
+        """プールに戻さず実際に切断する"""
+        self._pool = None
+        self._checked_out = False
+        if not self.closed:
+            super().close()
+
+
+class ConnectionPool:
+    """
+    スレッドセーフな psycopg2 接続プール
+
+    - 最大 max_size 本まで接続を作成し、埋まっている場合は timeout 秒まで返却を待つ
+    - min_size 本を超えるアイドル接続は max_idle 秒使われなければ切断する
+    - check_interval 秒以上アイドルだった接続は貸し出し前に SELECT 1 で疎通確認する
+    - 貸し出し中の接続の close() は切断ではなくプールへの返却になる
+    """
+
+    def __init__(
+        self,
+        connect_params: Callable[[], Dict[str, Any]],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        check_interval: float = 30.0,
+        max_idle: float = 300.0,
+    ):
+        self._connect_params = connect_params
+        self.min_size = max(min_size, 0)
+        self.max_size = max(max_size, 1, self.min_size)
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.max_idle = max_idle
+
+        self._cond = threading.Condition()
+        self._idle: List[Tuple[PooledConnection, float]] = []
+        self._size = 0
+        self._checked_out = 0
+        self._waiters = 0
+        self._closed = False
+
+        # メトリクス
+        self._checkouts = 0
+        self._wait_count = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._timeouts = 0
+        self._health_check_failures = 0
+        self._lost = 0
+
+    def _connect(self) -> PooledConnection:
+        conn = psycopg2.connect(**self._connect_params(), connection_factory=PooledConnection)
+        conn._pool = self
+        conn._prepared = set()
+        return conn
+
+    def _is_healthy(self, conn: PooledConnection, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.check_interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def getconn(self) -> PooledConnection:
+        """
+        接続を借りる
+
+        Raises:
+            PoolError: プールが閉じている、または timeout 秒以内に接続を確保できない場合
+        """
+        started = time.monotonic()
+        waited = False
+        conn: Optional[PooledConnection] = None
+        last_used = 0.0
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolError("connection pool is closed")
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolError(
+                        f"connection pool exhausted (max_size={self.max_size}, timeout={self.timeout}s)"
+                    )
+                self._waiters += 1
+                waited = True
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiters -= 1
+
+            self._checked_out += 1
+            self._checkouts += 1
+            if waited:
+                wait_time = time.monotonic() - started
+                self._wait_count += 1
+                self._wait_time_total += wait_time
+                self._wait_time_max = max(self._wait_time_max, wait_time)
+
+        # 接続の作成・疎通確認はロックの外で行う
+        try:
+            if conn is not None and not self._is_healthy(conn, last_used):
+                logger.warning("プール内の接続が切断されていたため再接続します")
+                with self._cond:
+                    self._health_check_failures += 1
+                conn.discard()
+                conn = None
+            if conn is None:
+                conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._checked_out -= 1
+                self._cond.notify()
+            raise
+
+        conn._checked_out = True
+        return conn
+
+    def putconn(self, conn: PooledConnection) -> None:
+        """接続をプールに返却（未完了のトランザクションはロールバックする）"""
+        if not conn._checked_out:
+            return
+        conn._checked_out = False
+
+        reusable = not conn.closed and not self._closed
+        if reusable:
+            try:
+                status = conn.get_transaction_status()
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    reusable = False
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                reusable = False
+
+        expired: List[PooledConnection] = []
+        with self._cond:
+            self._checked_out -= 1
+            now = time.monotonic()
+            if reusable:
+                self._idle.append((conn, now))
+            else:
+                self._size -= 1
+
+            # min_size を超える長時間アイドルの接続を間引く（古い順に先頭にある）
+            while len(self._idle) > self.min_size and now - self._idle[0][1] > self.max_idle:
+                expired.append(self._idle.pop(0)[0])
+                self._size -= 1
+            self._cond.notify()
+
+        if not reusable:
+            conn.discard()
+        for idle_conn in expired:
+            idle_conn.discard()
+
+    def _release_lost(self) -> None:
+        """close() されないまま破棄された接続の分を差し引く"""
+        with self._cond:
+            self._checked_out -= 1
+            self._size -= 1
+            self._lost += 1
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """with 文で接続を借り、抜けるときに返却する"""
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def close(self) -> None:
+        """アイドル接続をすべて切断し、以降の貸し出しを止める"""
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            conn.discard()
+
+    def stats(self) -> Dict[str, Any]:
+        """プールのメトリクス"""
+        with self._cond:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "checked_out": self._checked_out,
+                "waiters": self._waiters,
+                "checkouts": self._checkouts,
+                "wait_count": self._wait_count,
+                "wait_time_total_ms": round(self._wait_time_total * 1000, 2),
+                "wait_time_max_ms": round(self._wait_time_max * 1000, 2),
+                "timeouts": self._timeouts,
+                "health_check_failures": self._health_check_failures,
+                "lost": self._lost,
+            }
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """プロセス共通の接続プールを取得（初回呼び出し時に作成）"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    db_config.get_connection_params,
+                    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+                    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                    check_interval=float(os.getenv("DB_POOL_CHECK_INTERVAL", "30")),
+                    max_idle=float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+                )
+    return _pool
+
+
+def close_pool() -> None:
+    """接続プールを閉じる（シャットダウン時）"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
 def get_db_conn():
     """
-    データベース接続を取得
+    データベース接続をプールから取得
+
+    返却された接続の close() はプールへの返却になるため、
+    既存の conn.close() を呼ぶコードはそのまま使える。
 
     Returns:
-        psycopg2.connection: データベース接続オブジェクト
+        PooledConnection: データベース接続オブジェクト
     """
     try:
-        conn = psycopg2.connect(**db_config.get_connection_params())
-        return conn
+        return get_pool().getconn()
     except Exception as e:
         logger.error(f"データベース接続エラー: {e}")
         raise
 
 
+@contextmanager
+def db_connection() -> Iterator[PooledConnection]:
+    """
+    with 文用のデータベース接続（ブロックを抜けるとプールに返却）
+
+    使用例:
+        with db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+    """
+    conn = get_db_conn()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+# pgbouncer の transaction モードなど、セッションをまたいで PREPARE を保持できない場合は 0 にする
+PREPARED_STATEMENTS_ENABLED = os.getenv("DB_PREPARED_STATEMENTS", "1").lower() not in ("0", "false", "no")
+
+_PARAM_RE = re.compile(r"%\((\w+)\)s|%s")
+
+
+class PreparedStatement:
+    """
+    接続ごとにサーバー側で一度だけ PREPARE し、以降は EXECUTE で実行する SQL
+
+    psycopg2 形式（%s / %(name)s）の SQL を $1.. に置き換えて PREPARE する。
+    同じ名前のパラメータは同じ番号になり、param_types は初出順に並べる
+    （省略するとサーバーが比較・代入先のカラムから型を推論する。IS NULL だけで使うパラメータなどは指定が必要）。
+    PREPARE は接続（セッション）単位のため、プールの接続ごとに準備済みの名前を覚えておく
+    （プール外の接続や DB_PREPARED_STATEMENTS=0 の場合は通常の execute で実行する）
+
+    使用例:
+        GET_NAME = PreparedStatement("users_get_name", "SELECT name FROM users WHERE id = %s")
+        with db_connection() as conn, conn.cursor() as cur:
+            GET_NAME.execute(cur, (user_id,))
+    """
+
+    def __init__(self, name: str, sql: str, param_types: Optional[Sequence[str]] = None):
+        self.name = name
+        self.sql = sql
+        self.param_types = tuple(param_types or ())
+        self._names: List[Optional[str]] = []
+
+        def to_positional(match):
+            key = match.group(1)
+            if key is not None and key in self._names:
+                return f"${self._names.index(key) + 1}"
+            self._names.append(key)
+            return f"${len(self._names)}"
+
+        body = _PARAM_RE.sub(to_positional, sql).replace("%%", "%")
+        if self.param_types and len(self._names) != len(self.param_types):
+            raise ValueError(
+                f"{name}: {len(self._names)} parameters but {len(self.param_types)} types"
+            )
+        types = f" ({', '.join(self.param_types)})" if self.param_types else ""
+        self.prepare_sql = f"PREPARE {name}{types} AS {body}"
+        self.execute_sql = f"EXECUTE {name}" + (f" ({', '.join(['%s'] * len(self._names))})" if self._names else "")
+
+    def _args(self, params: Any) -> List[Any]:
+        if isinstance(params, dict):
+            return [params[name] for name in self._names]
+        return list(params or ())
+
+    def execute(self, cur, params: Any = None) -> None:
+        """カーソルで実行（接続で未準備なら先に PREPARE する）"""
+        prepared = getattr(cur.connection, "_prepared", None)
+        if not PREPARED_STATEMENTS_ENABLED or prepared is None:
+            cur.execute(self.sql, params)
+            return
+        if self.name not in prepared:
+            # PREPARE はトランザクションのロールバックでは取り消されない
+            cur.execute(self.prepare_sql)
+            prepared.add(self.name)
+        cur.execute(self.execute_sql, self._args(params))
+
+
 def get_db_cursor(conn, use_dict_cursor: bool = False):
     """
     データベースカーソルを取得
@@ -14,6 +14,7 @@ from app.core.exceptions import (
     StorageError,
     ValidationError,
     NotFoundError,
+    NPlusOneQueryError,
 )
 
 __all__ = [
@@ -30,4 +31,5 @@ __all__ = [
     "StorageError",
     "ValidationError",
     "NotFoundError",
+    "NPlusOneQueryError",
 ]
@@ -65,6 +65,32 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # イベントループ監視・同期処理オフロード設定
+    loop_monitor_enabled: bool = True
+    loop_block_threshold_ms: int = 100
+    loop_monitor_interval_ms: int = 20
+    blocking_offload_enabled: bool = True
+    blocking_pool_size: int = 8
+
+    # 一覧・検索の総件数キャッシュ（秒）
+    count_cache_ttl_seconds: float = 30.0
+
+    # 閲覧数などのカウンターをまとめて反映する間隔（秒）と、即時反映する未反映行数
+    counter_flush_interval_seconds: float = 5.0
+    counter_flush_max_pending: int = 10000
+
+    # SQL の実行時間の計測（スロークエリとみなす時間(ms)、集計するフィンガープリント数、保持するスロークエリ件数）
+    query_log_enabled: bool = True
+    slow_query_threshold_ms: int = 200
+    query_log_max_fingerprints: int = 2000
+    query_log_slow_samples: int = 100
+    # 設定すると終了時にフィンガープリントごとのサンプル（パラメータ込み）を追記する（index_advisor 用、ローカル専用）
+    query_capture_path: str = ""
+
+    # N+1 クエリの検知（off / log / raise）と、1リクエストで同じ文を許容する回数
+    n_plus_one_mode: str = "off"
+    n_plus_one_threshold: int = 10
+
     # マッチング設定
     default_top_k: int = 10
     matching_threshold: float = 0.5
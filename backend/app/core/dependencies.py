@@ -7,10 +7,12 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings, get_settings
-from app.db.session import get_db
+from app.db.session import get_db, get_async_db
 from app.models.user import User
 from app.services.openai_service import OpenAIService
 from app.services.conversation_storage import ConversationStorage
@@ -103,6 +105,41 @@ def get_conversation_service_dependency(
 
 
 # 認証
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="認証情報を確認できませんでした",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _decode_user_id(credentials: HTTPAuthorizationCredentials, settings: Settings) -> str:
+    """JWTトークンからユーザーIDを取り出す"""
+    try:
+        payload = jwt.decode(credentials.credentials, settings.secret_key, algorithms=[settings.algorithm])
+        user_id: str = payload.get("sub")
+    except JWTError:
+        raise _credentials_exception()
+
+    if user_id is None:
+        raise _credentials_exception()
+    return user_id
+
+
+def _ensure_active(user: User | None) -> User:
+    """ユーザーが存在し有効であることを確認"""
+    if user is None:
+        raise _credentials_exception()
+
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="このアカウントは無効化されています"
+        )
+
+    return user
+
+
 def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[Session, Depends(get_db)],
@@ -122,33 +159,24 @@ def get_current_user(
     Raises:
         HTTPException: トークンが無効またはユーザーが見つからない場合
     """
-    token = credentials.credentials
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="認証情報を確認できませんでした",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
+    user_id = _decode_user_id(credentials, settings)
     user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
-        raise credentials_exception
+    return _ensure_active(user)
 
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="このアカウントは無効化されています"
-        )
 
-    return user
+async def get_current_user_async(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    settings: Annotated[Settings, Depends(get_settings_dependency)]
+) -> User:
+    """
+    JWTトークンから現在のユーザーを取得（非同期セッション版）
+
+    get_async_db を使うルートで利用し、同じリクエスト内のセッションを共有する
+    """
+    user_id = _decode_user_id(credentials, settings)
+    user = await db.scalar(select(User).where(User.id == user_id))
+    return _ensure_active(user)
 
 
 # 型ヒント用のエイリアス
@@ -161,12 +189,16 @@ VectorSearchServiceDep = Annotated[VectorSearchService, Depends(get_vector_searc
 # MatchingServiceDep = Annotated[MatchingService, Depends(get_matching_service)]
 ConversationServiceDep = Annotated[ConversationService, Depends(get_conversation_service_dependency)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
+AsyncCurrentUser = Annotated[User, Depends(get_current_user_async)]
+AsyncDB = Annotated[AsyncSession, Depends(get_async_db)]
 
 # Re-export for convenience
 __all__ = [
     "get_settings_dependency",
     "get_db",
+    "get_async_db",
     "get_current_user",
+    "get_current_user_async",
     "get_openai_service",
     "get_conversation_storage",
     "get_vector_search_service",
@@ -181,4 +213,6 @@ __all__ = [
     # "MatchingServiceDep",     # 現在未使用
     "ConversationServiceDep",
     "CurrentUser",
+    "AsyncCurrentUser",
+    "AsyncDB",
 ]
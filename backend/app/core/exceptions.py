@@ -66,3 +66,10 @@ class NotFoundError(JobMatchingException):
 
     def __init__(self, message: str, details: Optional[Any] = None):
         super().__init__(message, status_code=404, details=details)
+
+
+class NPlusOneQueryError(JobMatchingException):
+    """1リクエスト内で同じSQLが閾値を超えて繰り返し実行された（N+1クエリ）"""
+
+    def __init__(self, message: str, details: Optional[Any] = None):
+        super().__init__(message, status_code=500, details=details)
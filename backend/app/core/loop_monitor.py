@@ -0,0 +1,231 @@
+# app/core/loop_monitor.py
+"""
+イベントループのブロッキング検知
+async ハンドラ内の同期処理（OpenAI呼び出し、bcrypt、同期DBアクセスなど）が
+イベントループを止めた時間を計測し、閾値を超えたルートをスタックサンプル付きで記録する
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class RouteBlockingStats:
+    """ルートごとのブロッキング集計"""
+
+    def __init__(self, route: str):
+        self.route = route
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_stack: List[str] = []
+
+    def record(self, blocked_ms: float, stack: List[str]) -> None:
+        self.count += 1
+        self.total_ms += blocked_ms
+        if blocked_ms >= self.max_ms:
+            self.max_ms = blocked_ms
+            self.last_stack = stack
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "route": self.route,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+            "stack": self.last_stack,
+        }
+
+
+class EventLoopMonitor:
+    """
+    イベントループの遅延（lag）とブロッキングを監視する
+
+    - ループ上のハートビートタスクが interval ごとに時刻を更新し、予定より遅れた分を lag として集計
+    - 別スレッドのウォッチドッグがハートビートの停止を検知し、threshold を超えたら
+      ループスレッドのスタックを採取して、実行中のリクエストのルートに記録する
+    """
+
+    def __init__(self, threshold_ms: int = 100, interval_ms: int = 20, stack_depth: int = 25):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.stack_depth = stack_depth
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        # 実行中リクエスト: id(task) -> ASGI scope
+        self._active: Dict[int, Dict[str, Any]] = {}
+        self._routes: Dict[str, RouteBlockingStats] = {}
+
+        self._lag_samples = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """実行中のイベントループで監視を開始（ループ上から呼ぶ）"""
+        if self.started:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._heartbeat_task = self._loop.create_task(self._tick())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+        logger.info(
+            f"Event loop monitor started (threshold={self.threshold * 1000:.0f}ms, "
+            f"interval={self.interval * 1000:.0f}ms)"
+        )
+
+    def stop(self) -> None:
+        """監視を停止"""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        self._loop = None
+
+    def track(self, scope: Dict[str, Any]) -> int:
+        """現在のタスクで処理中のリクエストを登録"""
+        key = id(asyncio.current_task())
+        self._active[key] = scope
+        return key
+
+    def untrack(self, key: int) -> None:
+        self._active.pop(key, None)
+
+    async def _tick(self) -> None:
+        while not self._stop.is_set():
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - expected, 0.0)
+            self._heartbeat = now
+
+            with self._lock:
+                self._lag_samples += 1
+                self._lag_total += lag
+                self._lag_max = max(self._lag_max, lag)
+
+    def _watch(self) -> None:
+        block_heartbeat: Optional[float] = None
+        block_route = ""
+        block_stack: List[str] = []
+
+        while not self._stop.wait(self.interval):
+            heartbeat = self._heartbeat
+
+            # 進行中のブロックが終わった（ハートビートが進んだ）
+            if block_heartbeat is not None and heartbeat != block_heartbeat:
+                blocked_ms = max(heartbeat - block_heartbeat - self.interval, 0.0) * 1000
+                self._record(block_route, blocked_ms, block_stack)
+                block_heartbeat = None
+
+            stalled = time.monotonic() - heartbeat - self.interval
+            if block_heartbeat is None and stalled >= self.threshold:
+                block_heartbeat = heartbeat
+                block_route = self._current_route()
+                block_stack = self._sample_stack()
+
+    def _current_route(self) -> str:
+        """ループ上で実行中のタスクが処理しているルート"""
+        loop = self._loop
+        task = asyncio.current_task(loop) if loop is not None else None
+        scope = self._active.get(id(task)) if task is not None else None
+        if scope is None:
+            return "(no request)"
+
+        route = scope.get("route")
+        path = getattr(route, "path", None) or scope.get("path", "")
+        return f"{scope.get('method', '')} {path}".strip()
+
+    def _sample_stack(self) -> List[str]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return []
+        return [line.rstrip() for line in traceback.format_stack(frame)[-self.stack_depth:]]
+
+    def _record(self, route: str, blocked_ms: float, stack: List[str]) -> None:
+        with self._lock:
+            stats = self._routes.get(route)
+            if stats is None:
+                stats = self._routes[route] = RouteBlockingStats(route)
+            stats.record(blocked_ms, stack)
+
+        logger.warning(
+            f"Event loop blocked for {blocked_ms:.0f}ms in {route}\n" + "\n".join(stack[-8:])
+        )
+
+    def stats(self, top_n: int = 20) -> Dict[str, Any]:
+        """ループ遅延とブロッキングしたルートの集計（ブロック時間の合計順）"""
+        with self._lock:
+            routes = sorted(self._routes.values(), key=lambda s: s.total_ms, reverse=True)
+            return {
+                "threshold_ms": self.threshold * 1000,
+                "lag": {
+                    "samples": self._lag_samples,
+                    "avg_ms": round(self._lag_total / self._lag_samples * 1000, 2) if self._lag_samples else 0.0,
+                    "max_ms": round(self._lag_max * 1000, 2),
+                },
+                "routes": [s.to_dict() for s in routes[:top_n]],
+            }
+
+
+class LoopBlockingMiddleware:
+    """
+    リクエストをイベントループ監視に登録するASGIミドルウェア
+
+    ルーティング後の scope（FastAPIが route を設定する）を保持するため、
+    ブロッキングはパスパラメータを含まないルートのテンプレート単位で集計される
+    """
+
+    def __init__(self, app, monitor: EventLoopMonitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.monitor.started:
+            self.monitor.start()
+
+        key = self.monitor.track(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.untrack(key)
+
+
+# シングルトンインスタンス
+_loop_monitor: Optional[EventLoopMonitor] = None
+
+
+def get_loop_monitor() -> EventLoopMonitor:
+    """EventLoopMonitorのシングルトンインスタンスを取得"""
+    global _loop_monitor
+    if _loop_monitor is None:
+        settings = get_settings()
+        _loop_monitor = EventLoopMonitor(
+            threshold_ms=settings.loop_block_threshold_ms,
+            interval_ms=settings.loop_monitor_interval_ms,
+        )
+    return _loop_monitor
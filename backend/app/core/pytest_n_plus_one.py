@@ -0,0 +1,39 @@
+# app/core/pytest_n_plus_one.py
+"""
+N+1 クエリ検知の pytest プラグイン
+
+conftest.py に次の1行を書くと n_plus_one フィクスチャが使える:
+    pytest_plugins = ["app.core.pytest_n_plus_one"]
+
+フィクスチャを使ったテストでは、テスト本体から直接実行した SQL と、
+TestClient 経由のリクエスト（NPlusOneMiddleware）で実行した SQL の両方を数える。
+同じ文の繰り返しはテスト本体・リクエストごとに判定し、閾値を超えたら
+NPlusOneQueryError でテストを失敗させる（total は両方の合計、requests は各リクエストの report()）
+
+使用例:
+    @pytest.mark.max_query_repeats(3)
+    def test_employer_applications(client, n_plus_one):
+        client.get("/api/applications/employer/...")
+        assert n_plus_one.total <= 10
+"""
+import pytest
+
+from app.core.query_counter import QueryCounter, detection_settings, override_detection, track_queries
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "max_query_repeats(n): n_plus_one フィクスチャで同じSQLを許容する回数（既定は n_plus_one_threshold）",
+    )
+
+
+@pytest.fixture
+def n_plus_one(request) -> QueryCounter:
+    """テスト中の SQL を数え、N+1 があればテストを失敗させる"""
+    marker = request.node.get_closest_marker("max_query_repeats")
+    threshold = marker.args[0] if marker else detection_settings()[1]
+
+    with track_queries(threshold=threshold, mode="raise", label=request.node.nodeid) as counter:
+        with override_detection("raise", threshold, collector=counter):
+            yield counter
@@ -0,0 +1,230 @@
+# app/core/query_counter.py
+"""
+N+1 クエリの検知
+1リクエスト（またはテスト1件）の間に実行した SQL をフィンガープリントごとに数え、
+同じ文が閾値を超えて繰り返されたらログに出す（log）か NPlusOneQueryError を送出する（raise）
+"""
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.exceptions import NPlusOneQueryError
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "log", "raise")
+
+_current_counter: contextvars.ContextVar[Optional["QueryCounter"]] = contextvars.ContextVar(
+    "query_counter", default=None
+)
+
+# テストなどで設定を一時的に上書きする (mode, threshold)
+_override: Optional[Tuple[str, int]] = None
+# override_detection 中にリクエストの計測結果を取り込む QueryCounter
+# （TestClient はアプリを別スレッドで動かすため、contextvar ではテスト側の QueryCounter が見えない）
+_collector: Optional["QueryCounter"] = None
+
+
+class QueryCounter:
+    """
+    フィンガープリントごとの実行回数
+
+    mode が "raise" の場合は閾値を超えた時点で例外を送出し、check() でも改めて確認する
+    （呼び出し側の except Exception で握りつぶされても、リクエスト・テストの終了時に検出できる）
+    """
+
+    def __init__(
+        self,
+        threshold: int = 10,
+        mode: str = "log",
+        label: str = "",
+        scope: Optional[Dict[str, Any]] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {', '.join(MODES)}")
+        self.threshold = threshold
+        self.mode = mode
+        self._label = label
+        # リクエストの場合はルーティング後の scope からルートを取る
+        self._scope = scope
+        self.total = 0
+        self._counts: Dict[str, int] = {}
+        self._statements: Dict[str, str] = {}
+        # merge() で取り込んだリクエストの report()
+        self.requests: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def label(self) -> str:
+        if self._scope is not None:
+            return route_label(self._scope)
+        return self._label
+
+    def add(self, fingerprint_id: str, normalized: str) -> None:
+        """SQL の実行を1回数える"""
+        with self._lock:
+            self.total += 1
+            count = self._counts.get(fingerprint_id, 0) + 1
+            self._counts[fingerprint_id] = count
+            if count == 1:
+                self._statements[fingerprint_id] = normalized
+
+        if count == self.threshold + 1 and self.mode == "raise":
+            raise NPlusOneQueryError(self._message(self.repeated()), details=self.report())
+
+    def count(self, fingerprint_id: str) -> int:
+        with self._lock:
+            return self._counts.get(fingerprint_id, 0)
+
+    def merge(self, child: "QueryCounter") -> None:
+        """
+        リクエストの計測結果を取り込む
+
+        total には加算するが、繰り返しの判定はリクエスト単位のまま
+        （同じ API を何度も呼ぶテストを N+1 と誤検知しないように）
+        """
+        report = child.report()
+        with self._lock:
+            self.total += report["queries"]
+            self.requests.append(report)
+
+    def repeated(self) -> List[Dict[str, Any]]:
+        """閾値を超えて実行されたフィンガープリント（取り込んだリクエストの分を含む、回数の多い順）"""
+        with self._lock:
+            items = [
+                {"fingerprint": fp, "count": count, "statement": self._statements[fp]}
+                for fp, count in self._counts.items()
+                if count > self.threshold
+            ]
+            for request in self.requests:
+                items.extend(dict(item, label=request["label"]) for item in request["repeated"])
+        items.sort(key=lambda item: item["count"], reverse=True)
+        return items
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            total, distinct = self.total, len(self._counts)
+        return {
+            "label": self.label,
+            "queries": total,
+            "distinct": distinct,
+            "threshold": self.threshold,
+            "requests": len(self.requests),
+            "repeated": self.repeated(),
+        }
+
+    def check(self) -> None:
+        """閾値を超えた文があればログに出す、または例外を送出する"""
+        repeated = self.repeated()
+        if not repeated or self.mode == "off":
+            return
+        message = self._message(repeated)
+        if self.mode == "raise":
+            raise NPlusOneQueryError(message, details=self.report())
+        logger.warning(message)
+
+    def _message(self, repeated: List[Dict[str, Any]]) -> str:
+        lines = [
+            f"N+1 queries in {self.label or '(unknown)'}: "
+            f"{len(repeated)} statement(s) ran more than {self.threshold} times ({self.total} queries total)"
+        ]
+        for item in repeated[:5]:
+            where = f" ({item['label']})" if "label" in item else ""
+            lines.append(f"  {item['count']}x [{item['fingerprint']}]{where} {item['statement'][:300]}")
+        return "\n".join(lines)
+
+
+def current_counter() -> Optional[QueryCounter]:
+    """実行中のリクエスト・テストの QueryCounter（計測していない場合は None）"""
+    return _current_counter.get()
+
+
+def detection_settings() -> Tuple[str, int]:
+    """現在の (mode, threshold)"""
+    if _override is not None:
+        return _override
+    settings = get_settings()
+    return settings.n_plus_one_mode, settings.n_plus_one_threshold
+
+
+@contextmanager
+def override_detection(
+    mode: str = "raise",
+    threshold: Optional[int] = None,
+    collector: Optional[QueryCounter] = None,
+) -> Iterator[None]:
+    """
+    リクエストごとの検知の設定を一時的に上書き（テスト用）
+
+    collector を渡すと、各リクエストの計測結果をそこへ取り込む（QueryCounter.merge）
+    """
+    global _override, _collector
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}")
+    previous = _override, _collector
+    _override = (mode, threshold if threshold is not None else detection_settings()[1])
+    _collector = collector
+    try:
+        yield
+    finally:
+        _override, _collector = previous
+
+
+@contextmanager
+def track_queries(threshold: Optional[int] = None, mode: str = "raise", label: str = "") -> Iterator[QueryCounter]:
+    """
+    ブロック内で実行した SQL を数え、抜けるときに N+1 を確認する
+
+    使用例:
+        with track_queries(threshold=3) as counter:
+            service.list_applications(employer_id)
+        assert counter.total <= 5
+    """
+    if threshold is None:
+        threshold = detection_settings()[1]
+    counter = QueryCounter(threshold=threshold, mode=mode, label=label)
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+    counter.check()
+
+
+def route_label(scope: Dict[str, Any]) -> str:
+    """ASGI scope のルート（ルーティング後はパスパラメータを含まないテンプレート）"""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+class NPlusOneMiddleware:
+    """
+    リクエストごとに SQL を数えるASGIミドルウェア
+
+    n_plus_one_mode が "off" の間は何もしない（override_detection でテスト中だけ有効にできる）
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        mode, threshold = detection_settings()
+        if scope["type"] != "http" or mode == "off":
+            await self.app(scope, receive, send)
+            return
+
+        # 外側で計測中（track_queries・テストの n_plus_one フィクスチャ）なら結果を取り込ませる
+        parent = _current_counter.get() or _collector
+        counter = QueryCounter(threshold=threshold, mode=mode, scope=scope)
+        token = _current_counter.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_counter.reset(token)
+            if parent is not None:
+                parent.merge(counter)
+        counter.check()
@@ -0,0 +1,381 @@
+# app/core/query_log.py
+"""
+SQL の実行時間の計測とスロークエリログ
+SQLAlchemy エンジン（同期・非同期）のイベントと psycopg2 接続プールのカーソルから
+実行時間・取得行数・呼び出し元のルートを記録し、リテラルを除いた正規化文（フィンガープリント）ごとに集計する
+（N+1 検知の計測中は app.core.query_counter にも渡す）
+
+query_capture_path を設定すると、フィンガープリントごとに最も遅かった実行の SQL とパラメータを
+終了時に JSON Lines で追記する（scripts/index_advisor.py で再実行してインデックスを検証する）
+"""
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.query_counter import current_counter, route_label
+
+logger = logging.getLogger(__name__)
+
+# 実行中のリクエストの ASGI scope（ルーティング後に scope["route"] が設定される）
+_current_scope: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "query_log_scope", default=None
+)
+
+# 正規化のパターン（適用順）
+_COMMENT_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER_RE = re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+")
+_NUMBER_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.I)
+_IN_LIST_RE = re.compile(r"\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_VALUES_RE = re.compile(r"\bvalues\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.I)
+_SPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_statement(statement: str) -> str:
+    """
+    SQL をフィンガープリント用に正規化
+
+    コメントを除き、文字列・数値リテラルとバインドパラメータを ? に置き換え、
+    IN (?, ?, ...) と複数行の VALUES を1つにまとめて空白を詰め、小文字にする
+    """
+    text = _COMMENT_RE.sub(" ", statement)
+    text = _STRING_RE.sub("?", text)
+    text = _PLACEHOLDER_RE.sub("?", text)
+    text = _NUMBER_RE.sub("?", text)
+    text = _SPACE_RE.sub(" ", text).strip().lower()
+    text = _IN_LIST_RE.sub("in (?+)", text)
+    text = _VALUES_RE.sub(r"values \1, ...", text)
+    return text
+
+
+def fingerprint(statement: str) -> Tuple[str, str]:
+    """SQL のフィンガープリント（ID, 正規化した文）"""
+    normalized = normalize_statement(statement)
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16], normalized
+
+
+def current_route() -> str:
+    """実行中のリクエストのルート（パスパラメータを含まないテンプレート）"""
+    scope = _current_scope.get()
+    if scope is None:
+        return "(no request)"
+    return route_label(scope)
+
+
+class FingerprintStats:
+    """フィンガープリントごとの集計"""
+
+    def __init__(self, fingerprint_id: str, normalized: str):
+        self.fingerprint = fingerprint_id
+        self.normalized = normalized
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow_count = 0
+        self.sources: Counter = Counter()
+        self.routes: Counter = Counter()
+        self.sample = ""
+        self.sample_params: Any = None
+        self.sample_dialect: Optional[str] = None
+
+    def record(
+        self,
+        statement: str,
+        duration_ms: float,
+        rows: Optional[int],
+        route: str,
+        source: str,
+        slow: bool,
+        params: Any = None,
+        dialect: Optional[str] = None,
+    ) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        if rows is not None:
+            self.rows += rows
+        if slow:
+            self.slow_count += 1
+        self.sources[source] += 1
+        self.routes[route] += 1
+        if duration_ms >= self.max_ms:
+            self.max_ms = duration_ms
+            self.sample = statement
+            self.sample_params = params
+            self.sample_dialect = dialect
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.normalized,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "rows": self.rows,
+            "avg_rows": round(self.rows / self.count, 1) if self.count else 0.0,
+            "slow_count": self.slow_count,
+            "sources": dict(self.sources),
+            "routes": dict(self.routes.most_common(5)),
+            "sample": self.sample,
+        }
+
+    def to_capture(self) -> Dict[str, Any]:
+        """再実行用の記録（サンプルのパラメータを含む）"""
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.sample,
+            "params": self.sample_params,
+            "dialect": self.sample_dialect,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+            "routes": dict(self.routes.most_common(5)),
+        }
+
+
+class QueryLog:
+    """
+    SQL 実行の集計とスロークエリログ
+
+    - フィンガープリントごとに回数・合計/最大時間・行数・ルートを集計する（max_fingerprints 種類まで）
+    - slow_threshold_ms 以上かかった実行は WARNING で出力し、直近 slow_samples 件を保持する
+    - バインドパラメータの値は個人情報を含みうるため、capture_params が有効な場合だけ保持する
+      （レポートには含めず、save_capture でローカルのファイルにだけ書き出す）
+    """
+
+    ORDER_KEYS = ("total_ms", "max_ms", "avg_ms", "count", "rows", "slow_count")
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        slow_threshold_ms: float = 200.0,
+        max_fingerprints: int = 2000,
+        slow_samples: int = 100,
+        max_statement_length: int = 2000,
+        capture_params: bool = False,
+    ):
+        self.enabled = enabled
+        self.capture_params = capture_params
+        self.slow_threshold_ms = slow_threshold_ms
+        self.max_fingerprints = max_fingerprints
+        self.max_statement_length = max_statement_length
+        self._lock = threading.Lock()
+        self._stats: Dict[str, FingerprintStats] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=slow_samples)
+        self._queries = 0
+        self._dropped = 0
+        self._started = time.time()
+
+    def record(
+        self,
+        statement: str,
+        duration: float,
+        rows: Optional[int] = None,
+        source: str = "sqlalchemy",
+        params: Any = None,
+        dialect: Optional[str] = None,
+    ) -> None:
+        """
+        SQL の実行を記録
+
+        Args:
+            statement: 実行した SQL（プレースホルダのまま）
+            duration: 実行時間（秒）
+            rows: 取得・更新した行数（不明な場合は None か負数）
+            source: "sqlalchemy" / "psycopg2"
+            params: バインドパラメータ（capture_params が有効な場合だけ保持）
+            dialect: "postgresql" / "sqlite"
+        """
+        if not self.enabled:
+            return
+
+        duration_ms = duration * 1000
+        if rows is not None and rows < 0:
+            rows = None
+        fingerprint_id, normalized = fingerprint(statement)
+        route = current_route()
+        slow = duration_ms >= self.slow_threshold_ms
+        if not self.capture_params:
+            params = None
+        elif len(statement) > self.max_statement_length:
+            # 切り詰めた文は再実行できない
+            params = None
+        statement = statement[:self.max_statement_length]
+
+        with self._lock:
+            self._queries += 1
+            stats = self._stats.get(fingerprint_id)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    self._dropped += 1
+                    stats = None
+                else:
+                    stats = self._stats[fingerprint_id] = FingerprintStats(fingerprint_id, normalized)
+            if stats is not None:
+                stats.record(statement, duration_ms, rows, route, source, slow, params, dialect)
+            if slow:
+                self._slow.append({
+                    "fingerprint": fingerprint_id,
+                    "duration_ms": round(duration_ms, 2),
+                    "rows": rows,
+                    "route": route,
+                    "source": source,
+                    "statement": statement,
+                    "at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                })
+
+        if slow:
+            logger.warning(
+                f"Slow query ({duration_ms:.0f}ms, rows={rows}, {route}) [{fingerprint_id}]: "
+                f"{_SPACE_RE.sub(' ', statement)[:500]}"
+            )
+
+    def top(self, n: int = 20, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """集計の上位 n 件"""
+        if order_by not in self.ORDER_KEYS:
+            raise ValueError(f"order_by must be one of {', '.join(self.ORDER_KEYS)}")
+        with self._lock:
+            items = [stats.to_dict() for stats in self._stats.values()]
+        items.sort(key=lambda item: item[order_by], reverse=True)
+        return items[:n]
+
+    def stats(self, top_n: int = 20, order_by: str = "total_ms") -> Dict[str, Any]:
+        """スロークエリ閾値・全体の件数・上位のフィンガープリント・直近のスロークエリ"""
+        top = self.top(top_n, order_by)
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "slow_threshold_ms": self.slow_threshold_ms,
+                "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self._started)),
+                "queries": self._queries,
+                "fingerprints": len(self._stats),
+                "dropped": self._dropped,
+                "top": top,
+                "recent_slow": list(reversed(self._slow))[:top_n],
+            }
+
+    def save_capture(self, path: str) -> int:
+        """
+        再実行用の記録を JSON Lines で追記（複数ワーカーの分は読み込み側でまとめる）
+
+        Returns:
+            書き出した件数
+        """
+        with self._lock:
+            entries = [stats.to_capture() for stats in self._stats.values() if stats.sample_params is not None]
+        if not entries:
+            return 0
+        with open(path, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        logger.info(f"Saved {len(entries)} captured queries to {path}")
+        return len(entries)
+
+    def reset(self) -> None:
+        """集計をクリア"""
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+            self._queries = 0
+            self._dropped = 0
+            self._started = time.time()
+
+
+def instrumentation_active() -> bool:
+    """SQL の計測が必要か（クエリログが有効、または N+1 検知の計測中）"""
+    return get_query_log().enabled or current_counter() is not None
+
+
+def record_statement(
+    statement: str,
+    duration: float,
+    rows: Optional[int] = None,
+    source: str = "sqlalchemy",
+    params: Any = None,
+    dialect: Optional[str] = None,
+) -> None:
+    """実行した SQL をクエリログと実行中の N+1 検知に記録"""
+    query_log = get_query_log()
+    if query_log.enabled:
+        query_log.record(statement, duration, rows, source, params, dialect)
+    counter = current_counter()
+    if counter is not None:
+        counter.add(*fingerprint(statement))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and instrumentation_active():
+        context._query_log_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_log_started", None)
+    if started is None:
+        return
+    record_statement(
+        statement,
+        time.perf_counter() - started,
+        getattr(cursor, "rowcount", None),
+        params=None if executemany else parameters,
+        dialect=conn.dialect.name,
+    )
+
+
+def instrument_engine(engine) -> None:
+    """
+    SQLAlchemy エンジンに計測用のイベントを登録
+
+    非同期エンジンは engine.sync_engine を渡す（実際のカーソル実行は同期エンジンのイベントで捕捉できる）
+    """
+    from sqlalchemy import event
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryRouteMiddleware:
+    """実行した SQL を呼び出し元のルートに紐づけるASGIミドルウェア"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
+
+
+# シングルトンインスタンス
+_query_log: Optional[QueryLog] = None
+
+
+def get_query_log() -> QueryLog:
+    """QueryLogのシングルトンインスタンスを取得"""
+    global _query_log
+    if _query_log is None:
+        settings = get_settings()
+        _query_log = QueryLog(
+            enabled=settings.query_log_enabled,
+            slow_threshold_ms=settings.slow_query_threshold_ms,
+            max_fingerprints=settings.query_log_max_fingerprints,
+            slow_samples=settings.query_log_slow_samples,
+            capture_params=bool(settings.query_capture_path),
+        )
+    return _query_log
@@ -0,0 +1,60 @@
+# app/core/threadpool.py
+"""
+同期処理のスレッドプール実行
+OpenAI呼び出しやbcryptなど、イベントループを止める同期処理を
+サイズ指定のワーカースレッドプールで実行する
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """同期処理用のスレッドプールを取得（初回呼び出し時に作成）"""
+    global _executor
+    if _executor is None:
+        settings = get_settings()
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.blocking_pool_size,
+            thread_name_prefix="blocking",
+        )
+        logger.info(f"Blocking call threadpool created (size={settings.blocking_pool_size})")
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    同期関数をスレッドプールで実行して結果を待つ
+
+    呼び出し側で明示的に指定した処理だけをオフロードする（オプトイン）。
+    blocking_offload_enabled が False の場合はその場で実行する。
+
+    使用例:
+        result = await run_blocking(chat_service.process_message, user_id=..., user_message=...)
+    """
+    if not get_settings().blocking_offload_enabled:
+        return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_blocking_executor(), call)
+
+
+def shutdown_blocking_executor() -> None:
+    """スレッドプールを停止（シャットダウン時）"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
@@ -0,0 +1,241 @@
+# app/db/counter_buffer.py
+"""
+閲覧数などのカウンターのバッファリング
+閲覧のたびに UPDATE + commit せず、メモリ上で (テーブル, 行ID, カラム) ごとに加算しておき、
+一定間隔でテーブルごとに1本の UPDATE ... SET col = col + delta でまとめて反映する
+"""
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.models.company_profile import CompanyProfile
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# テーブル名 → (テーブル, 加算できるカラム)
+COUNTER_TARGETS = {
+    "jobs": (Job.__table__, ("view_count",)),
+    "company_profile": (
+        CompanyProfile.__table__,
+        ("view_count", "click_count", "favorite_count", "apply_count"),
+    ),
+}
+
+# company_profile のイベント種別 → カラム
+COMPANY_PROFILE_EVENTS = {
+    "view": "view_count",
+    "click": "click_count",
+    "favorite": "favorite_count",
+    "apply": "apply_count",
+}
+
+# 1本の UPDATE に含める行数の上限
+FLUSH_CHUNK_SIZE = 500
+
+
+class CounterBuffer:
+    """
+    カウンター加算のバッファ
+
+    flush は別スレッドから interval ごとに実行され、終了時にも呼ばれる。
+    反映に失敗した分はバッファに戻して次回に再試行する（プロセスが落ちた場合は未反映分が失われる）。
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, interval_seconds: float = 5.0, max_pending: int = 10000):
+        self._engine = engine
+        self.interval = interval_seconds
+        self.max_pending = max_pending
+        # table -> row_id -> column -> delta
+        self._pending: Dict[str, Dict[str, Dict[str, int]]] = defaultdict(lambda: defaultdict(dict))
+        self._pending_rows = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.flushes = 0
+        self.flushed_increments = 0
+        self.failures = 0
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from app.db.session import get_engine
+            self._engine = get_engine()
+        return self._engine
+
+    def increment(self, table: str, row_id: str, column: str, delta: int = 1) -> None:
+        """カウンターを加算（DBへの反映は次回の flush）"""
+        if table not in COUNTER_TARGETS or column not in COUNTER_TARGETS[table][1]:
+            raise ValueError(f"unknown counter: {table}.{column}")
+        if not row_id or not delta:
+            return
+
+        with self._lock:
+            columns = self._pending[table][row_id]
+            if not columns:
+                self._pending_rows += 1
+            columns[column] = columns.get(column, 0) + delta
+            over_limit = self._pending_rows >= self.max_pending
+
+        self._ensure_started()
+        if over_limit:
+            self._wake.set()
+
+    def pending(self, table: str, row_id: str, column: str) -> int:
+        """未反映の加算分（表示用に DB の値へ足す）"""
+        with self._lock:
+            return self._pending.get(table, {}).get(row_id, {}).get(column, 0)
+
+    def flush(self) -> int:
+        """
+        バッファの内容を反映
+
+        Returns:
+            反映した加算の合計
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, defaultdict(lambda: defaultdict(dict))
+                self._pending_rows = 0
+
+            total = 0
+            for table_name, rows in pending.items():
+                try:
+                    total += self._flush_table(table_name, rows)
+                except Exception as e:
+                    self.failures += 1
+                    logger.error(f"Failed to flush {table_name} counters ({len(rows)} rows): {e}")
+                    self._restore(table_name, rows)
+
+            if total:
+                self.flushes += 1
+                self.flushed_increments += total
+            return total
+
+    def _flush_table(self, table_name: str, rows: Dict[str, Dict[str, int]]) -> int:
+        table, allowed = COUNTER_TARGETS[table_name]
+        items = list(rows.items())
+        total = 0
+
+        with self.engine.begin() as conn:
+            for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                chunk = items[start:start + FLUSH_CHUNK_SIZE]
+                values = {}
+                for column in allowed:
+                    deltas: List[Tuple[str, int]] = [
+                        (row_id, columns[column]) for row_id, columns in chunk if columns.get(column)
+                    ]
+                    if not deltas:
+                        continue
+                    # col = coalesce(col, 0) + CASE id WHEN ... THEN delta ... ELSE 0 END
+                    values[column] = func.coalesce(table.c[column], 0) + case(
+                        dict(deltas), value=table.c.id, else_=0
+                    )
+                    total += sum(delta for _, delta in deltas)
+
+                if values:
+                    # 閲覧数の反映では更新日時を変えない
+                    if "updated_at" in table.c:
+                        values["updated_at"] = table.c.updated_at
+                    conn.execute(
+                        table.update()
+                        .where(table.c.id.in_([row_id for row_id, _ in chunk]))
+                        .values(**values)
+                    )
+        return total
+
+    def _restore(self, table_name: str, rows: Dict[str, Dict[str, int]]) -> None:
+        """反映に失敗した加算をバッファに戻す"""
+        with self._lock:
+            for row_id, columns in rows.items():
+                current = self._pending[table_name][row_id]
+                if not current:
+                    self._pending_rows += 1
+                for column, delta in columns.items():
+                    current[column] = current.get(column, 0) + delta
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stop.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="counter-buffer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.flush()
+
+    def close(self) -> None:
+        """定期 flush を止めて残りを反映"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending_rows = self._pending_rows
+        return {
+            "pending_rows": pending_rows,
+            "flushes": self.flushes,
+            "flushed_increments": self.flushed_increments,
+            "failures": self.failures,
+        }
+
+
+# シングルトンインスタンス
+_counter_buffer: Optional[CounterBuffer] = None
+
+
+def get_counter_buffer() -> CounterBuffer:
+    """CounterBufferのシングルトンインスタンスを取得"""
+    global _counter_buffer
+    if _counter_buffer is None:
+        settings = get_settings()
+        _counter_buffer = CounterBuffer(
+            interval_seconds=settings.counter_flush_interval_seconds,
+            max_pending=settings.counter_flush_max_pending,
+        )
+    return _counter_buffer
+
+
+def close_counter_buffer() -> None:
+    """終了時に未反映分を反映"""
+    global _counter_buffer
+    if _counter_buffer is not None:
+        _counter_buffer.close()
+        _counter_buffer = None
+
+
+def record_job_view(job_id: str) -> None:
+    """求人の閲覧を記録"""
+    get_counter_buffer().increment("jobs", job_id, "view_count")
+
+
+def record_company_profile_event(profile_id: str, event: str) -> None:
+    """
+    company_profile の閲覧・クリック・お気に入り・応募を記録
+
+    Args:
+        profile_id: company_profile.id
+        event: "view" / "click" / "favorite" / "apply"
+    """
+    column = COMPANY_PROFILE_EVENTS.get(event)
+    if column is None:
+        raise ValueError(f"unknown company_profile event: {event}")
+    get_counter_buffer().increment("company_profile", profile_id, column)
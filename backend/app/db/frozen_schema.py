@@ -0,0 +1,372 @@
+# app/db/frozen_schema.py
+"""
+マイグレーションで作成するテーブルの定義（作成したマイグレーションの時点で固定）
+
+モデル（app/models）を変更してもここは書き換えない。マイグレーションがモデル定義から
+テーブルを作成すると、新規DBでは後のバージョンで追加するはずのカラムまで最初に作成されてしまうため、
+各テーブルはマイグレーションを追加した時点の定義をここに写して使う
+（定義の DDL はマイグレーションのチェックサムに含まれる）。
+スキーマの変更は新しいマイグレーションとして app/db/migrations.py に追加すること
+
+Enum は SQLAlchemy の Enum(列挙型) と同じく、メンバー名を値・小文字のクラス名を型名にする
+"""
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    Time,
+)
+from sqlalchemy.sql import func
+
+frozen_metadata = MetaData()
+
+USER_ROLE = ("SEEKER", "EMPLOYER")
+
+
+def _timestamps(timezone: bool = True, nullable: bool = False):
+    return [
+        Column("created_at", DateTime(timezone=timezone), server_default=func.now(), nullable=nullable),
+        Column("updated_at", DateTime(timezone=timezone), server_default=func.now(), nullable=nullable),
+    ]
+
+
+# === 0001 baseline（バージョン管理を始めた時点のモデル） ===
+
+Table(
+    "users", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("email", String(255), unique=True, nullable=False, index=True),
+    Column("password_hash", String(255), nullable=False),
+    Column("name", String(100), nullable=False),
+    Column("role", Enum(*USER_ROLE, name="userrole"), nullable=False),
+    Column("line_user_id", String(100), unique=True, nullable=True, index=True),
+    Column("line_display_name", String(100), nullable=True),
+    Column("line_picture_url", String(500), nullable=True),
+    Column("line_email", String(255), nullable=True),
+    Column("line_linked_at", DateTime(timezone=True), nullable=True),
+    Column("skills", Text, nullable=True),
+    Column("experience_years", String(20), nullable=True),
+    Column("desired_salary_min", String(50), nullable=True),
+    Column("desired_salary_max", String(50), nullable=True),
+    Column("desired_location", String(100), nullable=True),
+    Column("desired_employment_type", String(50), nullable=True),
+    Column("resume_url", String(500), nullable=True),
+    Column("portfolio_url", String(500), nullable=True),
+    Column("company_name", String(200), nullable=True),
+    Column("industry", String(100), nullable=True),
+    Column("company_size", String(50), nullable=True),
+    Column("company_description", Text, nullable=True),
+    Column("company_website", String(500), nullable=True),
+    Column("company_location", String(200), nullable=True),
+    Column("company_logo_url", String(500), nullable=True),
+    Column("profile_completion", String(10), nullable=True),
+    Column("gmo_member_id", String(100), unique=True, nullable=True, index=True),
+    Column("subscription_tier", String(50), nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("is_verified", Boolean, nullable=False),
+    *_timestamps(),
+    Column("last_login_at", DateTime(timezone=True), nullable=True),
+)
+
+Table(
+    "jobs", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("employer_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("title", String(200), nullable=False),
+    Column("company", String(200), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("location", String(200), nullable=False),
+    Column(
+        "employment_type",
+        Enum("FULL_TIME", "PART_TIME", "CONTRACT", "INTERNSHIP", name="employmenttype"),
+        nullable=False,
+    ),
+    Column("salary_min", Integer, nullable=True),
+    Column("salary_max", Integer, nullable=True),
+    Column("salary_text", String(200), nullable=True),
+    Column("required_skills", Text, nullable=True),
+    Column("preferred_skills", Text, nullable=True),
+    Column("requirements", Text, nullable=True),
+    Column("benefits", Text, nullable=True),
+    Column("tags", Text, nullable=True),
+    Column("remote", Boolean, nullable=False),
+    Column("status", Enum("DRAFT", "PUBLISHED", "CLOSED", name="jobstatus"), nullable=False),
+    Column("featured", Boolean, nullable=False),
+    Column("embedding", Text, nullable=True),
+    Column("meta_data", Text, nullable=True),
+    Column("posted_date", DateTime(timezone=True), nullable=True),
+    *_timestamps(),
+)
+
+Table(
+    "applications", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("seeker_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("job_id", String(36), ForeignKey("jobs.id"), nullable=False, index=True),
+    Column(
+        "status",
+        Enum("SCREENING", "INTERVIEW", "OFFERED", "REJECTED", "WITHDRAWN", name="applicationstatus"),
+        nullable=False,
+    ),
+    Column("status_detail", String(100), nullable=True),
+    Column("status_color", String(20), nullable=True),
+    Column("match_score", Integer, nullable=True),
+    Column("next_step", String(100), nullable=True),
+    Column("interview_date", DateTime(timezone=True), nullable=True),
+    Column("resume_submitted", String(10), nullable=True),
+    Column("portfolio_submitted", String(10), nullable=True),
+    Column("cover_letter", Text, nullable=True),
+    Column("message", Text, nullable=True),
+    Column("notes", Text, nullable=True),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    *_timestamps(),
+)
+
+Table(
+    "scouts", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("employer_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("seeker_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("job_id", String(36), ForeignKey("jobs.id"), nullable=True, index=True),
+    Column("title", String(200), nullable=False),
+    Column("message", Text, nullable=False),
+    Column("match_score", Integer, nullable=True),
+    Column("status", Enum("NEW", "READ", "REPLIED", "DECLINED", name="scoutstatus"), nullable=False),
+    Column("tags", Text, nullable=True),
+    *_timestamps(),
+    Column("read_at", DateTime(timezone=True), nullable=True),
+    Column("replied_at", DateTime(timezone=True), nullable=True),
+)
+
+Table(
+    "resumes", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("user_id", String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True, index=True),
+    Column("last_name", String(50), nullable=True),
+    Column("first_name", String(50), nullable=True),
+    Column("last_name_kana", String(50), nullable=True),
+    Column("first_name_kana", String(50), nullable=True),
+    Column("birth_date", String(20), nullable=True),
+    Column("gender", String(20), nullable=True),
+    Column("phone", String(50), nullable=True),
+    Column("email", String(255), nullable=True),
+    Column("address", String(500), nullable=True),
+    Column("education", Text, nullable=True),
+    Column("experience", Text, nullable=True),
+    Column("experience_roles", String(500), nullable=True),
+    Column("current_salary", String(50), nullable=True),
+    Column("skills", Text, nullable=True),
+    Column("qualifications", Text, nullable=True),
+    Column("native_language", String(50), nullable=True),
+    Column("spoken_languages", String(200), nullable=True),
+    Column("language_skills", Text, nullable=True),
+    Column("summary", Text, nullable=True),
+    Column("career_change_reason", Text, nullable=True),
+    Column("future_vision", Text, nullable=True),
+    *_timestamps(),
+)
+
+Table(
+    "company_date", frozen_metadata,
+    Column("company_id", String(36), primary_key=True),
+    Column("company_name", String(255), nullable=False),
+    Column("email", String(255), unique=True, nullable=False),
+    Column("password", String(255), nullable=False),
+    Column("industry", String(100)),
+    Column("company_size", String(50)),
+    Column("founded_year", Integer),
+    Column("website_url", String(500)),
+    Column("description", Text),
+    *_timestamps(timezone=False, nullable=True),
+)
+
+Table(
+    "company_profile", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("company_id", String(36), ForeignKey("company_date.company_id", ondelete="CASCADE")),
+    Column("job_title", String(200), nullable=False),
+    Column("job_description", Text, nullable=False),
+    Column("location_prefecture", String(50), nullable=False),
+    Column("location_city", String(100)),
+    Column("salary_min", Integer, nullable=False),
+    Column("salary_max", Integer, nullable=False),
+    Column("employment_type", String(50)),
+    Column("remote_option", String(50)),
+    Column("flex_time", Boolean),
+    Column("latest_start_time", Time),
+    Column("side_job_allowed", Boolean),
+    Column("team_size", String(50)),
+    Column("development_method", String(100)),
+    Column("tech_stack", JSON),
+    Column("required_skills", JSON),
+    Column("preferred_skills", JSON),
+    Column("benefits", JSON),
+    Column("work_style_details", Text),
+    Column("team_culture_details", Text),
+    Column("growth_opportunities_details", Text),
+    Column("benefits_details", Text),
+    Column("office_environment_details", Text),
+    Column("project_details", Text),
+    Column("company_appeal_text", Text),
+    Column("ai_extracted_features", JSON),
+    Column("additional_questions", JSON),
+    Column("status", String(20)),
+    Column("view_count", Integer),
+    Column("click_count", Integer),
+    Column("favorite_count", Integer),
+    Column("apply_count", Integer),
+    *_timestamps(timezone=False, nullable=True),
+)
+
+Table(
+    "user_preferences_profile", frozen_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("user_id", String(36), unique=True, nullable=False),
+    Column("job_title", String(200)),
+    Column("location_prefecture", String(50)),
+    Column("location_city", String(100)),
+    Column("salary_min", Integer),
+    Column("salary_max", Integer),
+    Column("remote_work_preference", String(50)),
+    Column("employment_type", String(50)),
+    Column("industry_preferences", JSON),
+    Column("work_hours_preference", String(100)),
+    Column("company_size_preference", String(50)),
+    *_timestamps(timezone=False, nullable=True),
+)
+
+Table(
+    "conversation_sessions", frozen_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("user_id", String(36), nullable=False),
+    Column("session_id", String(100), unique=True, nullable=False),
+    Column("total_turns", Integer),
+    Column("end_reason", String(50)),
+    Column("final_match_percentage", Float),
+    Column("presented_jobs", JSON),
+    Column("started_at", DateTime, server_default=func.now()),
+    Column("ended_at", DateTime, server_default=func.now()),
+)
+
+Table(
+    "conversation_logs", frozen_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("session_id", String(100), nullable=False, index=True),
+    Column("user_id", String(36), nullable=False, index=True),
+    Column("turn_number", Integer, nullable=False),
+    Column("user_message", Text),
+    Column("ai_response", Text),
+    Column("extracted_intent", JSON),
+    Column("created_at", DateTime, server_default=func.now()),
+)
+
+Table(
+    "chat_sessions", frozen_metadata,
+    Column("session_id", String(255), primary_key=True),
+    Column("user_id", String(255), nullable=False, index=True),
+    Column("session_data", JSON, nullable=False),
+    *_timestamps(timezone=False, nullable=True),
+)
+
+Table(
+    "subscription_plans", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("name", String(50), unique=True, nullable=False),
+    Column("display_name", String(100), nullable=False),
+    Column("user_role", Enum(*USER_ROLE, name="userrole"), nullable=False),
+    Column(
+        "tier",
+        Enum(
+            "SEEKER_FREE", "SEEKER_STANDARD", "SEEKER_PREMIUM",
+            "EMPLOYER_FREE", "EMPLOYER_STARTER", "EMPLOYER_BUSINESS",
+            name="plantier",
+        ),
+        nullable=False,
+    ),
+    Column("price_jpy", Integer, nullable=False),
+    Column("features", Text, nullable=True),
+    Column("description", Text, nullable=True),
+    Column("display_order", Integer),
+    Column("is_active", Boolean, nullable=False),
+    *_timestamps(),
+)
+
+Table(
+    "subscriptions", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("user_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("plan_id", String(36), ForeignKey("subscription_plans.id"), nullable=False),
+    Column(
+        "status",
+        Enum("ACTIVE", "CANCELED", "PAST_DUE", "PAUSED", "TRIALING", name="subscriptionstatus"),
+        nullable=False,
+    ),
+    Column("gmo_member_id", String(100), nullable=True),
+    Column("gmo_subscription_id", String(100), nullable=True, unique=True),
+    Column("current_period_start", DateTime(timezone=True), nullable=False),
+    Column("current_period_end", DateTime(timezone=True), nullable=False),
+    Column("cancel_at_period_end", Boolean, nullable=False),
+    Column("canceled_at", DateTime(timezone=True), nullable=True),
+    Column("trial_end", DateTime(timezone=True), nullable=True),
+    *_timestamps(),
+)
+
+Table(
+    "usage_tracking", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("user_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("period_start", DateTime(timezone=True), nullable=False),
+    Column("period_end", DateTime(timezone=True), nullable=False),
+    Column("ai_chat_count", Integer, nullable=False),
+    Column("application_count", Integer, nullable=False),
+    Column("scout_count", Integer, nullable=False),
+    Column("job_posting_count", Integer, nullable=False),
+    Column("candidate_view_count", Integer, nullable=False),
+    *_timestamps(),
+)
+
+Table(
+    "payment_history", frozen_metadata,
+    Column("id", String(36), primary_key=True),
+    Column("user_id", String(36), ForeignKey("users.id"), nullable=False, index=True),
+    Column("subscription_id", String(36), ForeignKey("subscriptions.id"), nullable=True),
+    Column("gmo_order_id", String(100), nullable=True, unique=True),
+    Column("gmo_tran_id", String(100), nullable=True),
+    Column("amount_jpy", Integer, nullable=False),
+    Column("currency", String(3), nullable=False),
+    Column("status", Enum("PENDING", "SUCCESS", "FAILED", "REFUNDED", name="paymentstatus"), nullable=False),
+    Column("payment_method", String(50), nullable=True),
+    Column("description", String(500), nullable=True),
+    Column("error_message", Text, nullable=True),
+    Column("receipt_url", String(500), nullable=True),
+    Column("paid_at", DateTime(timezone=True), nullable=True),
+    *_timestamps(),
+)
+
+BASELINE_TABLES = list(frozen_metadata.tables)
+
+
+# === 0007 employer_stats ===
+
+Table(
+    "employer_stats", frozen_metadata,
+    Column("employer_id", String(36), ForeignKey("users.id"), primary_key=True),
+    Column("jobs_draft", Integer, nullable=False),
+    Column("jobs_published", Integer, nullable=False),
+    Column("jobs_closed", Integer, nullable=False),
+    Column("applications_screening", Integer, nullable=False),
+    Column("applications_interview", Integer, nullable=False),
+    Column("applications_offered", Integer, nullable=False),
+    Column("applications_rejected", Integer, nullable=False),
+    Column("applications_withdrawn", Integer, nullable=False),
+    Column("updated_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+)
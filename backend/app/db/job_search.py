@@ -0,0 +1,285 @@
+# app/db/job_search.py
+"""
+求人の全文検索バックエンド
+キーワード検索を LIKE '%q%' の全件走査から、DBごとの全文検索インデックスに切り替える
+
+  - SQLite: FTS5 仮想テーブル（trigram トークナイザ）をトリガーで jobs と同期
+  - PostgreSQL: 生成列の tsvector / 検索用テキストに GIN インデックス（tsvector + pg_trgm）
+  - その他・インデックス未作成: 従来の LIKE 検索
+
+検索対象はタイトル・会社名・仕事内容・必須スキル。インデックスはDB側（トリガー・生成列）で
+更新されるため、ORMを経由しない書き込みでも同期される。
+インデックスの作成はマイグレーション（job_search_index）で行い、起動時は作成済みかを確認するだけ。
+"""
+import logging
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import func, literal, literal_column, or_, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db.types import json_text
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COLUMNS = ("title", "company", "description", "required_skills")
+# JSON カラム（テキストに変換して検索する）
+JSON_SEARCH_COLUMNS = ("required_skills",)
+
+
+def _search_column(name: str):
+    column = getattr(Job, name)
+    return json_text(column) if name in JSON_SEARCH_COLUMNS else column
+
+
+def _like_pattern(query: str) -> str:
+    """LIKE 用にワイルドカードをエスケープしたパターン"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class JobSearchBackend:
+    """
+    LIKE による検索（全文検索インデックスがない場合のフォールバック）
+
+    apply() はクエリ（Query / Select 共通）に検索条件を追加し、
+    関連度順の ORDER BY（関連度で並べられない場合は None）を返す
+    """
+
+    name = "like"
+
+    def __init__(self):
+        self.ready = True
+
+    def create_schema(self, connection: Connection) -> None:
+        """インデックス・同期用オブジェクトを作成（マイグレーションから実行。作成済みなら何もしない）"""
+        pass
+
+    def detect(self, connection: Connection) -> bool:
+        """作成済みのインデックスを確認して ready を設定（DDL は実行しない）"""
+        return self.ready
+
+    def rebuild(self, db: Session) -> int:
+        """インデックスを作り直し、登録件数を返す"""
+        return 0
+
+    def apply(self, db_query: Any, query: str) -> Tuple[Any, Optional[List[Any]]]:
+        pattern = _like_pattern(query)
+        condition = or_(*(
+            _search_column(column).ilike(pattern, escape="\\") for column in SEARCH_COLUMNS
+        ))
+        return db_query.filter(condition), None
+
+
+class SQLiteFTSBackend(JobSearchBackend):
+    """SQLite FTS5 による検索"""
+
+    name = "sqlite_fts5"
+    table = "jobs_fts"
+    # bm25 の列ごとの重み（job_id, title, company, description, required_skills）
+    weights = (0.0, 10.0, 5.0, 1.0, 3.0)
+
+    def __init__(self):
+        super().__init__()
+        self.ready = False
+        self.trigram = False
+
+    def create_schema(self, connection: Connection) -> None:
+        columns = ", ".join(SEARCH_COLUMNS)
+        new_values = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+
+        if self._table_sql(connection) is None:
+            # 日本語は空白で区切られないため、部分一致できる trigram を使う（SQLite 3.34以降）
+            tokenizer = "trigram" if self._supports_trigram(connection) else "unicode61"
+            logger.info(f"Creating {self.table} (fts5, tokenize={tokenizer})...")
+            connection.execute(text(
+                f"CREATE VIRTUAL TABLE {self.table} USING fts5("
+                f"job_id UNINDEXED, {columns}, tokenize='{tokenizer}')"
+            ))
+            connection.execute(text(
+                f"INSERT INTO {self.table} (job_id, {columns}) SELECT id, {columns} FROM jobs"
+            ))
+
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {self.table}_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO {self.table} (job_id, {columns}) VALUES (new.id, {new_values});
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {self.table}_ad AFTER DELETE ON jobs BEGIN
+                DELETE FROM {self.table} WHERE job_id = old.id;
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {self.table}_au AFTER UPDATE OF {columns} ON jobs BEGIN
+                DELETE FROM {self.table} WHERE job_id = old.id;
+                INSERT INTO {self.table} (job_id, {columns}) VALUES (new.id, {new_values});
+            END
+        """))
+
+    def detect(self, connection: Connection) -> bool:
+        table_sql = self._table_sql(connection)
+        self.ready = table_sql is not None
+        self.trigram = self.ready and "trigram" in table_sql
+        return self.ready
+
+    def _table_sql(self, connection: Connection) -> Optional[str]:
+        return connection.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": self.table},
+        ).scalar()
+
+    def rebuild(self, db: Session) -> int:
+        columns = ", ".join(SEARCH_COLUMNS)
+        db.execute(text(f"DELETE FROM {self.table}"))
+        db.execute(text(f"INSERT INTO {self.table} (job_id, {columns}) SELECT id, {columns} FROM jobs"))
+        db.commit()
+        return db.execute(text(f"SELECT count(*) FROM {self.table}")).scalar() or 0
+
+    @staticmethod
+    def _supports_trigram(connection: Connection) -> bool:
+        version = connection.execute(text("SELECT sqlite_version()")).scalar() or "0"
+        return tuple(int(p) for p in version.split(".")[:2]) >= (3, 34)
+
+    def _match_expression(self, query: str) -> Optional[str]:
+        """
+        FTS5 の MATCH 式（語ごとにフレーズとして AND 検索）
+
+        trigram は3文字未満の語に一致できないため、その場合は None（LIKE にフォールバック）
+        """
+        terms = query.split()
+        if not terms:
+            return None
+        if self.trigram and any(len(term) < 3 for term in terms):
+            return None
+        return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+    def apply(self, db_query: Any, query: str) -> Tuple[Any, Optional[List[Any]]]:
+        match = self._match_expression(query) if self.ready else None
+        if match is None:
+            return super().apply(db_query, query)
+
+        weights = ", ".join(str(w) for w in self.weights)
+        fts = (
+            select(
+                literal_column("job_id").label("job_id"),
+                literal_column(f"bm25({self.table}, {weights})").label("rank"),
+            )
+            .select_from(text(self.table))
+            .where(literal_column(self.table).op("MATCH")(literal(match)))
+            .subquery("job_search")
+        )
+        # bm25 は小さいほど関連度が高い
+        return db_query.join(fts, fts.c.job_id == Job.id), [fts.c.rank.asc(), Job.id.desc()]
+
+
+class PostgresSearchBackend(JobSearchBackend):
+    """PostgreSQL の tsvector + pg_trgm による検索"""
+
+    name = "postgres_tsvector"
+    document = literal_column("jobs.search_document")
+    vector = literal_column("jobs.search_vector")
+
+    def __init__(self):
+        super().__init__()
+        self.ready = False
+        self.trigram = False
+
+    def create_schema(self, connection: Connection) -> None:
+        document = " || ' ' || ".join(f"coalesce({c}::text, '')" for c in SEARCH_COLUMNS)
+
+        connection.execute(text(
+            f"ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_document TEXT "
+            f"GENERATED ALWAYS AS ({document}) STORED"
+        ))
+        connection.execute(text(
+            "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            "GENERATED ALWAYS AS (to_tsvector('simple', search_document)) STORED"
+        ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING gin (search_vector)"
+        ))
+
+        # 日本語の部分一致用（拡張を作成できない権限の場合は tsvector のみ）
+        try:
+            with connection.begin_nested():
+                connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                connection.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_jobs_search_document_trgm "
+                    "ON jobs USING gin (search_document gin_trgm_ops)"
+                ))
+        except Exception as e:
+            logger.warning(f"pg_trgm is not available, using tsvector only: {e}")
+
+    def detect(self, connection: Connection) -> bool:
+        indexes = set(connection.execute(
+            text(
+                "SELECT indexname FROM pg_indexes WHERE tablename = 'jobs' "
+                "AND indexname IN ('ix_jobs_search_vector', 'ix_jobs_search_document_trgm')"
+            )
+        ).scalars())
+        self.ready = "ix_jobs_search_vector" in indexes
+        self.trigram = self.ready and "ix_jobs_search_document_trgm" in indexes
+        return self.ready
+
+    def rebuild(self, db: Session) -> int:
+        # 生成列のため、インデックスの再構築のみ
+        db.execute(text("REINDEX INDEX ix_jobs_search_vector"))
+        if self.trigram:
+            db.execute(text("REINDEX INDEX ix_jobs_search_document_trgm"))
+        db.commit()
+        return db.execute(text("SELECT count(*) FROM jobs")).scalar() or 0
+
+    def apply(self, db_query: Any, query: str) -> Tuple[Any, Optional[List[Any]]]:
+        if not self.ready:
+            return super().apply(db_query, query)
+
+        tsquery = func.websearch_to_tsquery("simple", query)
+        conditions = [self.vector.op("@@")(tsquery)]
+        rank = func.ts_rank_cd(self.vector, tsquery)
+        if self.trigram:
+            conditions.append(self.document.ilike(_like_pattern(query), escape="\\"))
+            rank = rank + func.word_similarity(query, self.document)
+
+        return db_query.filter(or_(*conditions)), [rank.desc(), Job.id.desc()]
+
+
+def _create_backend(database_url: str) -> JobSearchBackend:
+    if database_url.startswith("sqlite"):
+        return SQLiteFTSBackend()
+    if database_url.startswith("postgresql"):
+        return PostgresSearchBackend()
+    return JobSearchBackend()
+
+
+# シングルトンインスタンス
+_backend: Optional[JobSearchBackend] = None
+
+
+def get_job_search_backend() -> JobSearchBackend:
+    """JobSearchBackendのシングルトンインスタンスを取得（database_url から選択）"""
+    global _backend
+    if _backend is None:
+        _backend = _create_backend(get_settings().database_url)
+    return _backend
+
+
+def setup_job_search(connection: Connection) -> JobSearchBackend:
+    """
+    作成済みの全文検索インデックスを検出して有効化
+
+    インデックスの作成はマイグレーション（scripts/migrate.py）で行う。
+    未作成・検出に失敗した場合は LIKE 検索のまま動作を続ける
+    """
+    backend = get_job_search_backend()
+    try:
+        if backend.detect(connection):
+            logger.info(f"Job search backend: {backend.name}")
+        else:
+            logger.warning(f"Job search index is not created ({backend.name}), using LIKE search")
+    except Exception as e:
+        logger.error(f"Failed to detect job search index ({backend.name}): {e}")
+        connection.rollback()
+    return backend
@@ -0,0 +1,496 @@
+# app/db/migrations.py
+"""
+バージョン付きマイグレーション
+スキーマ変更をバージョン順のマイグレーションとして定義し、適用結果を schema_migrations（台帳）に記録する
+
+  - 適用は scripts/migrate.py から行う（リクエストを処理するプロセスでは DDL を実行しない）
+  - 起動時は台帳の最新バージョンを1回読むだけで、未適用があれば警告する
+  - 台帳にはマイグレーション関数のソース（と作成するテーブルの DDL）の SHA-256 を保存し、
+    適用済みの定義が書き換えられていれば適用を中止する
+  - テーブルはモデルではなく app/db/frozen_schema.py の固定した定義から作成する
+
+既存DBには従来の起動時同期や scripts/setup_*_tables.py で作成済みのオブジェクトがあるため、
+各マイグレーションは作成済みのテーブル・カラム・インデックスをスキップする
+"""
+import hashlib
+import inspect as pyinspect
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import JSON, Column, DateTime, Integer, LargeBinary, MetaData, String, Table, inspect, select, text
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlalchemy.sql import func
+
+from app.db.frozen_schema import BASELINE_TABLES, frozen_metadata
+
+logger = logging.getLogger(__name__)
+
+# 台帳テーブル（アプリのモデルとは別の metadata で管理）
+ledger_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    ledger_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(100), nullable=False),
+    Column("checksum", String(64), nullable=False),
+    Column("applied_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
+    Column("execution_ms", Integer, nullable=False, default=0),
+)
+
+# PostgreSQL で複数プロセスが同時に適用しないための advisory lock のキー
+ADVISORY_LOCK_KEY = 7_431_002
+
+
+class MigrationError(Exception):
+    """マイグレーションの適用・検証エラー"""
+    pass
+
+
+class Migration:
+    """1つのマイグレーション（upgrade は同じトランザクション内で台帳への記録と一緒にコミットされる）"""
+
+    def __init__(
+        self,
+        version: int,
+        name: str,
+        upgrade: Callable[[Connection], None],
+        tables: Optional[List[str]] = None,
+    ):
+        self.version = version
+        self.name = name
+        self.upgrade = upgrade
+        # upgrade が frozen_schema から作成するテーブル
+        self.tables = tables or []
+
+    @property
+    def checksum(self) -> str:
+        """upgrade 関数のソースと、作成するテーブルの DDL の SHA-256"""
+        parts = [pyinspect.getsource(self.upgrade)]
+        dialect = sqlite.dialect()
+        for name in self.tables:
+            table = frozen_metadata.tables[name]
+            parts.append(str(CreateTable(table).compile(dialect=dialect)))
+            parts.extend(sorted(str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes))
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def __repr__(self):
+        return f"<Migration {self.version:04d}_{self.name}>"
+
+
+MIGRATIONS: List[Migration] = []
+
+
+def migration(version: int, name: str, tables: Optional[List[str]] = None):
+    """
+    マイグレーションを登録するデコレーター（バージョンは昇順で追加する）
+
+    tables には upgrade が _create_tables で作成するテーブルを指定する（DDL をチェックサムに含める）
+    """
+    def decorator(upgrade: Callable[[Connection], None]):
+        if MIGRATIONS and version <= MIGRATIONS[-1].version:
+            raise ValueError(f"migration version must be increasing: {version}")
+        MIGRATIONS.append(Migration(version, name, upgrade, tables))
+        return upgrade
+    return decorator
+
+
+# === 冪等なDDLヘルパー ===
+
+def _create_tables(connection: Connection, tables: List[str]) -> None:
+    """frozen_schema の定義からテーブルを作成（作成済みならスキップ）"""
+    for table in tables:
+        frozen_metadata.tables[table].create(bind=connection, checkfirst=True)
+
+
+def _add_columns(connection: Connection, table: str, columns: List[tuple]) -> None:
+    """(カラム名, 型定義) のカラムを追加（テーブルがない・追加済みならスキップ）"""
+    inspector = inspect(connection)
+    if not inspector.has_table(table):
+        return
+    existing = {c["name"] for c in inspector.get_columns(table)}
+    for column, ddl in columns:
+        if column not in existing:
+            logger.info(f"Adding {table}.{column} column...")
+            connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+
+
+def _create_indexes(connection: Connection, table: str, indexes: List[tuple], unique: bool = False) -> None:
+    """(インデックス名, カラム（複合はカンマ区切り）) のインデックスを作成"""
+    if not inspect(connection).has_table(table):
+        return
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    for index_name, columns in indexes:
+        connection.execute(text(f"CREATE {kind} IF NOT EXISTS {index_name} ON {table} ({columns})"))
+
+
+def _column_types(connection: Connection, table: str) -> Dict[str, object]:
+    inspector = inspect(connection)
+    if not inspector.has_table(table):
+        return {}
+    return {c["name"]: c["type"] for c in inspector.get_columns(table)}
+
+
+def _rewrite_values(
+    connection: Connection,
+    table: str,
+    column: str,
+    convert: Callable[[object], object],
+    target: Optional[str] = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    カラムの値を convert で変換して target（省略時は同じカラム）に書き戻す
+
+    id 順のキーセットで batch_size 行ずつ処理し、変換後の値が変わらない行は更新しない
+
+    Returns:
+        更新した行数
+    """
+    target = target or column
+    updated = 0
+    last_id = ""
+    while True:
+        rows = connection.execute(
+            text(
+                f"SELECT id, {column} FROM {table} "
+                f"WHERE id > :last_id AND {column} IS NOT NULL ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": batch_size},
+        ).all()
+        if not rows:
+            return updated
+        params = []
+        for row_id, value in rows:
+            converted = convert(value)
+            if converted != value or target != column:
+                params.append({"row_id": row_id, "value": converted})
+        if params:
+            connection.execute(text(f"UPDATE {table} SET {target} = :value WHERE id = :row_id"), params)
+            updated += len(params)
+        last_id = rows[-1][0]
+
+
+# === マイグレーション定義 ===
+# 適用済みのマイグレーションは書き換えず、変更は新しいバージョンとして追加すること
+
+@migration(1, "baseline", tables=BASELINE_TABLES)
+def _0001_baseline(connection: Connection) -> None:
+    # バージョン管理を始めた時点の全テーブルを作成（既存DBでは作成済みのテーブルをスキップ）
+    _create_tables(connection, BASELINE_TABLES)
+
+
+@migration(2, "subscription_tables", tables=["subscription_plans", "subscriptions", "usage_tracking", "payment_history"])
+def _0002_subscription_tables(connection: Connection) -> None:
+    # 旧 scripts/setup_subscription_tables.py のテーブル作成・users へのカラム追加
+    _add_columns(connection, "users", [
+        ("gmo_member_id", "VARCHAR(100) NULL"),
+        ("subscription_tier", "VARCHAR(50) NOT NULL DEFAULT 'free'"),
+    ])
+    _create_indexes(connection, "users", [("ix_users_gmo_member_id", "gmo_member_id")], unique=True)
+    _create_tables(connection, ["subscription_plans", "subscriptions", "usage_tracking", "payment_history"])
+
+
+@migration(3, "iizumi_tables", tables=["chat_sessions", "user_preferences_profile"])
+def _0003_iizumi_tables(connection: Connection) -> None:
+    # 旧 scripts/setup_iizumi_tables.py のテーブル作成
+    _create_tables(connection, ["chat_sessions", "user_preferences_profile"])
+    _create_indexes(connection, "chat_sessions", [
+        ("idx_chat_sessions_user_id", "user_id"),
+        ("idx_chat_sessions_updated_at", "updated_at"),
+    ])
+
+
+@migration(4, "line_profile_columns")
+def _0004_line_profile_columns(connection: Connection) -> None:
+    _add_columns(connection, "users", [
+        ("line_display_name", "VARCHAR(100) NULL"),
+        ("line_picture_url", "VARCHAR(500) NULL"),
+        ("line_email", "VARCHAR(255) NULL"),
+    ])
+
+
+@migration(5, "normalized_search_columns")
+def _0005_normalized_search_columns(connection: Connection) -> None:
+    # 年収の円単位・経験年数の整数正規化カラム（値は scripts/backfill_normalized_columns.py で埋める）
+    _add_columns(connection, "users", [
+        ("desired_salary_min_yen", "INTEGER NULL"),
+        ("desired_salary_max_yen", "INTEGER NULL"),
+        ("experience_years_num", "INTEGER NULL"),
+    ])
+    _add_columns(connection, "jobs", [
+        ("salary_min_yen", "INTEGER NULL"),
+        ("salary_max_yen", "INTEGER NULL"),
+    ])
+    _add_columns(connection, "user_preferences_profile", [
+        ("salary_min_yen", "INTEGER NULL"),
+    ])
+    _create_indexes(connection, "users", [
+        ("ix_users_desired_salary_min_yen", "desired_salary_min_yen"),
+        ("ix_users_desired_salary_max_yen", "desired_salary_max_yen"),
+        ("ix_users_experience_years_num", "experience_years_num"),
+    ])
+    _create_indexes(connection, "jobs", [
+        ("ix_jobs_salary_min_yen", "salary_min_yen"),
+        ("ix_jobs_salary_max_yen", "salary_max_yen"),
+    ])
+    _create_indexes(connection, "user_preferences_profile", [
+        ("ix_user_preferences_profile_salary_min_yen", "salary_min_yen"),
+    ])
+
+
+@migration(6, "keyset_pagination_indexes")
+def _0006_keyset_pagination_indexes(connection: Connection) -> None:
+    _create_indexes(connection, "jobs", [("ix_jobs_status_posted_date_id", "status, posted_date, id")])
+    _create_indexes(connection, "users", [("ix_users_role_created_at_id", "role, created_at, id")])
+    _create_indexes(connection, "scouts", [
+        ("ix_scouts_seeker_id_created_at_id", "seeker_id, created_at, id"),
+        ("ix_scouts_employer_id_created_at_id", "employer_id, created_at, id"),
+    ])
+
+
+@migration(7, "employer_stats", tables=["employer_stats"])
+def _0007_employer_stats(connection: Connection) -> None:
+    # 統計行は初回アクセス時に集計して作成される（一括作成は scripts/rebuild_employer_stats.py）
+    _create_tables(connection, ["employer_stats"])
+
+
+@migration(8, "job_search_index")
+def _0008_job_search_index(connection: Connection) -> None:
+    from app.db.job_search import get_job_search_backend
+
+    get_job_search_backend().create_schema(connection)
+
+
+@migration(9, "job_view_count")
+def _0009_job_view_count(connection: Connection) -> None:
+    _add_columns(connection, "jobs", [("view_count", "INTEGER NOT NULL DEFAULT 0")])
+
+
+@migration(10, "native_json_columns")
+def _0010_native_json_columns(connection: Connection) -> None:
+    # スキル・タグ・メタデータを JSON（PostgreSQL は JSONB）に、エンベディングを float32 のバイナリに変換
+    import json
+    import re
+
+    from app.db.job_search import get_job_search_backend
+    from app.db.types import json_serializer, pack_embedding
+
+    postgres = connection.dialect.name == "postgresql"
+    json_columns = {
+        "jobs": ("required_skills", "preferred_skills", "tags", "meta_data"),
+        "users": ("skills",),
+    }
+
+    def normalize(as_list: bool):
+        # 日本語をエスケープしない JSON テキストに揃える
+        # （JSON でないリスト列の文字列は、旧実装の読み込みと同じく「,」「、」区切りとして分割する）
+        def convert(value):
+            if not isinstance(value, str):
+                return value
+            try:
+                return json_serializer(json.loads(value))
+            except ValueError:
+                if not as_list:
+                    return json_serializer(value)
+                return json_serializer([s.strip() for s in re.split(r"[,、]", value) if s.strip()])
+        return convert
+
+    search_columns_dropped = False
+    for table, columns in json_columns.items():
+        types = _column_types(connection, table)
+        pending = [c for c in columns if c in types and not isinstance(types[c], JSON)]
+        for column in pending:
+            logger.info(f"Converting {table}.{column} to JSON...")
+            _rewrite_values(connection, table, column, normalize(column != "meta_data"))
+
+        if postgres and pending:
+            if table == "jobs" and "search_vector" in types:
+                # 全文検索の生成列が required_skills に依存するため、作り直す
+                connection.execute(text(
+                    "ALTER TABLE jobs DROP COLUMN IF EXISTS search_vector, DROP COLUMN IF EXISTS search_document"
+                ))
+                search_columns_dropped = True
+            alters = ", ".join(
+                f"ALTER COLUMN {c} TYPE JSONB USING {c}::jsonb" for c in pending
+            )
+            connection.execute(text(f"ALTER TABLE {table} {alters}"))
+
+    if search_columns_dropped:
+        get_job_search_backend().create_schema(connection)
+
+    embedding_type = _column_types(connection, "jobs").get("embedding")
+    if embedding_type is not None and not isinstance(embedding_type, LargeBinary):
+        logger.info("Converting jobs.embedding to float32 binary...")
+        if postgres:
+            connection.execute(text("ALTER TABLE jobs ADD COLUMN embedding_vector BYTEA"))
+            _rewrite_values(connection, "jobs", "embedding", pack_embedding, target="embedding_vector")
+            connection.execute(text("ALTER TABLE jobs DROP COLUMN embedding"))
+            connection.execute(text("ALTER TABLE jobs RENAME COLUMN embedding_vector TO embedding"))
+        else:
+            # SQLite は宣言型に関係なく BLOB を保存できるため、値だけ変換する
+            _rewrite_values(connection, "jobs", "embedding", pack_embedding)
+
+
+NORMALIZED_COLUMNS_MIGRATION = 5
+JOB_SEARCH_MIGRATION = 8
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# === 実行 ===
+
+def current_version(connection: Connection) -> Optional[int]:
+    """
+    適用済みの最新バージョン（主キーの1回の参照）
+
+    台帳テーブルがない場合は None
+    """
+    try:
+        return connection.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+    except Exception:
+        connection.rollback()
+        return None
+
+
+def check_migrations(connection: Connection) -> Optional[int]:
+    """
+    起動時の確認（DDL は実行せず、未適用があれば警告のみ）
+
+    Returns:
+        適用済みの最新バージョン（台帳がなければ None）
+    """
+    version = current_version(connection)
+    if version is None:
+        logger.warning("Migration ledger not found. Run: python scripts/migrate.py apply")
+    elif version < LATEST_VERSION:
+        pending = [m.name for m in MIGRATIONS if m.version > version]
+        logger.warning(
+            f"Database schema is at version {version}, {len(pending)} migration(s) pending "
+            f"({', '.join(pending)}). Run: python scripts/migrate.py apply"
+        )
+    else:
+        logger.info(f"Database schema is up to date (version {version})")
+    return version
+
+
+class MigrationRunner:
+    """マイグレーションの状態確認・適用"""
+
+    def __init__(self, engine: Optional[Engine] = None, migrations: Optional[List[Migration]] = None):
+        if engine is None:
+            from app.db.session import get_engine
+            engine = get_engine()
+        self.engine = engine
+        self.migrations = migrations if migrations is not None else MIGRATIONS
+
+    @staticmethod
+    def _applied(connection: Connection) -> Dict[int, dict]:
+        if not inspect(connection).has_table(schema_migrations.name):
+            return {}
+        rows = connection.execute(select(schema_migrations).order_by(schema_migrations.c.version))
+        return {row["version"]: dict(row) for row in rows.mappings()}
+
+    def status(self) -> List[dict]:
+        """
+        マイグレーションごとの状態
+
+        state: applied / pending / changed（適用後に定義が書き換えられた）/ unknown（台帳にのみ存在）
+        """
+        with self.engine.connect() as connection:
+            applied = self._applied(connection)
+
+        result = []
+        for m in self.migrations:
+            row = applied.pop(m.version, None)
+            if row is None:
+                state = "pending"
+            elif row["checksum"] != m.checksum:
+                state = "changed"
+            else:
+                state = "applied"
+            result.append({
+                "version": m.version,
+                "name": m.name,
+                "state": state,
+                "applied_at": row["applied_at"] if row else None,
+            })
+        for version, row in sorted(applied.items()):
+            result.append({"version": version, "name": row["name"], "state": "unknown", "applied_at": row["applied_at"]})
+        return result
+
+    def apply(self, target: Optional[int] = None) -> List[Migration]:
+        """
+        未適用のマイグレーションをバージョン順に適用
+
+        マイグレーションごとに1トランザクションで、DDL と台帳への記録をまとめてコミットする
+        （トランザクション内の DDL に対応していない DB では、失敗時に DDL だけ残る場合がある）
+
+        Args:
+            target: このバージョンまで適用（省略時は最新まで）
+
+        Returns:
+            適用したマイグレーション
+        """
+        applied_now: List[Migration] = []
+
+        with self.engine.connect() as connection:
+            self._lock(connection)
+            try:
+                schema_migrations.create(bind=connection, checkfirst=True)
+                connection.commit()
+
+                # ロック取得後に読み直す（他のプロセスが適用済みの場合がある）
+                applied = self._applied(connection)
+                connection.commit()
+                self._verify(applied)
+
+                for m in self.migrations:
+                    if m.version in applied or (target is not None and m.version > target):
+                        continue
+
+                    logger.info(f"Applying migration {m.version:04d}_{m.name}...")
+                    started = time.perf_counter()
+                    with connection.begin():
+                        m.upgrade(connection)
+                        connection.execute(schema_migrations.insert().values(
+                            version=m.version,
+                            name=m.name,
+                            checksum=m.checksum,
+                            execution_ms=int((time.perf_counter() - started) * 1000),
+                        ))
+                    applied_now.append(m)
+            finally:
+                if connection.in_transaction():
+                    connection.rollback()
+                self._unlock(connection)
+
+        return applied_now
+
+    def _verify(self, applied: Dict[int, dict]) -> None:
+        """適用済みのマイグレーションの定義が変わっていないか"""
+        known = {m.version: m for m in self.migrations}
+        for version, row in applied.items():
+            m = known.get(version)
+            if m is None:
+                raise MigrationError(
+                    f"migration {version} ({row['name']}) is recorded in the ledger but not defined"
+                )
+            if row["checksum"] != m.checksum:
+                raise MigrationError(
+                    f"migration {version:04d}_{m.name} was modified after it was applied "
+                    f"(ledger {row['checksum'][:12]}, code {m.checksum[:12]})"
+                )
+
+    @staticmethod
+    def _lock(connection: Connection) -> None:
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+            connection.commit()
+
+    @staticmethod
+    def _unlock(connection: Connection) -> None:
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+            connection.commit()
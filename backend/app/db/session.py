@@ -3,14 +3,17 @@ Database engine and session management.
 Provides FastAPI dependencies plus a health check helper.
 """
 from functools import lru_cache
-from typing import Dict, Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Tuple
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import get_settings
+from app.core.query_log import instrument_engine
+from app.db.types import json_serializer
 
 
 @lru_cache(maxsize=1)
@@ -26,12 +29,15 @@ def get_engine() -> Engine:
         separator = "&" if "?" in settings.database_url else "?"
         database_url = f"{settings.database_url}{separator}sslmode=require"
 
-    return create_engine(
+    engine = create_engine(
         database_url,
         connect_args=connect_args,
         pool_pre_ping=True,
         echo=settings.debug,
+        json_serializer=json_serializer,
     )
+    instrument_engine(engine)
+    return engine
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
@@ -48,6 +54,73 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def _async_database_url(database_url: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Translate the sync DATABASE_URL into an async driver URL.
+
+    sqlite uses aiosqlite; postgresql uses asyncpg, which takes ``ssl`` as a
+    connect argument instead of the libpq ``sslmode`` query parameter.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite"), {}
+
+    if backend == "postgresql":
+        query = dict(url.query)
+        sslmode = query.pop("sslmode", "require")
+        connect_args = {"ssl": False if sslmode == "disable" else sslmode}
+        return url.set(drivername="postgresql+asyncpg", query=query), connect_args
+
+    return url, {}
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Create or return the shared async SQLAlchemy engine."""
+    settings = get_settings()
+    database_url, connect_args = _async_database_url(settings.database_url)
+
+    engine = create_async_engine(
+        database_url,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+        echo=settings.debug,
+        json_serializer=json_serializer,
+    )
+    instrument_engine(engine.sync_engine)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Return the async session factory.
+    Created lazily so the async drivers are only required once an async route is hit.
+    """
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield an async database session for FastAPI dependencies.
+    Use this from async routes so queries do not block the event loop.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections (called on shutdown)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
 def healthcheck() -> Dict[str, str]:
     """
     Perform a lightweight database health check.
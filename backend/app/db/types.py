@@ -0,0 +1,73 @@
+# app/db/types.py
+"""
+カラム型
+  - JSONType: PostgreSQL では JSONB、その他（SQLite）では JSON テキストとして保存
+  - EmbeddingVector: エンベディングを float32 のバイナリ（1536次元で6KB）として保存
+"""
+import json
+import sys
+from array import array
+from typing import Any, Optional
+
+from sqlalchemy import JSON, LargeBinary, Text, cast
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeDecorator
+
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def json_text(column):
+    """JSON カラムをテキストとして比較する式（LIKE による部分一致用）"""
+    return cast(column, Text)
+
+
+def json_serializer(value: Any) -> str:
+    """JSON テキストとして保存する場合のシリアライザ（日本語をエスケープせず、LIKE・全文検索で一致させる）"""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def pack_embedding(value: Any) -> Optional[bytes]:
+    """
+    ベクトルを float32 のバイト列（リトルエンディアン）に変換
+
+    リスト・タプル・array・numpy 配列のほか、旧形式の JSON 文字列も受け付ける
+    """
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value)
+    if isinstance(value, str):
+        value = json.loads(value)
+        if value is None:
+            return None
+    if hasattr(value, "astype"):
+        # numpy 配列
+        return value.astype("<f4").tobytes()
+    vector = array("f", value)
+    if sys.byteorder != "little":
+        vector.byteswap()
+    return vector.tobytes()
+
+
+def unpack_embedding(value: Optional[bytes]) -> Optional[array]:
+    """float32 のバイト列を array('f') に変換（numpy では np.frombuffer(vector, dtype='<f4') で参照できる）"""
+    if value is None:
+        return None
+    vector = array("f")
+    vector.frombytes(value)
+    if sys.byteorder != "little":
+        vector.byteswap()
+    return vector
+
+
+class EmbeddingVector(TypeDecorator):
+    """エンベディング（float32 のバイナリ。読み出し時は array('f')）"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return pack_embedding(value)
+
+    def process_result_value(self, value, dialect):
+        return unpack_embedding(value)
@@ -4,10 +4,14 @@ Job Matching Backend API
 すべてのAPIエンドポイントを統合したメインアプリケーション
 """
 import logging
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import get_settings
+from app.core.loop_monitor import LoopBlockingMiddleware, get_loop_monitor
+from app.core.query_counter import NPlusOneMiddleware
+from app.core.query_log import QueryRouteMiddleware, get_query_log
 from app.api.endpoints import auth, jobs, matching, applications, scouts, conversation, users, employer, resume, candidates, billing, webhooks
 
 logger = logging.getLogger(__name__)
@@ -48,6 +52,17 @@ app.add_middleware(
     allow_headers=settings.cors_headers,
 )
 
+# イベントループのブロッキング検知
+if settings.loop_monitor_enabled:
+    app.add_middleware(LoopBlockingMiddleware, monitor=get_loop_monitor())
+
+# SQL の実行時間をルートごとに記録
+if settings.query_log_enabled:
+    app.add_middleware(QueryRouteMiddleware)
+
+# N+1 クエリの検知（n_plus_one_mode が off の間は素通り）
+app.add_middleware(NPlusOneMiddleware)
+
 # APIルーターを登録
 app.include_router(auth.router, prefix="/api/auth", tags=["認証"])
 app.include_router(users.router, prefix="/api/users", tags=["ユーザー"])
@@ -71,46 +86,36 @@ async def startup_event():
     logger.info(f"CORS Origins: {cors_origins_list}")
     logger.info(f"Debug mode: {settings.debug}")
 
-    # Run database migrations
+    # スキーマの確認（マイグレーションはコンテナの起動時に scripts/migrate.py apply で適用済み、アプリは DDL を実行しない）
     try:
-        logger.info("Running database migrations...")
-        from app.db.session import SessionLocal
-        from sqlalchemy import text
-
-        db = SessionLocal()
-        try:
-            # Check and add LINE fields if they don't exist
-            check_sql = text("""
-                SELECT column_name
-                FROM information_schema.columns
-                WHERE table_name = 'users'
-                AND column_name IN ('line_display_name', 'line_picture_url', 'line_email')
-            """)
-
-            existing_columns = db.execute(check_sql).fetchall()
-            existing_column_names = [row[0] for row in existing_columns]
-
-            if 'line_display_name' not in existing_column_names:
-                logger.info("Adding line_display_name column...")
-                db.execute(text("ALTER TABLE users ADD COLUMN line_display_name VARCHAR(100) NULL"))
-
-            if 'line_picture_url' not in existing_column_names:
-                logger.info("Adding line_picture_url column...")
-                db.execute(text("ALTER TABLE users ADD COLUMN line_picture_url VARCHAR(500) NULL"))
-
-            if 'line_email' not in existing_column_names:
-                logger.info("Adding line_email column...")
-                db.execute(text("ALTER TABLE users ADD COLUMN line_email VARCHAR(255) NULL"))
-
-            db.commit()
-            logger.info("Database migrations completed successfully")
-        except Exception as e:
-            logger.error(f"Migration failed: {e}")
-            db.rollback()
-        finally:
-            db.close()
+        from app.db.job_search import setup_job_search
+        from app.db.migrations import JOB_SEARCH_MIGRATION, check_migrations
+        from app.db.session import get_engine
+
+        with get_engine().connect() as connection:
+            version = check_migrations(connection)
+            app.state.schema_version = version
+            if version is not None and version >= JOB_SEARCH_MIGRATION:
+                setup_job_search(connection)
     except Exception as e:
-        logger.error(f"Failed to run migrations: {e}")
+        logger.error(f"Failed to check database schema: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """終了時の処理"""
+    from app.config.database import close_pool
+    from app.core.threadpool import shutdown_blocking_executor
+    from app.db.counter_buffer import close_counter_buffer
+    from app.db.session import dispose_async_engine
+
+    get_loop_monitor().stop()
+    if settings.query_capture_path:
+        get_query_log().save_capture(settings.query_capture_path)
+    shutdown_blocking_executor()
+    close_counter_buffer()
+    close_pool()
+    await dispose_async_engine()
 
 
 @app.get("/")
@@ -123,10 +128,78 @@ async def root():
     }
 
 
+def _schema_version() -> int:
+    """適用済みのスキーマバージョン（最新になるまでは毎回読み直す）"""
+    from app.db.migrations import LATEST_VERSION, current_version
+    from app.db.session import get_engine
+
+    version = getattr(app.state, "schema_version", None)
+    if version is None or version < LATEST_VERSION:
+        with get_engine().connect() as connection:
+            version = current_version(connection)
+        app.state.schema_version = version
+    return version or 0
+
+
 @app.get("/health")
 async def health_check():
-    """ヘルスチェックエンドポイント"""
-    return {"status": "healthy"}
+    """ヘルスチェックエンドポイント（未適用のマイグレーションがあれば 503）"""
+    from app.core.threadpool import run_blocking
+    from app.db.migrations import LATEST_VERSION
+
+    try:
+        version = await run_blocking(_schema_version)
+    except Exception as e:
+        logger.error(f"Health check failed to read schema version: {e}")
+        return JSONResponse(status_code=503, content={"status": "unhealthy", "reason": "database unavailable"})
+
+    if version < LATEST_VERSION:
+        return JSONResponse(
+            status_code=503,
+            content={
+                "status": "unhealthy",
+                "reason": f"schema version {version} < {LATEST_VERSION} (run: python scripts/migrate.py apply)",
+            },
+        )
+    return {"status": "healthy", "schema_version": version}
+
+
+# 計測用のデバッグエンドポイント（内部の状態を返すため、本番環境では登録しない）
+debug_router = APIRouter(prefix="/debug", tags=["デバッグ"])
+
+
+@debug_router.get("/db-pool")
+async def debug_db_pool():
+    """デバッグ用: psycopg2接続プールのメトリクス"""
+    from app.config.database import get_pool
+
+    return get_pool().stats()
+
+
+@debug_router.get("/counters")
+async def debug_counters():
+    """デバッグ用: 閲覧数カウンターのバッファ状況"""
+    from app.db.counter_buffer import get_counter_buffer
+
+    return get_counter_buffer().stats()
+
+
+@debug_router.get("/loop-blocking")
+async def debug_loop_blocking(top_n: int = 20):
+    """デバッグ用: イベントループ遅延とブロッキングしたルート（スタックサンプル付き）"""
+    return get_loop_monitor().stats(top_n=top_n)
+
+
+@debug_router.get("/slow-queries")
+async def debug_slow_queries(top_n: int = 20, order_by: str = "total_ms"):
+    """デバッグ用: SQL のフィンガープリント別の集計（order_by の降順）と直近のスロークエリ"""
+    if order_by not in get_query_log().ORDER_KEYS:
+        raise HTTPException(status_code=400, detail=f"order_by must be one of {', '.join(get_query_log().ORDER_KEYS)}")
+    return get_query_log().stats(top_n=top_n, order_by=order_by)
+
+
+if settings.debug or settings.env != "production":
+    app.include_router(debug_router)
 
 
 @app.get("/debug/config")
@@ -9,6 +9,7 @@ from sklearn.metrics.pairwise import cosine_similarity
 import logging
 
 from .embedding_service import get_embedding_service
+from app.utils.topk import TopK
 
 logger = logging.getLogger(__name__)
 
@@ -261,10 +262,14 @@ class MatchingService:
         seeker_text = self.embedding_service.create_seeker_text(seeker_profile)
         seeker_embedding = self.embedding_service.encode_text(seeker_text)
 
-        # ステップ3: 各求人とのスコアを計算
-        recommendations = []
+        # ステップ3: 各求人とのスコアを計算（上位K件のみ保持）
+        top = TopK(top_k)
 
         for job in filtered_jobs:
+            # 上位K件がすべて満点なら、残りの求人が入る余地はない
+            if not top.can_accept(100.0):
+                break
+
             # 求人をベクトル化
             job_text = self.embedding_service.create_job_text(job)
             job_embedding = self.embedding_service.encode_text(job_text)
@@ -284,6 +289,9 @@ class MatchingService:
 
             logger.debug(f"Job {job.get('id')}: base={base_score:.1f}, skill_bonus={skill_bonus:.1f}, final={match_score:.1f}")
 
+            if not top.can_accept(match_score):
+                continue
+
             # マッチング理由を生成
             match_reasons = self.generate_match_reasons(job, seeker_profile, match_score)
 
@@ -293,13 +301,10 @@ class MatchingService:
                 match_score=match_score,
                 match_reasons=match_reasons
             )
-            recommendations.append(recommendation)
-
-        # スコア降順でソート
-        recommendations.sort(key=lambda x: x.match_score, reverse=True)
+            top.push(match_score, recommendation)
 
-        # Top-K を返す
-        return recommendations[:top_k]
+        # スコア降順の Top-K を返す
+        return top.items()
 
 
 # グローバルインスタンス
@@ -5,6 +5,7 @@
 from app.models.user import User, UserRole
 from app.models.job import Job, JobStatus, EmploymentType
 from app.models.application import Application, ApplicationStatus
+from app.models.employer_stats import EmployerStats
 from app.models.scout import Scout, ScoutStatus
 from app.models.resume import Resume
 from app.models.company import Company
@@ -27,6 +28,8 @@ __all__ = [
     # 応募関連
     "Application",
     "ApplicationStatus",
+    # 企業統計
+    "EmployerStats",
     # スカウト関連
     "Scout",
     "ScoutStatus",
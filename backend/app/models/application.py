@@ -4,7 +4,7 @@
 """
 from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum, Integer
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 import enum
 from app.db.base import Base
 
@@ -27,7 +27,10 @@ class Application(Base):
     job_id = Column(String(36), ForeignKey("jobs.id"), nullable=False, index=True)
 
     # ステータス
-    status = Column(Enum(ApplicationStatus), default=ApplicationStatus.SCREENING, nullable=False)
+    # 変更前の値を常に読み込む（期限切れのインスタンスでも employer_stats の状態遷移を検出できるように）
+    status = column_property(
+        Column(Enum(ApplicationStatus), default=ApplicationStatus.SCREENING, nullable=False), active_history=True
+    )
     status_detail = Column(String(100), nullable=True)  # 「一次面接待ち」など
     status_color = Column(String(20), default="yellow", nullable=True)  # UI表示用
 
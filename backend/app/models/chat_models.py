@@ -65,6 +65,7 @@ class JobRecommendation(BaseModel):
     salary_max: Optional[int]
     location: str
     remote_option: str
+    search_plan: Optional[str] = None  # 条件緩和の段階（strict, no_location, ...）
 
 
 class ChatTurnResult(BaseModel):
@@ -0,0 +1,218 @@
+# app/models/employer_stats.py
+"""
+企業ダッシュボード統計モデル
+求人・応募のステータス別件数を企業ごとに1行で保持し、状態遷移のたびに同じトランザクション内で更新する
+"""
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, distinct, event, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+from app.models.job import Job, JobStatus
+from app.models.application import Application, ApplicationStatus
+
+# ステータス → カウンターカラム
+JOB_STATUS_COLUMNS = {
+    JobStatus.DRAFT: "jobs_draft",
+    JobStatus.PUBLISHED: "jobs_published",
+    JobStatus.CLOSED: "jobs_closed",
+}
+APPLICATION_STATUS_COLUMNS = {
+    ApplicationStatus.SCREENING: "applications_screening",
+    ApplicationStatus.INTERVIEW: "applications_interview",
+    ApplicationStatus.OFFERED: "applications_offered",
+    ApplicationStatus.REJECTED: "applications_rejected",
+    ApplicationStatus.WITHDRAWN: "applications_withdrawn",
+}
+COUNTER_COLUMNS = list(JOB_STATUS_COLUMNS.values()) + list(APPLICATION_STATUS_COLUMNS.values())
+
+
+class EmployerStats(Base):
+    """企業統計テーブル（1企業1行）"""
+    __tablename__ = "employer_stats"
+
+    employer_id = Column(String(36), ForeignKey("users.id"), primary_key=True)
+
+    # 求人（ステータス別）
+    jobs_draft = Column(Integer, default=0, nullable=False)
+    jobs_published = Column(Integer, default=0, nullable=False)
+    jobs_closed = Column(Integer, default=0, nullable=False)
+
+    # 応募（ステータス別）
+    applications_screening = Column(Integer, default=0, nullable=False)
+    applications_interview = Column(Integer, default=0, nullable=False)
+    applications_offered = Column(Integer, default=0, nullable=False)
+    applications_rejected = Column(Integer, default=0, nullable=False)
+    applications_withdrawn = Column(Integer, default=0, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    @property
+    def total_jobs(self) -> int:
+        return sum(getattr(self, c) for c in JOB_STATUS_COLUMNS.values())
+
+    @property
+    def total_applications(self) -> int:
+        return sum(getattr(self, c) for c in APPLICATION_STATUS_COLUMNS.values())
+
+    def __repr__(self):
+        return f"<EmployerStats {self.employer_id}>"
+
+
+def employer_stats_query():
+    """
+    求人・応募のステータス別件数を企業ごとに集計するクエリ（FILTER 集計の1クエリ）
+
+    応募は求人に外部結合するため、求人件数は DISTINCT で数える
+    """
+    columns = [Job.employer_id.label("employer_id")]
+    for job_status, name in JOB_STATUS_COLUMNS.items():
+        columns.append(func.count(distinct(Job.id)).filter(Job.status == job_status).label(name))
+    for app_status, name in APPLICATION_STATUS_COLUMNS.items():
+        columns.append(func.count(Application.id).filter(Application.status == app_status).label(name))
+
+    return (
+        select(*columns)
+        .select_from(Job)
+        .outerjoin(Application, Application.job_id == Job.id)
+        .group_by(Job.employer_id)
+    )
+
+
+def compute_employer_stats(connection, employer_id: str) -> Dict[str, int]:
+    """1企業分の件数を集計（求人がない企業はすべて0）"""
+    row = connection.execute(
+        employer_stats_query().where(Job.employer_id == employer_id)
+    ).mappings().first()
+    return {name: int(row[name]) if row else 0 for name in COUNTER_COLUMNS}
+
+
+def _insert_if_missing(connection, employer_id: str, counts: Dict[str, int]) -> bool:
+    """
+    統計行を作成（INSERT ... ON CONFLICT DO NOTHING）
+
+    同じ企業の最初の書き込みが並行した場合に、後から来た側が主キー違反で
+    ユーザーの書き込みごと失敗しないようにする
+
+    Returns:
+        行を作成した場合は True（他のトランザクションが先に作成していた場合は False）
+    """
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    statement = (
+        dialect.insert(EmployerStats.__table__)
+        .values(employer_id=employer_id, **counts)
+        .on_conflict_do_nothing(index_elements=["employer_id"])
+    )
+    return connection.execute(statement).rowcount > 0
+
+
+def rebuild_employer_stats(connection, employer_id: str) -> Dict[str, int]:
+    """1企業分の統計行を集計し直して保存"""
+    counts = compute_employer_stats(connection, employer_id)
+    table = EmployerStats.__table__
+    statement = update(table).where(table.c.employer_id == employer_id).values(**counts, updated_at=func.now())
+
+    if connection.execute(statement).rowcount == 0 and not _insert_if_missing(connection, employer_id, counts):
+        connection.execute(statement)
+    return counts
+
+
+def _apply_delta(connection, employer_id: Optional[str], deltas: Dict[str, int]) -> None:
+    """カウンターを増減（行がなければ集計して作成）"""
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not employer_id or not deltas:
+        return
+
+    table = EmployerStats.__table__
+    values: Dict[str, Any] = {name: table.c[name] + delta for name, delta in deltas.items()}
+    statement = update(table).where(table.c.employer_id == employer_id).values(**values, updated_at=func.now())
+    if connection.execute(statement).rowcount > 0:
+        return
+
+    # 行がなければ集計して作成（既に flush 済みの変更を含めて集計されるため、差分の適用は不要）。
+    # 並行した別のトランザクションが先に作成していた場合、その集計には
+    # この変更が含まれないので、作成された行に差分を適用する
+    if not _insert_if_missing(connection, employer_id, compute_employer_stats(connection, employer_id)):
+        connection.execute(statement)
+
+
+def _status_change(target, enum_cls):
+    """status 属性の (変更前, 変更後)。変更がなければ None"""
+    history = inspect(target).attrs.status.history
+    if not history.has_changes() or not history.deleted or not history.added:
+        return None
+    old, new = history.deleted[0], history.added[0]
+    old = enum_cls(old) if old is not None else None
+    new = enum_cls(new) if new is not None else None
+    return (old, new) if old != new else None
+
+
+def _job_employer_id(connection, job_id: str) -> Optional[str]:
+    return connection.scalar(select(Job.employer_id).where(Job.id == job_id))
+
+
+# === 求人の状態遷移 ===
+
+@event.listens_for(Job, "after_insert")
+def _job_inserted(mapper, connection, target: Job) -> None:
+    job_status = JobStatus(target.status or JobStatus.DRAFT)
+    _apply_delta(connection, target.employer_id, {JOB_STATUS_COLUMNS[job_status]: 1})
+
+
+@event.listens_for(Job, "after_update")
+def _job_updated(mapper, connection, target: Job) -> None:
+    change = _status_change(target, JobStatus)
+    if change is None:
+        return
+    old, new = change
+    deltas: Dict[str, int] = {}
+    if old is not None:
+        deltas[JOB_STATUS_COLUMNS[old]] = -1
+    if new is not None:
+        deltas[JOB_STATUS_COLUMNS[new]] = deltas.get(JOB_STATUS_COLUMNS[new], 0) + 1
+    _apply_delta(connection, target.employer_id, deltas)
+
+
+@event.listens_for(Job, "after_delete")
+def _job_deleted(mapper, connection, target: Job) -> None:
+    # 求人に紐づく応募の扱いが削除方法によって変わるため、集計し直す
+    if target.employer_id:
+        rebuild_employer_stats(connection, target.employer_id)
+
+
+# === 応募の状態遷移 ===
+
+@event.listens_for(Application, "after_insert")
+def _application_inserted(mapper, connection, target: Application) -> None:
+    app_status = ApplicationStatus(target.status or ApplicationStatus.SCREENING)
+    _apply_delta(
+        connection,
+        _job_employer_id(connection, target.job_id),
+        {APPLICATION_STATUS_COLUMNS[app_status]: 1},
+    )
+
+
+@event.listens_for(Application, "after_update")
+def _application_updated(mapper, connection, target: Application) -> None:
+    change = _status_change(target, ApplicationStatus)
+    if change is None:
+        return
+    old, new = change
+    deltas: Dict[str, int] = {}
+    if old is not None:
+        deltas[APPLICATION_STATUS_COLUMNS[old]] = -1
+    if new is not None:
+        deltas[APPLICATION_STATUS_COLUMNS[new]] = deltas.get(APPLICATION_STATUS_COLUMNS[new], 0) + 1
+    _apply_delta(connection, _job_employer_id(connection, target.job_id), deltas)
+
+
+@event.listens_for(Application, "after_delete")
+def _application_deleted(mapper, connection, target: Application) -> None:
+    app_status = ApplicationStatus(target.status or ApplicationStatus.SCREENING)
+    _apply_delta(
+        connection,
+        _job_employer_id(connection, target.job_id),
+        {APPLICATION_STATUS_COLUMNS[app_status]: -1},
+    )
@@ -2,11 +2,18 @@
 """
 求人モデル
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer, ForeignKey, Enum, event
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import defer, deferred, load_only, query_expression, relationship, with_expression, column_property
 import enum
 from app.db.base import Base
+from app.db.types import EmbeddingVector, JSONType
+from app.utils.normalization import salary_to_yen
+from app.utils.count_cache import has_relevant_changes, invalidate_on_commit
+
+
+# 一覧カードの説明文の長さ
+DESCRIPTION_PREVIEW_LENGTH = 200
 
 
 class JobStatus(str, enum.Enum):
@@ -43,32 +50,121 @@ class Job(Base):
     salary_max = Column(Integer, nullable=True)
     salary_text = Column(String(200), nullable=True)
 
+    # 検索用の正規化年収（円単位、書き込み時に自動更新）
+    salary_min_yen = Column(Integer, nullable=True, index=True)
+    salary_max_yen = Column(Integer, nullable=True, index=True)
+
     # 必須・歓迎スキル
-    required_skills = Column(Text, nullable=True)  # JSON文字列
-    preferred_skills = Column(Text, nullable=True)  # JSON文字列
+    required_skills = Column(JSONType, nullable=True)  # スキル名のリスト
+    preferred_skills = Column(JSONType, nullable=True)  # スキル名のリスト
 
     # 詳細情報
     requirements = Column(Text, nullable=True)
     benefits = Column(Text, nullable=True)
-    tags = Column(Text, nullable=True)  # JSON文字列
+    tags = Column(JSONType, nullable=True)  # タグのリスト
 
     # リモートワーク
     remote = Column(Boolean, default=False, nullable=False)
 
     # ステータス
-    status = Column(Enum(JobStatus), default=JobStatus.DRAFT, nullable=False)
+    # 変更前の値を常に読み込む（期限切れのインスタンスでも employer_stats の状態遷移を検出できるように）
+    status = column_property(
+        Column(Enum(JobStatus), default=JobStatus.DRAFT, nullable=False), active_history=True
+    )
     featured = Column(Boolean, default=False, nullable=False)
+    view_count = Column(Integer, default=0, server_default="0", nullable=False)  # 閲覧数（CounterBuffer で加算）
 
-    # エンベディング（AIマッチング用）
-    embedding = Column(Text, nullable=True)  # JSON文字列（ベクトル）
+    # エンベディング（AIマッチング用。一覧・詳細では使わないため、アクセスした時点で読み込む）
+    embedding = deferred(Column(EmbeddingVector, nullable=True))  # float32 のバイナリ
 
     # メタデータ
-    meta_data = Column(Text, nullable=True)  # JSON文字列
+    meta_data = Column(JSONType, nullable=True)
 
     # 日時
     posted_date = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
+    # 一覧用に先頭だけ読み込んだ description（"card" プロファイルで設定）
+    description_preview = query_expression()
+
+    def description_summary(self, length: int = DESCRIPTION_PREVIEW_LENGTH) -> str:
+        """一覧表示用の説明文（length 文字を超える場合は省略）"""
+        text = self.description_preview
+        if text is None:
+            text = self.description or ""
+        return text[:length] + "..." if len(text) > length else text
+
     def __repr__(self):
         return f"<Job {self.title} by {self.company}>"
+
+
+# === 読み込みプロファイル ===
+# 一覧では説明文・応募要件・福利厚生・メタデータ・エンベディングを読み込まない。
+# プロファイル外のカラムにアクセスすると（遅延ロードせず）例外になる。
+JOB_CARD_COLUMNS = (
+    Job.id,
+    Job.employer_id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.employment_type,
+    Job.salary_min,
+    Job.salary_max,
+    Job.salary_text,
+    Job.required_skills,
+    Job.tags,
+    Job.remote,
+    Job.status,
+    Job.featured,
+    Job.posted_date,
+    Job.created_at,
+    Job.updated_at,
+)
+
+
+def job_load_options(profile: str) -> list:
+    """
+    求人クエリの読み込みオプション（Query.options() / select().options() に渡す）
+
+    Args:
+        profile:
+            "card": 一覧カード用（カード表示のカラムと説明文の先頭のみ）
+            "editor": 企業の求人管理一覧用（メタデータ以外のすべて）
+            "detail": 詳細用（エンベディング以外のすべて）
+    """
+    if profile == "card":
+        return [
+            load_only(*JOB_CARD_COLUMNS, raiseload=True),
+            # 省略記号を付けるか判定するため1文字多く読む
+            with_expression(
+                Job.description_preview, func.substr(Job.description, 1, DESCRIPTION_PREVIEW_LENGTH + 1)
+            ),
+        ]
+    if profile == "editor":
+        return [defer(Job.meta_data, raiseload=True)]
+    if profile == "detail":
+        return []
+    raise ValueError(f"unknown job load profile: {profile}")
+
+
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def _sync_salary_yen(mapper, connection, target: Job) -> None:
+    """salary_min/max（万円または円）から円単位の正規化カラムを更新"""
+    target.salary_min_yen = salary_to_yen(target.salary_min)
+    target.salary_max_yen = salary_to_yen(target.salary_max)
+
+
+@event.listens_for(Job, "after_insert")
+@event.listens_for(Job, "after_delete")
+def _invalidate_job_counts(mapper, connection, target: Job) -> None:
+    """求人の総件数キャッシュをコミット後に破棄"""
+    invalidate_on_commit(target, "jobs")
+
+
+@event.listens_for(Job, "after_update")
+def _invalidate_job_counts_on_update(mapper, connection, target: Job) -> None:
+    # updated_at のみの更新では破棄しない
+    if has_relevant_changes(target, ("updated_at",)):
+        invalidate_on_commit(target, "jobs")
@@ -45,5 +45,9 @@ class Scout(Base):
     read_at = Column(DateTime(timezone=True), nullable=True)
     replied_at = Column(DateTime(timezone=True), nullable=True)
 
+    # リレーション（暗黙の遅延ロードによる N+1 を防ぐため、joinedload 等で明示的に読み込む）
+    employer = relationship("User", foreign_keys=[employer_id], lazy="raise")
+    seeker = relationship("User", foreign_keys=[seeker_id], lazy="raise")
+
     def __repr__(self):
         return f"<Scout {self.id} - Employer:{self.employer_id} Seeker:{self.seeker_id}>"
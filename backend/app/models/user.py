@@ -2,10 +2,13 @@
 """
 ユーザーモデル（求職者・企業）
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Enum, Integer, event
 from sqlalchemy.sql import func
 import enum
 from app.db.base import Base
+from app.db.types import JSONType
+from app.utils.normalization import salary_to_yen, experience_to_years
+from app.utils.count_cache import has_relevant_changes, invalidate_on_commit
 
 
 class UserRole(str, enum.Enum):
@@ -32,10 +35,13 @@ class User(Base):
     line_linked_at = Column(DateTime(timezone=True), nullable=True)
 
     # 求職者固有フィールド
-    skills = Column(Text, nullable=True)  # JSON文字列
+    skills = Column(JSONType, nullable=True)  # スキル名のリスト
     experience_years = Column(String(20), nullable=True)
+    experience_years_num = Column(Integer, nullable=True, index=True)  # 検索用（年数の整数値）
     desired_salary_min = Column(String(50), nullable=True)
     desired_salary_max = Column(String(50), nullable=True)
+    desired_salary_min_yen = Column(Integer, nullable=True, index=True)  # 検索用（円単位）
+    desired_salary_max_yen = Column(Integer, nullable=True, index=True)  # 検索用（円単位）
     desired_location = Column(String(100), nullable=True)
     desired_employment_type = Column(String(50), nullable=True)
     resume_url = Column(String(500), nullable=True)
@@ -66,3 +72,26 @@ class User(Base):
 
     def __repr__(self):
         return f"<User {self.email} ({self.role})>"
+
+
+@event.listens_for(User, "before_insert")
+@event.listens_for(User, "before_update")
+def _sync_normalized_profile(mapper, connection, target: User) -> None:
+    """文字列で保持しているプロフィール項目から検索用の正規化カラムを更新"""
+    target.experience_years_num = experience_to_years(target.experience_years)
+    target.desired_salary_min_yen = salary_to_yen(target.desired_salary_min)
+    target.desired_salary_max_yen = salary_to_yen(target.desired_salary_max)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_delete")
+def _invalidate_candidate_counts(mapper, connection, target: User) -> None:
+    """候補者の総件数キャッシュをコミット後に破棄"""
+    invalidate_on_commit(target, "candidates")
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_candidate_counts_on_update(mapper, connection, target: User) -> None:
+    # ログイン日時などの件数に影響しない更新では破棄しない
+    if has_relevant_changes(target, ("updated_at", "last_login_at")):
+        invalidate_on_commit(target, "candidates")
@@ -18,6 +18,7 @@ class UserPreferencesProfile(Base):
     location_city = Column(String(100))
     salary_min = Column(Integer)
     salary_max = Column(Integer)
+    salary_min_yen = Column(Integer, index=True)  # 検索用（円単位）
     remote_work_preference = Column(String(50))
     employment_type = Column(String(50))
     industry_preferences = Column(JSON)  # Array stored as JSON for SQLite compatibility
@@ -3,11 +3,27 @@
 候補者リポジトリ（企業向けの求職者閲覧用）
 """
 from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, or_, select
 
+from app.db.types import json_text
 from app.models.user import User, UserRole
 from app.models.resume import Resume
+from app.utils.normalization import salary_to_yen, experience_to_years
+from app.utils.pagination import keyset_after, keyset_order
+
+
+def _paginate(db_query, skip: int, limit: int, cursor: Optional[str]):
+    """
+    登録日時の新しい順に (created_at, id) でページング（Query / Select 共通）
+
+    cursor 指定時は skip を無視する
+    """
+    if cursor:
+        db_query = db_query.filter(keyset_after(User.created_at, User.id, cursor))
+        skip = 0
+    return db_query.order_by(*keyset_order(User.created_at, User.id)).offset(skip).limit(limit)
 
 
 class CandidateRepository:
@@ -16,17 +32,14 @@ class CandidateRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
-        """全候補者を取得（アクティブな求職者のみ）"""
-        return (
+    def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[User]:
+        """全候補者を取得（アクティブな求職者のみ。cursor 指定時はキーセットで続きを取得）"""
+        db_query = (
             self.db.query(User)
             .filter(User.role == UserRole.SEEKER)
             .filter(User.is_active == True)
-            .order_by(User.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
         )
+        return _paginate(db_query, skip, limit, cursor).all()
 
     def get_by_id(self, candidate_id: str) -> Optional[User]:
         """候補者IDで取得"""
@@ -51,6 +64,13 @@ class CandidateRepository:
             "resume": resume,
         }
 
+    def user_ids_with_resume(self, user_ids: List[str]) -> set:
+        """履歴書を登録済みのユーザーIDを1クエリで取得"""
+        if not user_ids:
+            return set()
+        rows = self.db.query(Resume.user_id).filter(Resume.user_id.in_(user_ids)).distinct().all()
+        return {row[0] for row in rows}
+
     def count(self) -> int:
         """候補者総数"""
         return (
@@ -71,10 +91,64 @@ class CandidateRepository:
         salary_max: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[User]:
-        """候補者を検索"""
+        """候補者を検索（cursor 指定時はキーセットで続きを取得）"""
+        db_query = self._apply_search_filters(
+            self.db.query(User),
+            query=query,
+            skills=skills,
+            location=location,
+            experience_years=experience_years,
+            employment_type=employment_type,
+            salary_min=salary_min,
+            salary_max=salary_max,
+        )
+
+        return _paginate(db_query, skip, limit, cursor).all()
+
+    def search_count(
+        self,
+        query: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        experience_years: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+    ) -> int:
+        """検索結果の件数"""
+        db_query = self._apply_search_filters(
+            self.db.query(User),
+            query=query,
+            skills=skills,
+            location=location,
+            experience_years=experience_years,
+            employment_type=employment_type,
+            salary_min=salary_min,
+            salary_max=salary_max,
+        )
+
+        return db_query.count()
+
+    @staticmethod
+    def _apply_search_filters(
+        db_query,
+        query: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        experience_years: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+    ):
+        """
+        候補者検索の条件を適用
+
+        Query（同期）と select()（非同期）のどちらにも使えるよう filter() だけで組み立てる
+        """
         db_query = (
-            self.db.query(User)
+            db_query
             .filter(User.role == UserRole.SEEKER)
             .filter(User.is_active == True)
         )
@@ -84,68 +158,113 @@ class CandidateRepository:
             db_query = db_query.filter(
                 or_(
                     User.name.ilike(search_pattern),
-                    User.skills.ilike(search_pattern),
+                    json_text(User.skills).ilike(search_pattern),
                 )
             )
 
         if skills:
             for skill in skills:
-                db_query = db_query.filter(User.skills.ilike(f"%{skill}%"))
+                db_query = db_query.filter(json_text(User.skills).ilike(f"%{skill}%"))
 
         if location:
             db_query = db_query.filter(User.desired_location.ilike(f"%{location}%"))
 
         if experience_years:
-            db_query = db_query.filter(User.experience_years == experience_years)
+            db_query = CandidateRepository._filter_experience(db_query, experience_years)
 
         if employment_type:
             db_query = db_query.filter(User.desired_employment_type == employment_type)
 
-        if salary_min is not None:
+        return CandidateRepository._filter_salary(db_query, salary_min, salary_max)
+
+    @staticmethod
+    def _filter_experience(db_query, experience_years: str):
+        """経験年数（整数の正規化カラム）で「N年以上」として絞り込み"""
+        min_years = experience_to_years(experience_years)
+        if min_years is None:
+            return db_query.filter(User.experience_years == experience_years)
+        return db_query.filter(User.experience_years_num >= min_years)
+
+    @staticmethod
+    def _filter_salary(db_query, salary_min: Optional[int], salary_max: Optional[int]):
+        """希望年収（円単位の正規化カラム）で絞り込み。希望年収未設定の候補者は残す"""
+        salary_min_yen = salary_to_yen(salary_min)
+        if salary_min_yen is not None:
             db_query = db_query.filter(
                 or_(
-                    User.desired_salary_min.is_(None),
-                    User.desired_salary_min.cast(db_query.column_descriptions[0]['type']) >= str(salary_min),
+                    User.desired_salary_min_yen.is_(None),
+                    User.desired_salary_min_yen >= salary_min_yen,
                 )
             )
 
-        return db_query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
-
-    def search_count(
-        self,
-        query: Optional[str] = None,
-        skills: Optional[List[str]] = None,
-        location: Optional[str] = None,
-        experience_years: Optional[str] = None,
-        employment_type: Optional[str] = None,
-    ) -> int:
-        """検索結果の件数"""
-        db_query = (
-            self.db.query(User)
-            .filter(User.role == UserRole.SEEKER)
-            .filter(User.is_active == True)
-        )
-
-        if query:
-            search_pattern = f"%{query}%"
+        salary_max_yen = salary_to_yen(salary_max)
+        if salary_max_yen is not None:
             db_query = db_query.filter(
                 or_(
-                    User.name.ilike(search_pattern),
-                    User.skills.ilike(search_pattern),
+                    User.desired_salary_min_yen.is_(None),
+                    User.desired_salary_min_yen <= salary_max_yen,
                 )
             )
 
-        if skills:
-            for skill in skills:
-                db_query = db_query.filter(User.skills.ilike(f"%{skill}%"))
+        return db_query
 
-        if location:
-            db_query = db_query.filter(User.desired_location.ilike(f"%{location}%"))
 
-        if experience_years:
-            db_query = db_query.filter(User.experience_years == experience_years)
+class AsyncCandidateRepository:
+    """候補者リポジトリ（非同期セッション版）"""
 
-        if employment_type:
-            db_query = db_query.filter(User.desired_employment_type == employment_type)
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
-        return db_query.count()
+    @staticmethod
+    def _active_seekers():
+        return select(User).where(User.role == UserRole.SEEKER, User.is_active == True)
+
+    async def get_all(self, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[User]:
+        """全候補者を取得（アクティブな求職者のみ）"""
+        stmt = _paginate(self._active_seekers(), skip, limit, cursor)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def count(self) -> int:
+        """候補者総数"""
+        return await self.db.scalar(
+            select(func.count()).select_from(self._active_seekers().subquery())
+        )
+
+    async def get_with_resume(self, candidate_id: str) -> Optional[dict]:
+        """候補者と履歴書を取得"""
+        user = await self.db.scalar(self._active_seekers().where(User.id == candidate_id))
+        if not user:
+            return None
+
+        resume = await self.db.scalar(select(Resume).where(Resume.user_id == candidate_id).limit(1))
+
+        return {
+            "user": user,
+            "resume": resume,
+        }
+
+    async def search(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        **filters,
+    ) -> List[User]:
+        """候補者を検索（filters は CandidateRepository.search と同じ）"""
+        stmt = CandidateRepository._apply_search_filters(select(User), **filters)
+        stmt = _paginate(stmt, skip, limit, cursor)
+        return list((await self.db.scalars(stmt)).all())
+
+    async def search_count(self, **filters) -> int:
+        """検索結果の件数"""
+        stmt = CandidateRepository._apply_search_filters(select(User), **filters)
+        return await self.db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+    async def user_ids_with_resume(self, user_ids: List[str]) -> set:
+        """履歴書を登録済みのユーザーIDを1クエリで取得"""
+        if not user_ids:
+            return set()
+        rows = await self.db.scalars(
+            select(Resume.user_id).where(Resume.user_id.in_(user_ids)).distinct()
+        )
+        return set(rows)
@@ -2,12 +2,17 @@
 """
 求人リポジトリ
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, select
 
 from app.repositories.base import BaseRepository
-from app.models.job import Job, JobStatus, EmploymentType
+from app.models.job import Job, JobStatus, EmploymentType, job_load_options
+from app.models.application import Application
+from app.utils.normalization import salary_to_yen
+from app.utils.pagination import keyset_after, keyset_order
+from app.db.counter_buffer import record_job_view
+from app.db.job_search import get_job_search_backend
 
 
 class JobRepository(BaseRepository[Job]):
@@ -17,9 +22,10 @@ class JobRepository(BaseRepository[Job]):
         super().__init__(Job, db)
 
     def get_published(self, skip: int = 0, limit: int = 100) -> List[Job]:
-        """公開中の求人を取得"""
+        """公開中の求人を取得（一覧カードのカラムのみ）"""
         return (
             self.db.query(Job)
+            .options(*job_load_options("card"))
             .filter(Job.status == JobStatus.PUBLISHED)
             .order_by(Job.created_at.desc())
             .offset(skip)
@@ -31,6 +37,7 @@ class JobRepository(BaseRepository[Job]):
         """企業IDで求人を取得"""
         return (
             self.db.query(Job)
+            .options(*job_load_options("editor"))
             .filter(Job.employer_id == employer_id)
             .order_by(Job.created_at.desc())
             .offset(skip)
@@ -38,6 +45,39 @@ class JobRepository(BaseRepository[Job]):
             .all()
         )
 
+    def get_by_employer_with_application_counts(
+        self,
+        employer_id: str,
+        status: Optional[JobStatus] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Tuple[Job, int]]:
+        """
+        企業の求人と各求人の応募数を1クエリで取得
+
+        応募数は job_id ごとの GROUP BY 集計を求人ページに外部結合して求める
+        （応募のない求人は0件）
+        """
+        counts = (
+            select(Application.job_id, func.count(Application.id).label("applications_count"))
+            .join(Job, Job.id == Application.job_id)
+            .where(Job.employer_id == employer_id)
+            .group_by(Application.job_id)
+            .subquery()
+        )
+
+        query = (
+            self.db.query(Job, func.coalesce(counts.c.applications_count, 0))
+            .options(*job_load_options("editor"))
+            .outerjoin(counts, counts.c.job_id == Job.id)
+            .filter(Job.employer_id == employer_id)
+        )
+        if status is not None:
+            query = query.filter(Job.status == status)
+
+        rows = query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
+        return [(job, int(count)) for job, count in rows]
+
     def count_by_employer(self, employer_id: str) -> int:
         """企業の求人件数"""
         return self.db.query(Job).filter(Job.employer_id == employer_id).count()
@@ -64,19 +104,49 @@ class JobRepository(BaseRepository[Job]):
         salary_min: Optional[int] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Job]:
-        """求人を検索"""
+        """
+        求人を検索（一覧カードのカラムのみ）
+
+        キーワード指定時は全文検索の関連度順（cursor は無視）、
+        それ以外は掲載日の新しい順（cursor 指定時はキーセットで続きを取得）
+        """
+        db_query, relevance_order = self._search_query(query, location, employment_type, remote_ok, salary_min)
+        db_query = db_query.options(*job_load_options("card"))
+        if relevance_order is not None:
+            return db_query.order_by(*relevance_order).offset(skip).limit(limit).all()
+        if cursor:
+            db_query = db_query.filter(keyset_after(Job.posted_date, Job.id, cursor))
+            skip = 0
+        return db_query.order_by(*keyset_order(Job.posted_date, Job.id)).offset(skip).limit(limit).all()
+
+    def search_count(
+        self,
+        query: Optional[str] = None,
+        location: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        remote_ok: Optional[bool] = None,
+        salary_min: Optional[int] = None,
+    ) -> int:
+        """検索結果の件数"""
+        db_query, _ = self._search_query(query, location, employment_type, remote_ok, salary_min)
+        return db_query.count()
+
+    def _search_query(
+        self,
+        query: Optional[str],
+        location: Optional[str],
+        employment_type: Optional[str],
+        remote_ok: Optional[bool],
+        salary_min: Optional[int],
+    ):
+        """求人検索の条件を適用したクエリと、関連度順の ORDER BY（キーワードなしは None）"""
         db_query = self.db.query(Job).filter(Job.status == JobStatus.PUBLISHED)
 
-        if query:
-            search_pattern = f"%{query}%"
-            db_query = db_query.filter(
-                or_(
-                    Job.title.ilike(search_pattern),
-                    Job.description.ilike(search_pattern),
-                    Job.required_skills.ilike(search_pattern),
-                )
-            )
+        relevance_order = None
+        if query and query.strip():
+            db_query, relevance_order = get_job_search_backend().apply(db_query, query.strip())
 
         if location:
             db_query = db_query.filter(Job.location.ilike(f"%{location}%"))
@@ -85,16 +155,15 @@ class JobRepository(BaseRepository[Job]):
             db_query = db_query.filter(Job.employment_type == employment_type)
 
         if remote_ok is not None:
-            db_query = db_query.filter(Job.remote_ok == remote_ok)
+            db_query = db_query.filter(Job.remote == remote_ok)
 
-        if salary_min is not None:
-            db_query = db_query.filter(Job.salary_min >= salary_min)
+        salary_min_yen = salary_to_yen(salary_min)
+        if salary_min_yen is not None:
+            db_query = db_query.filter(Job.salary_min_yen >= salary_min_yen)
 
-        return db_query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
+        return db_query, relevance_order
 
     def increment_view_count(self, job: Job) -> Job:
-        """閲覧数をインクリメント"""
-        job.view_count = (job.view_count or 0) + 1
-        self.db.commit()
-        self.db.refresh(job)
+        """閲覧数をインクリメント（バッファに加算し、DBへはまとめて反映）"""
+        record_job_view(job.id)
         return job
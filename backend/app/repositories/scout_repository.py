@@ -3,10 +3,11 @@
 スカウトリポジトリ
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.repositories.base import BaseRepository
 from app.models.scout import Scout, ScoutStatus
+from app.utils.pagination import keyset_after, keyset_order
 
 
 class ScoutRepository(BaseRepository[Scout]):
@@ -21,14 +22,15 @@ class ScoutRepository(BaseRepository[Scout]):
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Scout]:
-        """求職者のスカウト一覧を取得"""
+        """求職者のスカウト一覧を取得（cursor 指定時はキーセットで続きを取得）"""
         query = self.db.query(Scout).filter(Scout.seeker_id == seeker_id)
 
         if status:
             query = query.filter(Scout.status == status)
 
-        return query.order_by(Scout.created_at.desc()).offset(skip).limit(limit).all()
+        return self._paginate(query, skip, limit, cursor)
 
     def get_by_employer(
         self,
@@ -36,14 +38,23 @@ class ScoutRepository(BaseRepository[Scout]):
         status: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[Scout]:
-        """企業のスカウト一覧を取得"""
+        """企業のスカウト一覧を取得（cursor 指定時はキーセットで続きを取得）"""
         query = self.db.query(Scout).filter(Scout.employer_id == employer_id)
 
         if status:
             query = query.filter(Scout.status == status)
 
-        return query.order_by(Scout.created_at.desc()).offset(skip).limit(limit).all()
+        return self._paginate(query, skip, limit, cursor)
+
+    def _paginate(self, query, skip: int, limit: int, cursor: Optional[str]) -> List[Scout]:
+        """送信者・受信者を JOIN で読み込み、作成日時の新しい順にページング"""
+        query = query.options(joinedload(Scout.employer), joinedload(Scout.seeker))
+        if cursor:
+            query = query.filter(keyset_after(Scout.created_at, Scout.id, cursor))
+            skip = 0
+        return query.order_by(*keyset_order(Scout.created_at, Scout.id)).offset(skip).limit(limit).all()
 
     def count_by_seeker(self, seeker_id: str) -> int:
         """求職者のスカウト件数"""
@@ -5,8 +5,10 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session
 
+from app.db.types import json_text
 from app.repositories.base import BaseRepository
 from app.models.user import User, UserRole
+from app.utils.normalization import experience_to_years
 
 
 class UserRepository(BaseRepository[User]):
@@ -70,11 +72,15 @@ class UserRepository(BaseRepository[User]):
             query = query.filter(User.desired_location.ilike(f"%{location}%"))
 
         if experience_years:
-            query = query.filter(User.experience_years == experience_years)
+            min_years = experience_to_years(experience_years)
+            if min_years is None:
+                query = query.filter(User.experience_years == experience_years)
+            else:
+                query = query.filter(User.experience_years_num >= min_years)
 
         if skills:
             for skill in skills:
-                query = query.filter(User.skills.ilike(f"%{skill}%"))
+                query = query.filter(json_text(User.skills).ilike(f"%{skill}%"))
 
         return query.offset(skip).limit(limit).all()
 
@@ -107,3 +107,5 @@ class EmployerApplicationListResponse(BaseModel):
     """企業向け応募一覧レスポンス"""
     applications: list[EmployerApplicationItem]
     total: int
+    page: int = 1
+    perPage: Optional[int] = None
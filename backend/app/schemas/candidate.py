@@ -57,6 +57,7 @@ class CandidateListResponse(BaseModel):
     total: int
     page: int = 1
     perPage: int = 20
+    nextCursor: Optional[str] = None
 
 
 class CandidateSearchRequest(BaseModel):
@@ -70,3 +71,4 @@ class CandidateSearchRequest(BaseModel):
     salaryMax: Optional[int] = None
     page: int = 1
     perPage: int = 20
+    cursor: Optional[str] = None  # 前ページの nextCursor（指定時は page を無視）
@@ -63,3 +63,4 @@ class JobListResponse(BaseModel):
     total: int
     page: int = 1
     perPage: int = 20
+    nextCursor: Optional[str] = None
@@ -59,3 +59,4 @@ class ScoutListResponse(BaseModel):
     """スカウト一覧レスポンス"""
     scouts: list[ScoutItem]
     total: int
+    nextCursor: Optional[str] = None
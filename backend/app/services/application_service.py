@@ -11,6 +11,7 @@ from app.models.job import Job
 from app.models.user import User
 from app.repositories.application_repository import ApplicationRepository
 from app.repositories.job_repository import JobRepository
+from app.services.employer_stats_service import EmployerStatsService
 
 
 class ApplicationService:
@@ -131,9 +132,10 @@ class ApplicationService:
 
     def get_employer_stats(self, employer_id: str) -> Dict[str, int]:
         """企業の応募統計を取得"""
+        stats = EmployerStatsService(self.db).get_dashboard_stats(employer_id)
         return {
-            "total": self.app_repo.count_by_employer(employer_id),
-            "screening": self.app_repo.count_by_employer_and_status(employer_id, ApplicationStatus.SCREENING),
-            "interview": self.app_repo.count_by_employer_and_status(employer_id, ApplicationStatus.INTERVIEW),
-            "offered": self.app_repo.count_by_employer_and_status(employer_id, ApplicationStatus.OFFERED),
+            "total": stats["total_applications"],
+            "screening": stats["pending_applications"],
+            "interview": stats["interview_applications"],
+            "offered": stats["offer_applications"],
         }
@@ -0,0 +1,201 @@
+"""
+企業向け候補者のバッチスコアリング
+候補者ごとの特徴量を配列にまとめ、NumPyで一括スコア計算する
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.utils.normalization import experience_to_years
+from app.utils.topk import top_k_indices
+
+# JIS X 0401 の都道府県コード順（コード = インデックス + 1）
+PREFECTURES = (
+    "北海道", "青森県", "岩手県", "宮城県", "秋田県", "山形県", "福島県",
+    "茨城県", "栃木県", "群馬県", "埼玉県", "千葉県", "東京都", "神奈川県",
+    "新潟県", "富山県", "石川県", "福井県", "山梨県", "長野県", "岐阜県",
+    "静岡県", "愛知県", "三重県", "滋賀県", "京都府", "大阪府", "兵庫県",
+    "奈良県", "和歌山県", "鳥取県", "島根県", "岡山県", "広島県", "山口県",
+    "徳島県", "香川県", "愛媛県", "高知県", "福岡県", "佐賀県", "長崎県",
+    "熊本県", "大分県", "宮崎県", "鹿児島県", "沖縄県",
+)
+
+# 「東京」「大阪」のように都府県を省略した表記も引けるようにする
+_PREFECTURE_CODES: Dict[str, int] = {}
+for _code, _name in enumerate(PREFECTURES, start=1):
+    _PREFECTURE_CODES[_name] = _code
+    if _name != "北海道":
+        _PREFECTURE_CODES[_name[:-1]] = _code
+
+# スコア配点
+BASE_SCORE = 50
+SKILL_POINTS = 10
+SKILL_POINTS_MAX = 30
+TITLE_POINTS = 20
+EXPERIENCE_POINTS = 15
+LOCATION_POINTS = 10
+REMOTE_POINTS = 10
+
+
+def prefecture_code(name: Optional[str]) -> int:
+    """都道府県名からコードを取得（該当なしは0）"""
+    if not name:
+        return 0
+    return _PREFECTURE_CODES.get(name.strip(), 0)
+
+
+def parse_skills(value: Any) -> List[str]:
+    """users.skills（JSON文字列またはカンマ区切り）をリストに変換"""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(s) for s in value]
+    try:
+        skills = json.loads(value) if isinstance(value, str) else value
+        if isinstance(skills, list):
+            return [str(s) for s in skills]
+        return [str(value)]
+    except (TypeError, ValueError):
+        return [s.strip() for s in str(value).split(",") if s.strip()]
+
+
+class SeekerFeatures:
+    """候補者の特徴量（1行 = 1候補者）"""
+
+    def __init__(self, rows: Iterable[Any]):
+        self.rows: List[Any] = list(rows)
+        self.skills: List[List[str]] = []
+        self.skill_sets: List[frozenset] = []
+        self.job_titles: List[str] = []
+        self.prefectures: List[str] = []
+        self.cities: List[str] = []
+
+        experience = []
+        prefecture_codes = []
+        remote = []
+
+        for row in self.rows:
+            skills = parse_skills(getattr(row, "user_skills", None))
+            self.skills.append(skills)
+            self.skill_sets.append(frozenset(s.lower() for s in skills))
+            self.job_titles.append((getattr(row, "job_title", None) or "").lower())
+
+            prefecture = getattr(row, "location_prefecture", None) or ""
+            self.prefectures.append(prefecture.lower())
+            self.cities.append((getattr(row, "location_city", None) or "").lower())
+            prefecture_codes.append(prefecture_code(prefecture))
+
+            experience.append(getattr(row, "experience_years_num", None) or 0)
+            remote.append("リモート" in (getattr(row, "remote_work_preference", None) or "").lower())
+
+        self.experience = np.asarray(experience, dtype=np.int32)
+        self.prefecture_codes = np.asarray(prefecture_codes, dtype=np.int16)
+        self.remote = np.asarray(remote, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def skill_bitmap(self, vocabulary: List[str]) -> np.ndarray:
+        """語彙（小文字化済み）に対するスキル保有ビットマップ（候補者数 × 語彙数）"""
+        bitmap = np.zeros((len(self.rows), len(vocabulary)), dtype=bool)
+        for j, skill in enumerate(vocabulary):
+            bitmap[:, j] = [skill in skill_set for skill_set in self.skill_sets]
+        return bitmap
+
+
+class CandidateBatchScorer:
+    """企業の要件に対する候補者スコアを一括計算"""
+
+    def __init__(self, requirements: Dict[str, Any]):
+        self.requirements = requirements
+
+        skills = requirements.get("skills") or []
+        self.skill_vocabulary = list(dict.fromkeys(str(s).lower() for s in skills))
+        self.job_title = (requirements.get("job_title") or "").lower()
+        self.min_experience = experience_to_years(requirements.get("experience_years")) or 0
+        self.location = (requirements.get("location") or "").lower()
+        self.location_code = prefecture_code(requirements.get("location"))
+
+        remote_pref = (requirements.get("remote_preference") or "").lower()
+        self.wants_remote = "リモート" in remote_pref or "remote" in remote_pref
+
+    def score(self, features: SeekerFeatures) -> Dict[str, np.ndarray]:
+        """
+        全候補者のスコアと各条件の一致フラグを計算
+
+        Returns:
+            score と各一致フラグ（skill_bitmap, title, experience, location）の配列
+        """
+        n = len(features)
+        score = np.full(n, BASE_SCORE, dtype=np.int32)
+
+        # スキルマッチ（最大30点）
+        skill_bitmap = features.skill_bitmap(self.skill_vocabulary)
+        if self.skill_vocabulary:
+            score += np.minimum(skill_bitmap.sum(axis=1) * SKILL_POINTS, SKILL_POINTS_MAX)
+
+        # 職種マッチ（20点）
+        title_match = np.zeros(n, dtype=bool)
+        if self.job_title:
+            title_match = np.fromiter(
+                (bool(t) and self.job_title in t for t in features.job_titles), dtype=bool, count=n
+            )
+            score += title_match * TITLE_POINTS
+
+        # 経験年数マッチ（15点）
+        experience_match = np.zeros(n, dtype=bool)
+        if self.min_experience:
+            experience_match = (features.experience > 0) & (features.experience >= self.min_experience)
+            score += experience_match * EXPERIENCE_POINTS
+
+        # 勤務地マッチ（10点）：都道府県コード一致、または都道府県・市区町村の部分一致
+        location_match = np.zeros(n, dtype=bool)
+        if self.location:
+            location_match = np.fromiter(
+                (self.location in p or self.location in c for p, c in zip(features.prefectures, features.cities)),
+                dtype=bool,
+                count=n,
+            )
+            if self.location_code:
+                location_match |= features.prefecture_codes == self.location_code
+            score += location_match * LOCATION_POINTS
+
+        # リモートマッチ（10点）
+        if self.wants_remote:
+            score += features.remote * REMOTE_POINTS
+
+        return {
+            "score": np.minimum(score, 100),
+            "skill_bitmap": skill_bitmap,
+            "title": title_match,
+            "experience": experience_match,
+            "location": location_match,
+        }
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """スコア上位k件のインデックス（同点は元の並び順を維持）"""
+        return top_k_indices(scores, k)
+
+    def reasoning(self, result: Dict[str, np.ndarray], features: SeekerFeatures, index: int) -> str:
+        """1候補者分のマッチング理由を生成"""
+        reasons = []
+
+        matched_skills = [
+            skill for skill, hit in zip(self.skill_vocabulary, result["skill_bitmap"][index]) if hit
+        ]
+        if matched_skills:
+            reasons.append(f"スキル一致: {', '.join(matched_skills[:3])}")
+
+        if result["title"][index]:
+            reasons.append("職種一致")
+
+        if result["experience"][index]:
+            reasons.append(f"経験年数: {int(features.experience[index])}年")
+
+        if result["location"][index]:
+            reasons.append("勤務地一致")
+
+        return " / ".join(reasons) if reasons else "候補者として推薦"
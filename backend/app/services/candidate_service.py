@@ -3,13 +3,16 @@
 候補者サービス（企業向け）
 """
 from typing import Optional, List, Dict, Any
-import json
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.models.resume import Resume
-from app.repositories.candidate_repository import CandidateRepository
+from app.repositories.candidate_repository import CandidateRepository, AsyncCandidateRepository
 from app.repositories.resume_repository import ResumeRepository
+from app.utils.count_cache import CountCache, get_count_cache
+from app.utils.normalization import to_str_tuple
+from app.utils.pagination import next_cursor
 
 
 class CandidateService:
@@ -20,17 +23,19 @@ class CandidateService:
         self.candidate_repo = CandidateRepository(db)
         self.resume_repo = ResumeRepository(db)
 
-    def get_candidates(self, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
-        """候補者一覧を取得"""
+    def get_candidates(self, page: int = 1, per_page: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """候補者一覧を取得（cursor 指定時は page を無視してキーセットで続きを取得）"""
         skip = (page - 1) * per_page
-        candidates = self.candidate_repo.get_all(skip=skip, limit=per_page)
-        total = self.candidate_repo.count()
+        rows = self.candidate_repo.get_all(skip=skip, limit=per_page + 1, cursor=cursor)
+        candidates, cursor_for_next = next_cursor(rows, per_page, "created_at")
+        total = get_count_cache().get_or_compute("candidates", CountCache.make_key(), self.candidate_repo.count)
 
         return {
-            "candidates": [self.candidate_to_item(c) for c in candidates],
+            "candidates": self.candidates_to_items(candidates),
             "total": total,
             "page": page,
             "per_page": per_page,
+            "next_cursor": cursor_for_next,
         }
 
     def get_candidate_detail(self, candidate_id: str) -> Optional[Dict[str, Any]]:
@@ -55,96 +60,188 @@ class CandidateService:
         salary_max: Optional[int] = None,
         page: int = 1,
         per_page: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """候補者を検索"""
+        """候補者を検索（cursor 指定時は page を無視してキーセットで続きを取得）"""
+        filters = {
+            "query": query,
+            "skills": skills,
+            "location": location,
+            "experience_years": experience_years,
+            "employment_type": employment_type,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+        }
         skip = (page - 1) * per_page
-        candidates = self.candidate_repo.search(
-            query=query,
-            skills=skills,
-            location=location,
-            experience_years=experience_years,
-            employment_type=employment_type,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            skip=skip,
-            limit=per_page,
-        )
-
-        total = self.candidate_repo.search_count(
-            query=query,
-            skills=skills,
-            location=location,
-            experience_years=experience_years,
-            employment_type=employment_type,
+        rows = self.candidate_repo.search(skip=skip, limit=per_page + 1, cursor=cursor, **filters)
+        candidates, cursor_for_next = next_cursor(rows, per_page, "created_at")
+        total = get_count_cache().get_or_compute(
+            "candidates",
+            CountCache.make_key(**filters),
+            lambda: self.candidate_repo.search_count(**filters),
         )
 
         return {
-            "candidates": [self.candidate_to_item(c) for c in candidates],
+            "candidates": self.candidates_to_items(candidates),
             "total": total,
             "page": page,
             "per_page": per_page,
+            "next_cursor": cursor_for_next,
         }
 
+    def candidates_to_items(self, users: List[User]) -> List[Dict[str, Any]]:
+        """ページ内の履歴書有無を1クエリで引いてからリストアイテムに変換"""
+        with_resume = self.candidate_repo.user_ids_with_resume([u.id for u in users])
+        return [candidate_to_item(u, u.id in with_resume) for u in users]
+
     def candidate_to_item(self, user: User) -> Dict[str, Any]:
         """候補者をリストアイテム形式に変換"""
-        skills = []
-        if user.skills:
-            try:
-                skills = json.loads(user.skills)
-            except:
-                skills = [user.skills]
-
-        desired_salary = ""
-        if user.desired_salary_min and user.desired_salary_max:
-            desired_salary = f"{user.desired_salary_min}万円〜{user.desired_salary_max}万円"
-        elif user.desired_salary_min:
-            desired_salary = f"{user.desired_salary_min}万円〜"
+        return candidate_to_item(user, self.resume_repo.exists_for_user(user.id))
+
+    def candidate_to_detail(self, user: User, resume: Optional[Resume] = None) -> Dict[str, Any]:
+        """候補者を詳細形式に変換"""
+        has_resume = resume is not None or self.resume_repo.exists_for_user(user.id)
+        return candidate_to_detail(user, resume, has_resume)
+
+
+class AsyncCandidateService:
+    """候補者サービス（非同期セッション版）"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.candidate_repo = AsyncCandidateRepository(db)
+
+    async def get_candidates(self, page: int = 1, per_page: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """候補者一覧を取得（cursor 指定時は page を無視してキーセットで続きを取得）"""
+        skip = (page - 1) * per_page
+        rows = await self.candidate_repo.get_all(skip=skip, limit=per_page + 1, cursor=cursor)
+        candidates, cursor_for_next = next_cursor(rows, per_page, "created_at")
+        total = await get_count_cache().aget_or_compute("candidates", CountCache.make_key(), self.candidate_repo.count)
 
         return {
-            "id": user.id,
-            "name": user.name,
-            "skills": skills[:5] if isinstance(skills, list) else [],
-            "experienceYears": user.experience_years,
-            "desiredLocation": user.desired_location,
-            "desiredSalary": desired_salary,
-            "desiredEmploymentType": user.desired_employment_type,
-            "profileCompletion": user.profile_completion,
-            "createdAt": user.created_at.isoformat() if user.created_at else None,
-            "hasResume": self.resume_repo.exists_for_user(user.id),
+            "candidates": await self._to_items(candidates),
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": cursor_for_next,
         }
 
-    def candidate_to_detail(self, user: User, resume: Optional[Resume] = None) -> Dict[str, Any]:
-        """候補者を詳細形式に変換"""
-        item = self.candidate_to_item(user)
-
-        # 履歴書情報を追加
-        if resume:
-            item.update({
-                "resume": {
-                    "lastName": resume.last_name,
-                    "firstName": resume.first_name,
-                    "lastNameKana": resume.last_name_kana,
-                    "firstNameKana": resume.first_name_kana,
-                    "birthDate": resume.birth_date,
-                    "gender": resume.gender,
-                    "phone": resume.phone,
-                    "email": resume.email,
-                    "address": resume.address,
-                    "education": resume.education,
-                    "experience": resume.experience,
-                    "experienceRoles": resume.experience_roles,
-                    "currentSalary": resume.current_salary,
-                    "skills": resume.skills,
-                    "qualifications": resume.qualifications,
-                    "nativeLanguage": resume.native_language,
-                    "spokenLanguages": resume.spoken_languages,
-                    "languageSkills": resume.language_skills,
-                    "summary": resume.summary,
-                    "careerChangeReason": resume.career_change_reason,
-                    "futureVision": resume.future_vision,
-                },
-            })
-        else:
-            item["resume"] = None
-
-        return item
+    async def get_candidate_detail(self, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """候補者詳細を取得"""
+        result = await self.candidate_repo.get_with_resume(candidate_id)
+        if not result:
+            return None
+
+        resume = result["resume"]
+        return candidate_to_detail(result["user"], resume, resume is not None)
+
+    async def search_candidates(
+        self,
+        query: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        location: Optional[str] = None,
+        experience_years: Optional[str] = None,
+        employment_type: Optional[str] = None,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+        page: int = 1,
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """候補者を検索（cursor 指定時は page を無視してキーセットで続きを取得）"""
+        filters = {
+            "query": query,
+            "skills": skills,
+            "location": location,
+            "experience_years": experience_years,
+            "employment_type": employment_type,
+            "salary_min": salary_min,
+            "salary_max": salary_max,
+        }
+        skip = (page - 1) * per_page
+        rows = await self.candidate_repo.search(skip=skip, limit=per_page + 1, cursor=cursor, **filters)
+        candidates, cursor_for_next = next_cursor(rows, per_page, "created_at")
+        total = await get_count_cache().aget_or_compute(
+            "candidates",
+            CountCache.make_key(**filters),
+            lambda: self.candidate_repo.search_count(**filters),
+        )
+
+        return {
+            "candidates": await self._to_items(candidates),
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "next_cursor": cursor_for_next,
+        }
+
+    async def _to_items(self, users: List[User]) -> List[Dict[str, Any]]:
+        """ページ内の履歴書有無を1クエリで引いてからリストアイテムに変換"""
+        with_resume = await self.candidate_repo.user_ids_with_resume([u.id for u in users])
+        return [candidate_to_item(u, u.id in with_resume) for u in users]
+
+
+def candidate_skills(user: User) -> tuple:
+    """候補者のスキル"""
+    return to_str_tuple(user.skills)
+
+
+def candidate_to_item(user: User, has_resume: bool) -> Dict[str, Any]:
+    """候補者をリストアイテム形式に変換"""
+    skills = candidate_skills(user)
+
+    desired_salary = ""
+    if user.desired_salary_min and user.desired_salary_max:
+        desired_salary = f"{user.desired_salary_min}万円〜{user.desired_salary_max}万円"
+    elif user.desired_salary_min:
+        desired_salary = f"{user.desired_salary_min}万円〜"
+
+    return {
+        "id": user.id,
+        "name": user.name,
+        "skills": list(skills[:5]),
+        "experienceYears": user.experience_years,
+        "desiredLocation": user.desired_location,
+        "desiredSalary": desired_salary,
+        "desiredEmploymentType": user.desired_employment_type,
+        "profileCompletion": user.profile_completion,
+        "createdAt": user.created_at.isoformat() if user.created_at else None,
+        "hasResume": has_resume,
+    }
+
+
+def candidate_to_detail(user: User, resume: Optional[Resume], has_resume: bool) -> Dict[str, Any]:
+    """候補者を詳細形式に変換"""
+    item = candidate_to_item(user, has_resume)
+
+    # 履歴書情報を追加
+    if resume:
+        item.update({
+            "resume": {
+                "lastName": resume.last_name,
+                "firstName": resume.first_name,
+                "lastNameKana": resume.last_name_kana,
+                "firstNameKana": resume.first_name_kana,
+                "birthDate": resume.birth_date,
+                "gender": resume.gender,
+                "phone": resume.phone,
+                "email": resume.email,
+                "address": resume.address,
+                "education": resume.education,
+                "experience": resume.experience,
+                "experienceRoles": resume.experience_roles,
+                "currentSalary": resume.current_salary,
+                "skills": resume.skills,
+                "qualifications": resume.qualifications,
+                "nativeLanguage": resume.native_language,
+                "spokenLanguages": resume.spoken_languages,
+                "languageSkills": resume.language_skills,
+                "summary": resume.summary,
+                "careerChangeReason": resume.career_change_reason,
+                "futureVision": resume.future_vision,
+            },
+        })
+    else:
+        item["resume"] = None
+
+    return item
@@ -6,11 +6,16 @@
 from typing import Optional, List, Dict, Any
 import json
 import os
-import re
 from app.models.chat_models import ChatTurnResult
 from app.utils.session_manager import SessionManager
+from app.utils.normalization import experience_to_years
+from app.services.candidate_scorer import CandidateBatchScorer, SeekerFeatures
 from openai import OpenAI
 
+# SQLで取得してスコアリングする候補者数と、表示する上位件数
+CANDIDATE_POOL_SIZE = 200
+TOP_CANDIDATES = 10
+
 
 class EmployerChatService:
     """企業向け候補者検索チャットサービス"""
@@ -197,7 +202,7 @@ class EmployerChatService:
                     upp.location_prefecture,
                     upp.location_city,
                     upp.remote_work_preference,
-                    u.experience_years
+                    u.experience_years_num
                 FROM users u
                 LEFT JOIN user_preferences_profile upp ON u.id = upp.user_id
                 WHERE lower(u.role::text) = 'seeker'
@@ -246,101 +251,58 @@ class EmployerChatService:
             # OR条件を結合（いずれか1つでも該当すればOK）
             if or_conditions:
                 query += f" AND ({' OR '.join(or_conditions)})"
-            
-            query += " LIMIT 20"
+
+            # 経験年数フィルター（これはANDで適用、LIMITより前にSQLで絞り込む）
+            # 経験年数が未入力の候補者は除外しない
+            min_experience = experience_to_years(requirements.get("experience_years"))
+            if min_experience:
+                query += (
+                    " AND (u.experience_years_num IS NULL OR u.experience_years_num = 0"
+                    " OR u.experience_years_num >= :min_experience)"
+                )
+                params["min_experience"] = min_experience
+
+            query += f" LIMIT {CANDIDATE_POOL_SIZE}"
 
             print(f"[EmployerChatService] Search keywords: {search_keywords}")
             print(f"[EmployerChatService] OR conditions count: {len(or_conditions)}")
             print(f"[EmployerChatService] Query params: {params}")
             print(f"[EmployerChatService] Full query:\n{query}")
             
-            result = db.execute(text(query), params)
-            candidates = []
+            rows = db.execute(text(query), params).fetchall()
 
-            for row in result:
-                try:
-                    # スキルの解析
-                    skills = []
-                    skills_source = getattr(row, 'user_skills', None)
-                    if skills_source:
-                        try:
-                            skills = json.loads(skills_source) if isinstance(skills_source, str) else skills_source
-                            if not isinstance(skills, list):
-                                skills = [str(skills_source)]
-                        except:
-                            skills = [s.strip() for s in str(skills_source).split(',') if s.strip()]
-
-                    # 経験年数の推定
-                    experience_years = 0
-                    exp_years_field = getattr(row, 'experience_years', None)
-                    if exp_years_field:
-                        try:
-                            exp_str = str(exp_years_field)
-                            if exp_str.isdigit():
-                                experience_years = int(exp_str)
-                            else:
-                                years_match = re.search(r'(\d+)', exp_str)
-                                if years_match:
-                                    experience_years = int(years_match.group(1))
-                        except:
-                            pass
-
-                    # 経験年数フィルター（これはANDで適用）
-                    if requirements.get("experience_years"):
-                        if experience_years > 0 and experience_years < requirements["experience_years"]:
-                            continue  # 経験年数が足りない場合はスキップ
-
-                    # マッチスコア計算
-                    match_score = self._calculate_match_score(
-                        {
-                            "skills": skills,
-                            "job_title": getattr(row, 'job_title', None),
-                            "experience_years": experience_years,
-                            "remote_work_preference": getattr(row, 'remote_work_preference', None),
-                            "location_prefecture": getattr(row, 'location_prefecture', None),
-                            "location_city": getattr(row, 'location_city', None)
-                        },
-                        requirements
-                    )
+            # 特徴量を配列化して全候補者を一括スコアリングし、上位のみ整形する
+            features = SeekerFeatures(rows)
+            scorer = CandidateBatchScorer(requirements)
+            result = scorer.score(features)
+            top_indices = scorer.top_k(result["score"], TOP_CANDIDATES)
 
-                    # 勤務地
-                    location_parts = []
-                    if getattr(row, 'location_prefecture', None):
-                        location_parts.append(row.location_prefecture)
-                    if getattr(row, 'location_city', None):
-                        location_parts.append(row.location_city)
-                    location = "".join(location_parts) if location_parts else "未設定"
-
-                    candidate = {
-                        "id": str(getattr(row, 'id', 'unknown')),
-                        "name": getattr(row, 'name', None) or "名前未設定",
-                        "job_title": getattr(row, 'job_title', None) or "職種未設定",
-                        "experience_years": experience_years,
-                        "skills": skills,
-                        "location": location,
-                        "remote_option": getattr(row, 'remote_work_preference', None) or "未設定",
-                        "matchScore": match_score,
-                        "matchReasoning": self._generate_match_reasoning(
-                            {
-                                "skills": skills,
-                                "job_title": getattr(row, 'job_title', None),
-                                "experience_years": experience_years,
-                                "location_prefecture": getattr(row, 'location_prefecture', None),
-                                "location_city": getattr(row, 'location_city', None)
-                            },
-                            requirements
-                        )
-                    }
-                    candidates.append(candidate)
-                    
-                except Exception as row_error:
-                    print(f"[EmployerChatService] Error processing row: {row_error}")
-                    continue
-
-            candidates.sort(key=lambda x: x["matchScore"], reverse=True)
-            
-            print(f"[EmployerChatService] Found {len(candidates)} candidates")
-            return candidates[:10]
+            candidates = []
+            for index in top_indices:
+                row = features.rows[index]
+
+                # 勤務地
+                location_parts = []
+                if getattr(row, 'location_prefecture', None):
+                    location_parts.append(row.location_prefecture)
+                if getattr(row, 'location_city', None):
+                    location_parts.append(row.location_city)
+                location = "".join(location_parts) if location_parts else "未設定"
+
+                candidates.append({
+                    "id": str(getattr(row, 'id', 'unknown')),
+                    "name": getattr(row, 'name', None) or "名前未設定",
+                    "job_title": getattr(row, 'job_title', None) or "職種未設定",
+                    "experience_years": int(features.experience[index]),
+                    "skills": features.skills[index],
+                    "location": location,
+                    "remote_option": getattr(row, 'remote_work_preference', None) or "未設定",
+                    "matchScore": int(result["score"][index]),
+                    "matchReasoning": scorer.reasoning(result, features, index)
+                })
+
+            print(f"[EmployerChatService] Scored {len(features)} candidates, returning {len(candidates)}")
+            return candidates
 
         except Exception as e:
             print(f"[EmployerChatService] Error in _search_candidates: {e}")
@@ -350,87 +312,6 @@ class EmployerChatService:
         finally:
             db.close()
 
-    def _calculate_match_score(self, candidate: Dict[str, Any], requirements: Dict[str, Any]) -> int:
-        """候補者のマッチスコアを計算"""
-        try:
-            score = 50  # ベーススコア（少し下げる）
-            
-            # スキルマッチ（最大30点）
-            if requirements.get("skills") and candidate.get("skills"):
-                required_skills = set(s.lower() for s in requirements["skills"])
-                candidate_skills = set(s.lower() for s in candidate["skills"])
-                matched_skills = required_skills & candidate_skills
-                
-                if matched_skills:
-                    score += min(len(matched_skills) * 10, 30)
-
-            # 職種マッチ（20点）
-            if requirements.get("job_title") and candidate.get("job_title"):
-                if requirements["job_title"].lower() in candidate["job_title"].lower():
-                    score += 20
-
-            # 経験年数マッチ（15点）
-            if requirements.get("experience_years") and candidate.get("experience_years"):
-                if candidate["experience_years"] >= requirements["experience_years"]:
-                    score += 15
-
-            # 勤務地マッチ（10点）
-            if requirements.get("location"):
-                location = requirements["location"].lower()
-                cand_pref = (candidate.get("location_prefecture") or "").lower()
-                cand_city = (candidate.get("location_city") or "").lower()
-                if location in cand_pref or location in cand_city:
-                    score += 10
-
-            # リモートマッチ（10点）
-            if requirements.get("remote_preference"):
-                remote_pref = requirements["remote_preference"].lower()
-                cand_remote = (candidate.get("remote_work_preference") or "").lower()
-                if ("リモート" in remote_pref or "remote" in remote_pref) and "リモート" in cand_remote:
-                    score += 10
-
-            return min(score, 100)
-        except Exception as e:
-            print(f"[EmployerChatService] Error calculating score: {e}")
-            return 50
-
-    def _generate_match_reasoning(self, candidate: Dict[str, Any], requirements: Dict[str, Any]) -> str:
-        """マッチング理由を生成"""
-        try:
-            reasons = []
-
-            # スキルマッチ
-            if requirements.get("skills") and candidate.get("skills"):
-                required_skills = set(s.lower() for s in requirements["skills"])
-                candidate_skills = set(s.lower() for s in candidate["skills"])
-                matched_skills = required_skills & candidate_skills
-                
-                if matched_skills:
-                    reasons.append(f"スキル一致: {', '.join(list(matched_skills)[:3])}")
-
-            # 職種マッチ
-            if requirements.get("job_title") and candidate.get("job_title"):
-                if requirements["job_title"].lower() in candidate["job_title"].lower():
-                    reasons.append("職種一致")
-
-            # 経験年数
-            if requirements.get("experience_years") and candidate.get("experience_years"):
-                if candidate["experience_years"] >= requirements["experience_years"]:
-                    reasons.append(f"経験年数: {candidate['experience_years']}年")
-
-            # 勤務地
-            if requirements.get("location"):
-                location = requirements["location"].lower()
-                cand_pref = (candidate.get("location_prefecture") or "").lower()
-                cand_city = (candidate.get("location_city") or "").lower()
-                if location in cand_pref or location in cand_city:
-                    reasons.append("勤務地一致")
-
-            return " / ".join(reasons) if reasons else "候補者として推薦"
-        except Exception as e:
-            print(f"[EmployerChatService] Error generating reasoning: {e}")
-            return "候補者として推薦"
-
     def _generate_response(self, requirements: Dict[str, Any], candidates: List[Dict[str, Any]], candidate_count: int) -> str:
         """AIの応答メッセージを生成"""
         try:
@@ -0,0 +1,101 @@
+# app/services/employer_stats_service.py
+"""
+企業統計サービス
+ダッシュボードは employer_stats の1行を読むだけにし、行がない場合だけ FILTER 集計の1クエリで求める
+"""
+import logging
+from typing import Dict
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.employer_stats import (
+    COUNTER_COLUMNS,
+    EmployerStats,
+    compute_employer_stats,
+    employer_stats_query,
+    rebuild_employer_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EmployerStatsService:
+    """企業統計サービス"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_counts(self, employer_id: str) -> Dict[str, int]:
+        """
+        ステータス別件数を取得
+
+        統計行がなければ集計して返し、次回以降のために行を作成する
+        """
+        stats = self.db.get(EmployerStats, employer_id)
+        if stats is not None:
+            return {name: getattr(stats, name) for name in COUNTER_COLUMNS}
+
+        connection = self.db.connection()
+        try:
+            counts = rebuild_employer_stats(connection, employer_id)
+            self.db.commit()
+            return counts
+        except Exception as e:
+            # 保存に失敗しても集計結果は返す
+            logger.warning(f"Failed to create employer stats for {employer_id}: {e}")
+            self.db.rollback()
+            return compute_employer_stats(self.db.connection(), employer_id)
+
+    def get_dashboard_stats(self, employer_id: str) -> Dict[str, int]:
+        """ダッシュボード表示用の統計"""
+        counts = self.get_counts(employer_id)
+        return {
+            "total_jobs": counts["jobs_draft"] + counts["jobs_published"] + counts["jobs_closed"],
+            "published_jobs": counts["jobs_published"],
+            "draft_jobs": counts["jobs_draft"],
+            "closed_jobs": counts["jobs_closed"],
+            "total_applications": sum(
+                counts[name] for name in COUNTER_COLUMNS if name.startswith("applications_")
+            ),
+            "pending_applications": counts["applications_screening"],
+            "interview_applications": counts["applications_interview"],
+            "offer_applications": counts["applications_offered"],
+        }
+
+    def reconcile_all(self) -> Dict[str, int]:
+        """
+        全企業の統計行を集計し直す
+
+        Returns:
+            created / updated / unchanged / reset の件数
+        """
+        result = {"created": 0, "updated": 0, "unchanged": 0, "reset": 0}
+        existing = {stats.employer_id: stats for stats in self.db.scalars(select(EmployerStats))}
+
+        for row in self.db.execute(employer_stats_query()).mappings():
+            employer_id = row["employer_id"]
+            counts = {name: int(row[name]) for name in COUNTER_COLUMNS}
+            stats = existing.pop(employer_id, None)
+
+            if stats is None:
+                self.db.add(EmployerStats(employer_id=employer_id, **counts))
+                result["created"] += 1
+            elif any(getattr(stats, name) != value for name, value in counts.items()):
+                for name, value in counts.items():
+                    setattr(stats, name, value)
+                result["updated"] += 1
+            else:
+                result["unchanged"] += 1
+
+        # 求人がなくなった企業は0に戻す
+        for stats in existing.values():
+            if any(getattr(stats, name) for name in COUNTER_COLUMNS):
+                for name in COUNTER_COLUMNS:
+                    setattr(stats, name, 0)
+                result["reset"] += 1
+            else:
+                result["unchanged"] += 1
+
+        self.db.commit()
+        return result
@@ -3,9 +3,73 @@
 Iizumiロジック移植版（テーブルマッピング適用）
 """
 
-from typing import List, Dict, Any, Tuple
-from app.config.database import get_db_conn
+from typing import List, Dict, Any, Optional
+from psycopg2.extras import RealDictCursor
+
+from app.config.database import PreparedStatement, db_connection
 from app.models.chat_models import JobRecommendation
+from app.utils.normalization import salary_to_yen
+from app.utils.topk import TopK
+
+
+# relax_tier → 検索プラン名（条件を緩めた段階）
+SEARCH_PLANS = (
+    "strict",            # 全条件
+    "no_location",       # 場所なし
+    "no_loc_no_salary",  # 場所なし + 年収なし
+    "latest_active",     # 何もなし（active新着）
+)
+
+# _calculate_job_score の上限
+MAX_JOB_SCORE = 95.0
+
+
+# 段階的に条件を緩める求人検索（チャットの推薦で毎回実行するため、プールの接続ごとに PREPARE して再利用する）
+_TITLE_COND = "(%(title_pattern)s IS NULL OR j.title ILIKE %(title_pattern)s)"
+_LOCATION_COND = "(%(location_pattern)s IS NULL OR j.location ILIKE %(location_pattern)s)"
+_SALARY_COND = "(%(salary_min_yen)s IS NULL OR j.salary_max_yen >= %(salary_min_yen)s)"
+
+RECOMMEND_JOBS = PreparedStatement(
+    "job_recommender_search",
+    f"""
+    WITH candidates AS (
+        SELECT
+            j.id as job_id,
+            j.title as job_title,
+            j.company as company_name,
+            j.salary_min,
+            j.salary_max,
+            j.salary_min_yen,
+            j.salary_max_yen,
+            j.location,
+            j.remote,
+            j.description,
+            j.required_skills::text AS required_skills,
+            j.status,
+            j.employer_id,
+            j.created_at,
+            CASE
+                WHEN {_TITLE_COND} AND {_LOCATION_COND} AND {_SALARY_COND} THEN 0
+                WHEN {_TITLE_COND} AND {_SALARY_COND} THEN 1
+                WHEN {_TITLE_COND} THEN 2
+                ELSE 3
+            END AS relax_tier
+        FROM jobs j
+        WHERE j.status = 'PUBLISHED'
+    ),
+    tiered AS (
+        SELECT c.*, MIN(c.relax_tier) OVER () AS best_tier
+        FROM candidates c
+    )
+    SELECT *
+    FROM tiered
+    WHERE relax_tier = best_tier
+    ORDER BY relax_tier, created_at DESC
+    LIMIT %(limit)s
+    """,
+    # title_pattern, location_pattern, salary_min_yen, limit（IS NULL だけでは型が決まらないため指定する）
+    ["text", "text", "integer", "integer"],
+)
 
 
 class JobRecommender:
@@ -60,136 +124,99 @@ class JobRecommender:
         - company_date.company_name → jobs.company
         """
 
-        conn = get_db_conn()
-        from psycopg2.extras import RealDictCursor
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        try:
-            job_title = (user_preferences.get('job_title') or '').strip()
-            location = (user_preferences.get('location') or '').strip()
-            salary_min = user_preferences.get('salary_min') or 0
-
-            # salary_min の単位補正（万円が入ってくる可能性があるため）
-            # 例: 400(万円) -> 4,000,000(円)
-            if isinstance(salary_min, (int, float)) and 0 < salary_min < 100000:  # 10万未満なら「万円」っぽい
-                salary_min = int(salary_min * 10000)
-
-            # --- 段階的に条件を緩める検索プラン ---
-            # (title, location, salary) の順で緩める
-            search_plans: List[Tuple[bool, bool, bool, str]] = [
-                (True, True, True,  "strict"),           # 全条件
-                (True, False, True, "no_location"),      # 場所なし
-                (True, False, False,"no_loc_no_salary"), # 場所なし + 年収なし
-                (False, False, False,"latest_active"),   # 何もなし（active新着）
-            ]
-
-            jobs: List[Dict[str, Any]] = []
+        with db_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+            try:
+                job_title = (user_preferences.get('job_title') or '').strip()
+                location = (user_preferences.get('location') or '').strip()
+                salary_min_yen = JobRecommender._preferred_salary_yen(user_preferences)
 
-            for use_title, use_location, use_salary, plan_name in search_plans:
+                # --- 段階的に条件を緩める検索プラン（1クエリで評価） ---
+                # (title, location, salary) の順で緩める。各行がどの段階まで緩めれば
+                # ヒットするかを relax_tier として計算し、最も厳しい段階の行だけを返す。
+                # 以前の「0件なら次のプランで再検索」と同じ結果を1往復で得る。
                 # テーブル: jobs（Iizumiではcompany_profile）
                 # カラムマッピング: job_title→title, location_prefecture→location
-                # status: 'active'→'published'
-                query = """
-                    SELECT
-                        j.id as job_id,
-                        j.title as job_title,
-                        j.company as company_name,
-                        j.salary_min,
-                        j.salary_max,
-                        j.location,
-                        j.remote,
-                        j.description,
-                        j.required_skills,
-                        j.status,
-                        j.employer_id
-                    FROM jobs j
-                    WHERE UPPER(j.status::text) = 'PUBLISHED'
-                """
-                params: List[Any] = []
-
-                if use_title and job_title:
-                    query += " AND j.title ILIKE %s"
-                    params.append(f"%{job_title}%")
-
-                if use_location and location:
-                    query += " AND j.location ILIKE %s"
-                    params.append(f"%{location}%")
-
-                if use_salary and salary_min and salary_min > 0:
-                    query += " AND j.salary_max >= %s"
-                    params.append(int(salary_min))
-
-                query += f" ORDER BY j.created_at DESC LIMIT {limit * 5}"
-
+                # status: 'active'→'published'（DB上はEnum名 'PUBLISHED'）
+                params: Dict[str, Any] = {
+                    "title_pattern": f"%{job_title}%" if job_title else None,
+                    "location_pattern": f"%{location}%" if location else None,
+                    "salary_min_yen": salary_min_yen,
+                    "limit": limit * 5,
+                }
+
+                RECOMMEND_JOBS.execute(cur, params)
+                jobs: List[Dict[str, Any]] = cur.fetchall()
+
+                plan_name = SEARCH_PLANS[jobs[0]['relax_tier']] if jobs else None
                 print(f"[JobRecommender] Search plan={plan_name}")
-                print(f"[JobRecommender] Query: {query}")
                 print(f"[JobRecommender] Params: {params}")
-
-                cur.execute(query, params)
-                jobs = cur.fetchall()
                 print(f"[JobRecommender] Found jobs: {len(jobs)}")
 
-                if jobs:
-                    break
-
-            if not jobs:
+                if not jobs:
+                    return []
+
+                # スコアリングして上位だけ返す
+                top = TopK(limit)
+                for job in jobs:
+                    # 上位がすべてスコア上限に達していれば残りは入らない
+                    if not top.can_accept(MAX_JOB_SCORE):
+                        break
+                    score = JobRecommender._calculate_job_score(
+                        job,
+                        user_preferences,
+                        conversation_keywords,
+                        salary_min_yen
+                    )
+                    top.push(score, job)
+
+                recommendations: List[JobRecommendation] = []
+                for score, job in top.results():
+
+                    # remote: boolean → string変換
+                    remote_option = "リモート可" if job.get('remote', False) else "出社"
+
+                    recommendations.append(JobRecommendation(
+                        job_id=str(job['job_id']),
+                        job_title=job.get('job_title', ''),
+                        company_name=job.get('company_name', '非公開'),
+                        match_score=score,
+                        match_reasoning=JobRecommender._generate_reasoning(job, conversation_keywords),
+                        salary_min=job.get('salary_min', 0) or 0,
+                        salary_max=job.get('salary_max', 0) or 0,
+                        location=(job.get('location') or '未設定'),
+                        remote_option=remote_option,
+                        search_plan=SEARCH_PLANS[job['relax_tier']]
+                    ))
+
+                return recommendations
+
+            except Exception as e:
+                print(f"[JobRecommender] Error: {e}")
+                import traceback
+                traceback.print_exc()
                 return []
 
-            # スコアリングして上位だけ返す
-            scored_jobs = []
-            for job in jobs:
-                score = JobRecommender._calculate_job_score(
-                    job,
-                    user_preferences,
-                    conversation_keywords
-                )
-                scored_jobs.append({'job': job, 'score': score})
-
-            scored_jobs.sort(key=lambda x: x['score'], reverse=True)
-
-            recommendations: List[JobRecommendation] = []
-            for item in scored_jobs[:limit]:
-                job = item['job']
-                score = item['score']
-
-                # remote: boolean → string変換
-                remote_option = "リモート可" if job.get('remote', False) else "出社"
-
-                recommendations.append(JobRecommendation(
-                    job_id=str(job['job_id']),
-                    job_title=job.get('job_title', ''),
-                    company_name=job.get('company_name', '非公開'),
-                    match_score=score,
-                    match_reasoning=JobRecommender._generate_reasoning(job, conversation_keywords),
-                    salary_min=job.get('salary_min', 0) or 0,
-                    salary_max=job.get('salary_max', 0) or 0,
-                    location=(job.get('location') or '未設定'),
-                    remote_option=remote_option
-                ))
-
-            return recommendations
-
-        except Exception as e:
-            print(f"[JobRecommender] Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
-        finally:
-            cur.close()
-            conn.close()
+    @staticmethod
+    def _preferred_salary_yen(user_preferences: Dict[str, Any]) -> Optional[int]:
+        """希望年収（円）を取得。salary_min_yen 導入前のセッションは salary_min から正規化する"""
+        salary_min_yen = user_preferences.get('salary_min_yen')
+        if salary_min_yen is not None:
+            return salary_min_yen or None
+        return salary_to_yen(user_preferences.get('salary_min'))
 
     @staticmethod
     def _calculate_job_score(
         job: Dict[str, Any],
         user_preferences: Dict[str, Any],
-        keywords: List[str]
+        keywords: List[str],
+        user_salary: Optional[int] = None
     ) -> float:
         score = 50.0
 
         job_title = (job.get('job_title') or '')
         description = (job.get('required_skills') or job.get('description') or '')
-        salary_min = job.get('salary_min') or 0
-        salary_max = job.get('salary_max') or 0
+        salary_min = job.get('salary_min_yen') or 0
+        salary_max = job.get('salary_max_yen') or 0
         location = (job.get('location') or '')
         remote = job.get('remote', False)
 
@@ -205,11 +232,7 @@ class JobRecommender:
         elif remote:
             score += 8
 
-        # 年収マッチ
-        user_salary = user_preferences.get('salary_min') or 0
-        if isinstance(user_salary, (int, float)) and 0 < user_salary < 100000:
-            user_salary = int(user_salary * 10000)
-
+        # 年収マッチ（いずれも円単位）
         if user_salary and salary_max and salary_max >= user_salary:
             if salary_min and salary_min >= user_salary * 0.9:
                 score += 10
@@ -226,7 +249,7 @@ class JobRecommender:
                 matched_keywords += 1
         score += min(matched_keywords * 3, 15)
 
-        return min(score, 95.0)
+        return min(score, MAX_JOB_SCORE)
 
     @staticmethod
     def _generate_reasoning(job: Dict[str, Any], keywords: List[str]) -> str:
@@ -4,13 +4,15 @@
 """
 from typing import Optional, List, Dict, Any
 import uuid
-import json
 from sqlalchemy.orm import Session
 
 from app.models.job import Job, JobStatus, EmploymentType
 from app.models.user import User
 from app.repositories.job_repository import JobRepository
 from app.repositories.application_repository import ApplicationRepository
+from app.utils.count_cache import CountCache, get_count_cache
+from app.utils.normalization import to_str_tuple
+from app.utils.pagination import next_cursor
 
 
 class JobService:
@@ -50,40 +52,52 @@ class JobService:
         salary_min: Optional[int] = None,
         page: int = 1,
         per_page: int = 20,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """求人を検索"""
+        """
+        求人を検索
+
+        キーワード指定時は関連度順でページ番号によるページング、
+        それ以外は cursor 指定時に page を無視してキーセットで続きを取得
+        """
+        filters = {
+            "query": query,
+            "location": location,
+            "employment_type": employment_type,
+            "remote_ok": remote_ok,
+            "salary_min": salary_min,
+        }
         skip = (page - 1) * per_page
-        jobs = self.job_repo.search(
-            query=query,
-            location=location,
-            employment_type=employment_type,
-            remote_ok=remote_ok,
-            salary_min=salary_min,
-            skip=skip,
-            limit=per_page,
+        rows = self.job_repo.search(skip=skip, limit=per_page + 1, cursor=cursor, **filters)
+        if query and query.strip():
+            # 関連度順のためカーソルは使わない
+            jobs, cursor_for_next = rows[:per_page], None
+        else:
+            jobs, cursor_for_next = next_cursor(rows, per_page, "posted_date")
+        total = get_count_cache().get_or_compute(
+            "jobs",
+            ("repository_search",) + CountCache.make_key(**filters),
+            lambda: self.job_repo.search_count(**filters),
         )
 
         return {
             "jobs": jobs,
-            "total": len(jobs),  # 簡易実装。正確にはcount queryが必要
+            "total": total,
             "page": page,
             "per_page": per_page,
+            "next_cursor": cursor_for_next,
         }
 
     def get_employer_jobs(self, employer_id: str, page: int = 1, per_page: int = 20) -> Dict[str, Any]:
         """企業の求人一覧を取得"""
         skip = (page - 1) * per_page
-        jobs = self.job_repo.get_by_employer(employer_id, skip=skip, limit=per_page)
+        rows = self.job_repo.get_by_employer_with_application_counts(employer_id, skip=skip, limit=per_page)
         total = self.job_repo.count_by_employer(employer_id)
 
-        # 各求人の応募数を取得
-        jobs_with_counts = []
-        for job in jobs:
-            app_count = self.app_repo.count_by_job(job.id)
-            jobs_with_counts.append({
-                "job": job,
-                "applications_count": app_count,
-            })
+        jobs_with_counts = [
+            {"job": job, "applications_count": app_count}
+            for job, app_count in rows
+        ]
 
         return {
             "jobs": jobs_with_counts,
@@ -118,11 +132,11 @@ class JobService:
             employment_type=employment_type,
             salary_min=salary_min,
             salary_max=salary_max,
-            required_skills=json.dumps(required_skills) if required_skills else None,
-            preferred_skills=json.dumps(preferred_skills) if preferred_skills else None,
+            required_skills=required_skills or None,
+            preferred_skills=preferred_skills or None,
             requirements=requirements,
             benefits=benefits,
-            remote_ok=remote_ok,
+            remote=remote_ok,
             status=JobStatus(status) if status else JobStatus.DRAFT,
         )
 
@@ -158,15 +172,15 @@ class JobService:
         if salary_max is not None:
             job.salary_max = salary_max
         if required_skills is not None:
-            job.required_skills = json.dumps(required_skills)
+            job.required_skills = required_skills
         if preferred_skills is not None:
-            job.preferred_skills = json.dumps(preferred_skills)
+            job.preferred_skills = preferred_skills
         if requirements is not None:
             job.requirements = requirements
         if benefits is not None:
             job.benefits = benefits
         if remote_ok is not None:
-            job.remote_ok = remote_ok
+            job.remote = remote_ok
         if status is not None:
             job.status = JobStatus(status)
 
@@ -174,12 +188,7 @@ class JobService:
 
     def job_to_list_item(self, job: Job, employer: Optional[User] = None) -> Dict[str, Any]:
         """求人をリストアイテム形式に変換"""
-        skills = []
-        if job.required_skills:
-            try:
-                skills = json.loads(job.required_skills)
-            except:
-                pass
+        skills = to_str_tuple(job.required_skills)
 
         salary = ""
         if job.salary_min and job.salary_max:
@@ -198,9 +207,9 @@ class JobService:
             "location": job.location,
             "salary": salary,
             "employmentType": job.employment_type,
-            "remote": job.remote_ok,
-            "tags": skills[:5],
-            "description": job.description[:200] + "..." if len(job.description) > 200 else job.description,
+            "remote": job.remote,
+            "tags": list(skills[:5]),
+            "description": job.description_summary(),
             "featured": False,
             "postedDate": job.created_at.isoformat() if job.created_at else None,
         }
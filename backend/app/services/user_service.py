@@ -3,11 +3,11 @@
 ユーザーサービス
 """
 from typing import Optional, List
-import json
 from sqlalchemy.orm import Session
 
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
+from app.utils.normalization import to_str_tuple
 
 
 class UserService:
@@ -35,7 +35,7 @@ class UserService:
             user.desired_salary_max = str(salary)
 
         if job_type:
-            user.skills = json.dumps([job_type])
+            user.skills = [job_type]
 
         if desired_location:
             user.desired_location = desired_location
@@ -75,7 +75,7 @@ class UserService:
         # 求職者用フィールド
         if user.role.value == "seeker":
             if skills is not None:
-                user.skills = json.dumps(skills)
+                user.skills = skills
             if experience_years is not None:
                 user.experience_years = experience_years
             if desired_salary_min is not None:
@@ -142,10 +142,7 @@ class UserService:
         return min(completion, 100)
 
     def parse_skills(self, user: User) -> Optional[List[str]]:
-        """スキルをJSON解析"""
+        """スキルのリスト"""
         if not user.skills:
             return None
-        try:
-            return json.loads(user.skills)
-        except:
-            return None
+        return list(to_str_tuple(user.skills))
@@ -3,6 +3,8 @@ import numpy as np
 from typing import List, Dict, Tuple, Any, Optional
 import logging
 
+from app.utils.topk import TopK
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,7 +85,7 @@ class VectorSearchService:
             (job_id, similarity)のリスト
         """
         try:
-            similarities = []
+            top = TopK(top_k)
 
             for job_emb in job_embeddings:
                 job_id = job_emb.get("job_id")
@@ -98,13 +100,10 @@ class VectorSearchService:
                 )
 
                 if similarity >= min_similarity:
-                    similarities.append((job_id, similarity))
-
-            # 類似度で降順ソート
-            similarities.sort(key=lambda x: x[1], reverse=True)
+                    top.push(similarity, (job_id, similarity))
 
-            # 上位K件を返す
-            return similarities[:top_k]
+            # 類似度の降順で上位K件を返す
+            return top.items()
 
         except Exception as e:
             logger.error(f"Error searching similar jobs: {e}")
@@ -132,7 +131,7 @@ class VectorSearchService:
             スコア付き求人のリスト
         """
         try:
-            results = []
+            top = TopK(top_k)
             job_data_map = {job["id"]: job for job in job_data_list}
 
             for job_emb in job_embeddings:
@@ -150,6 +149,11 @@ class VectorSearchService:
                     embedding
                 ) * 100
 
+                # 条件スコアが満点（100）でも上位K件に入らない求人は計算を省略
+                upper_bound = round((vector_similarity * 0.6) + (100 * 0.4), 2)
+                if not top.can_accept(upper_bound):
+                    continue
+
                 # 条件による追加スコア
                 condition_score = VectorSearchService._calculate_condition_score(
                     job_data,
@@ -158,20 +162,18 @@ class VectorSearchService:
 
                 # 重み付き合計スコア
                 # ベクトル類似度: 60%、条件マッチ: 40%
-                total_score = (vector_similarity * 0.6) + (condition_score * 0.4)
+                total_score = round((vector_similarity * 0.6) + (condition_score * 0.4), 2)
 
-                results.append({
+                top.push(total_score, {
                     "job_id": job_id,
                     "job_data": job_data,
                     "vector_similarity": round(vector_similarity, 2),
                     "condition_score": round(condition_score, 2),
-                    "total_score": round(total_score, 2)
+                    "total_score": total_score
                 })
 
-            # トータルスコアで降順ソート
-            results.sort(key=lambda x: x["total_score"], reverse=True)
-
-            return results[:top_k]
+            # トータルスコアの降順で上位K件を返す
+            return top.items()
 
         except Exception as e:
             logger.error(f"Error in weighted search: {e}")
@@ -0,0 +1,150 @@
+"""
+一覧・検索の総件数キャッシュ
+ページごとに COUNT(*) を発行しないよう、(対象, 条件) ごとの件数を短い TTL で保持する。
+書き込み時は対象（"jobs" / "candidates" など）単位で、コミット後に破棄する。
+"""
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import get_settings
+
+DEFAULT_TTL_SECONDS = 30.0
+
+
+class CountCache:
+    """
+    TTL 付きの件数キャッシュ（プロセス内）
+
+    複数ワーカー構成では他ワーカーの書き込みで破棄されないため、最大 TTL 分の遅れがあり得る
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, maxsize: int = 1000):
+        self.ttl = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, int]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**filters: Any) -> Hashable:
+        """検索条件からキーを作成（リストはタプルに変換）"""
+        return tuple(sorted(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in filters.items()
+            if value is not None
+        ))
+
+    def get(self, namespace: str, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[(namespace, key)]
+                return None
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: int, generation: Optional[int] = None) -> None:
+        """
+        件数を保存
+
+        generation を渡した場合、計算中に invalidate されていれば保存しない
+        （破棄前の古い件数を書き戻さないため）
+        """
+        with self._lock:
+            if generation is not None and generation != self._generations.get(namespace, 0):
+                return
+            if len(self._entries) >= self.maxsize:
+                self._evict_expired()
+                if len(self._entries) >= self.maxsize:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[(namespace, key)] = (time.monotonic() + self.ttl, value)
+
+    def generation(self, namespace: str) -> int:
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def invalidate(self, namespace: str) -> None:
+        """対象の件数をすべて破棄"""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for cache_key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[cache_key]
+
+    def get_or_compute(self, namespace: str, key: Hashable, compute: Callable[[], int]) -> int:
+        """キャッシュになければ compute() で求めて保存"""
+        value = self.get(namespace, key)
+        if value is not None:
+            return value
+        generation = self.generation(namespace)
+        value = int(compute() or 0)
+        self.set(namespace, key, value, generation)
+        return value
+
+    async def aget_or_compute(self, namespace: str, key: Hashable, compute: Callable[[], Awaitable[int]]) -> int:
+        """get_or_compute の非同期版"""
+        value = self.get(namespace, key)
+        if value is not None:
+            return value
+        generation = self.generation(namespace)
+        value = int(await compute() or 0)
+        self.set(namespace, key, value, generation)
+        return value
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        for cache_key in [k for k, (expires_at, _) in self._entries.items() if expires_at < now]:
+            del self._entries[cache_key]
+
+
+def has_relevant_changes(target: Any, ignored: Iterable[str]) -> bool:
+    """ORMオブジェクトに ignored 以外の属性の変更があるか（件数に影響しない更新を除外する）"""
+    ignored = set(ignored)
+    return any(
+        attr.history.has_changes()
+        for attr in inspect(target).attrs
+        if attr.key not in ignored
+    )
+
+
+# コミット後に破棄する対象を記録する Session.info のキー
+_PENDING_KEY = "count_cache_pending"
+
+
+def invalidate_on_commit(target: Any, namespace: str) -> None:
+    """
+    ORMオブジェクトの書き込みに合わせて、コミット後に対象の件数を破棄する（flush 時のイベントから呼ぶ）
+
+    flush 時点で破棄すると、コミット前に並行したリクエストが未コミットの行を含まない件数を
+    新しい generation で保存してしまうため、破棄はコミット後に行う
+    """
+    session = object_session(target)
+    if session is None:
+        get_count_cache().invalidate(namespace)
+        return
+    session.info.setdefault(_PENDING_KEY, set()).add(namespace)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    # ロールバックした場合は次のコミットまで残る（余分に破棄するだけで、古い件数は残らない）
+    for namespace in session.info.pop(_PENDING_KEY, ()):
+        get_count_cache().invalidate(namespace)
+
+
+# シングルトンインスタンス
+_count_cache: Optional[CountCache] = None
+
+
+def get_count_cache() -> CountCache:
+    """CountCacheのシングルトンインスタンスを取得"""
+    global _count_cache
+    if _count_cache is None:
+        _count_cache = CountCache(ttl_seconds=get_settings().count_cache_ttl_seconds)
+    return _count_cache
@@ -0,0 +1,88 @@
+"""
+プロフィール・求人データの正規化ユーティリティ
+書き込み時に文字列や単位の揺れを吸収し、検索用の正規化カラムを作る
+"""
+
+import json
+import re
+from typing import Any, Optional, Tuple
+
+# これ未満の数値は「万円」単位とみなす（例: 400 → 400万円）
+MAN_YEN_THRESHOLD = 100000
+
+_NUMBER_PATTERN = re.compile(r"\d+(?:\.\d+)?")
+_INTEGER_PATTERN = re.compile(r"\d+")
+_FULLWIDTH_DIGITS = str.maketrans("０１２３４５６７８９", "0123456789")
+
+
+def salary_to_yen(value: Any) -> Optional[int]:
+    """
+    年収の値を円単位の整数に正規化
+
+    Args:
+        value: 400, "400", "400万円", "4,000,000円" などの年収表現
+
+    Returns:
+        円単位の年収（解釈できない・0以下の場合は None）
+    """
+    if value is None or isinstance(value, bool):
+        return None
+
+    if isinstance(value, (int, float)):
+        amount = float(value)
+        is_man_yen = 0 < amount < MAN_YEN_THRESHOLD
+    else:
+        text = str(value).replace(",", "").replace("，", "").strip()
+        match = _NUMBER_PATTERN.search(text)
+        if not match:
+            return None
+        amount = float(match.group(0))
+        is_man_yen = "万" in text[match.end():] or 0 < amount < MAN_YEN_THRESHOLD
+
+    if amount <= 0:
+        return None
+
+    return int(amount * 10000) if is_man_yen else int(amount)
+
+
+def experience_to_years(value: Any) -> Optional[int]:
+    """
+    経験年数の値を整数に正規化
+
+    Args:
+        value: 3, "3", "3年", "3-5年", "10年以上" などの経験年数表現
+
+    Returns:
+        経験年数（範囲指定は下限、数値を含まない場合は None）
+    """
+    if value is None or isinstance(value, bool):
+        return None
+
+    if isinstance(value, (int, float)):
+        return max(int(value), 0)
+
+    match = _INTEGER_PATTERN.search(str(value).translate(_FULLWIDTH_DIGITS))
+    if not match:
+        return None
+    return int(match.group(0))
+
+
+def to_str_tuple(value: Any) -> Tuple[str, ...]:
+    """
+    JSON 配列カラムの値（スキル・タグ）を文字列のタプルに正規化
+
+    ORMを経由しない読み出し（JSON テキストのまま返るドライバ）に備えて文字列もデコードし、
+    JSON でない文字列は1要素として扱う
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return (value,)
+        if isinstance(value, str):
+            return (value,)
+    if not isinstance(value, (list, tuple)):
+        return ()
+    return tuple(str(item) for item in value if item is not None)
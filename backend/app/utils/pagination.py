@@ -0,0 +1,80 @@
+"""
+キーセット（カーソル）ページネーション
+(並び替えカラム, id) の組を不透明なカーソル文字列にして、OFFSET を使わずに次ページを取得する
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: str) -> str:
+    """並び替え値（日時）と id からカーソル文字列を作成"""
+    value = sort_value.isoformat() if sort_value else ""
+    raw = f"{value}{_SEPARATOR}{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
+    """
+    カーソル文字列を (並び替え値, id) に戻す
+
+    Raises:
+        ValueError: 形式が不正な場合
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        value, row_id = raw.split(_SEPARATOR, 1)
+        return (datetime.fromisoformat(value) if value else None), row_id
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
+
+
+def keyset_order(sort_column: Any, id_column: Any, descending: bool = True) -> List[Any]:
+    """keyset_after と組み合わせる ORDER BY（NULL は最後）"""
+    if descending:
+        return [sort_column.desc().nullslast(), id_column.desc()]
+    return [sort_column.asc().nullslast(), id_column.asc()]
+
+
+def keyset_after(sort_column: Any, id_column: Any, cursor: str, descending: bool = True):
+    """
+    カーソルより後ろ（降順なら古い側）の行を取得する条件
+
+    keyset_order と同じ並び（NULL は最後）のクエリと組み合わせて使う。
+
+    Raises:
+        ValueError: カーソルの形式が不正な場合
+    """
+    sort_value, row_id = decode_cursor(cursor)
+    id_after = id_column < row_id if descending else id_column > row_id
+
+    # NULL の並び替え値は末尾にまとまっているので、その中を id 順に進む
+    if sort_value is None:
+        return and_(sort_column.is_(None), id_after)
+
+    sort_after = sort_column < sort_value if descending else sort_column > sort_value
+    return or_(
+        sort_after,
+        and_(sort_column == sort_value, id_after),
+        sort_column.is_(None),
+    )
+
+
+def next_cursor(rows: List[Any], limit: int, sort_attr: str, id_attr: str = "id") -> Tuple[List[Any], Optional[str]]:
+    """
+    limit + 1 件取得した結果を1ページ分に切り詰め、次ページのカーソルを返す
+
+    Returns:
+        (ページの行, 次ページのカーソル。最終ページなら None)
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
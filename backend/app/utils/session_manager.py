@@ -9,7 +9,38 @@ import uuid
 import json
 
 from app.models.chat_models import ChatSession
-from app.config.database import get_db_conn
+from app.config.database import PreparedStatement, db_connection
+
+# チャットの毎ターン実行する SQL（プールの接続ごとに PREPARE して再利用する）
+# session_data は JSON / JSONB のどちらで作成されたテーブルでも動くよう、パラメータの型はカラムから推論させる
+GET_SESSION = PreparedStatement(
+    "chat_session_get",
+    """
+    SELECT session_data FROM chat_sessions
+    WHERE session_id = %s
+    """,
+)
+
+SAVE_SESSION = PreparedStatement(
+    "chat_session_save",
+    """
+    INSERT INTO chat_sessions (session_id, user_id, session_data, updated_at)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (session_id)
+    DO UPDATE SET
+        session_data = EXCLUDED.session_data,
+        updated_at = EXCLUDED.updated_at
+    """,
+)
+
+GET_USER_PREFERENCES = PreparedStatement(
+    "user_preferences_get",
+    """
+    SELECT job_title, location_prefecture, salary_min, salary_min_yen
+    FROM user_preferences_profile
+    WHERE user_id = %s
+    """,
+)
 
 
 class SessionManager:
@@ -39,14 +70,8 @@ class SessionManager:
     @staticmethod
     def get_session(session_id: str) -> Optional[ChatSession]:
         """セッションを取得"""
-        conn = get_db_conn()
-        cur = conn.cursor()
-
-        try:
-            cur.execute("""
-                SELECT session_data FROM chat_sessions
-                WHERE session_id = %s
-            """, (session_id,))
+        with db_connection() as conn, conn.cursor() as cur:
+            GET_SESSION.execute(cur, (session_id,))
 
             result = cur.fetchone()
 
@@ -60,10 +85,6 @@ class SessionManager:
 
             return None
 
-        finally:
-            cur.close()
-            conn.close()
-
     @staticmethod
     def update_session(session: ChatSession) -> None:
         """セッションを更新"""
@@ -111,37 +132,25 @@ class SessionManager:
     @staticmethod
     def _save_to_db(session: ChatSession) -> None:
         """DBに保存"""
-        conn = get_db_conn()
-        cur = conn.cursor()
-
-        try:
-            session_data = session.model_dump()
-            session_data['created_at'] = session_data['created_at'].isoformat()
-            session_data['updated_at'] = session_data['updated_at'].isoformat()
-
-            cur.execute("""
-                INSERT INTO chat_sessions (session_id, user_id, session_data, updated_at)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (session_id)
-                DO UPDATE SET
-                    session_data = EXCLUDED.session_data,
-                    updated_at = EXCLUDED.updated_at
-            """, (
-                session.session_id,
-                session.user_id,
-                json.dumps(session_data),
-                session.updated_at
-            ))
-
-            conn.commit()
-
-        except Exception as e:
-            conn.rollback()
-            print(f"[SessionManager] Save error: {e}")
-            raise
-        finally:
-            cur.close()
-            conn.close()
+        with db_connection() as conn, conn.cursor() as cur:
+            try:
+                session_data = session.model_dump()
+                session_data['created_at'] = session_data['created_at'].isoformat()
+                session_data['updated_at'] = session_data['updated_at'].isoformat()
+
+                SAVE_SESSION.execute(cur, (
+                    session.session_id,
+                    session.user_id,
+                    json.dumps(session_data),
+                    session.updated_at
+                ))
+
+                conn.commit()
+
+            except Exception as e:
+                conn.rollback()
+                print(f"[SessionManager] Save error: {e}")
+                raise
 
     @staticmethod
     def get_user_preferences(user_id: str) -> Dict[str, Any]:
@@ -149,17 +158,10 @@ class SessionManager:
         ユーザーのStep2情報を取得
 
         テーブル: user_preferences_profile
-        カラム: job_title, location_prefecture, salary_min
+        カラム: job_title, location_prefecture, salary_min, salary_min_yen
         """
-        conn = get_db_conn()
-        cur = conn.cursor()
-
-        try:
-            cur.execute("""
-                SELECT job_title, location_prefecture, salary_min
-                FROM user_preferences_profile
-                WHERE user_id = %s
-            """, (user_id,))
+        with db_connection() as conn, conn.cursor() as cur:
+            GET_USER_PREFERENCES.execute(cur, (user_id,))
 
             result = cur.fetchone()
 
@@ -167,15 +169,12 @@ class SessionManager:
                 return {
                     'job_title': result[0],
                     'location': result[1],
-                    'salary_min': result[2]
+                    'salary_min': result[2],
+                    'salary_min_yen': result[3]
                 }
 
             return {}
 
-        finally:
-            cur.close()
-            conn.close()
-
 
 # chat_sessionsテーブルのスキーマ（必要に応じて実行）
 """
@@ -0,0 +1,115 @@
+"""
+スコア上位k件のストリーミング選択
+全件のリストを作ってソートする代わりに、サイズkのヒープで上位だけを保持する
+"""
+
+import heapq
+from typing import Any, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class TopK(Generic[T]):
+    """
+    上位k件を保持するアキュムレータ（メモリ O(k)）
+
+    同点の場合は先に追加されたものを優先する（安定ソートで降順に並べた結果と同じ順序）。
+
+    使用例:
+        top = TopK(10)
+        for job in jobs:
+            top.push(score(job), job)
+        best = top.items()
+    """
+
+    def __init__(self, k: int):
+        self.k = max(int(k), 0)
+        # (score, -連番, item) の最小ヒープ。先頭が現在の最下位
+        self._heap: List[Tuple[Any, int, T]] = []
+        self._seq = 0
+        self.pushed = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def is_full(self) -> bool:
+        """k件埋まっているか"""
+        return len(self._heap) >= self.k
+
+    @property
+    def threshold(self) -> Optional[Any]:
+        """上位k件に入るために超える必要があるスコア（埋まっていない場合は None）"""
+        if self.k == 0 or not self.is_full():
+            return None
+        return self._heap[0][0]
+
+    def can_accept(self, upper_bound: Any) -> bool:
+        """
+        スコアの上限が upper_bound の要素が上位k件に入り得るか
+
+        残りの要素すべての上限で False になれば、それ以上のスコア計算は不要
+        （後から来た同点は先着に負けるため、上限が最下位と同点でも入らない）
+        """
+        if self.k == 0:
+            return False
+        if not self.is_full():
+            return True
+        return upper_bound > self._heap[0][0]
+
+    def push(self, score: Any, item: T) -> bool:
+        """
+        要素を追加
+
+        Returns:
+            上位k件に入った場合 True
+        """
+        self.pushed += 1
+        seq = self._seq
+        self._seq += 1
+
+        if self.k == 0:
+            return False
+
+        entry = (score, -seq, item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if (score, -seq) > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def results(self) -> List[Tuple[Any, T]]:
+        """(score, item) をスコア降順で返す"""
+        ordered = sorted(self._heap, key=lambda entry: (entry[0], entry[1]), reverse=True)
+        return [(score, item) for score, _, item in ordered]
+
+    def items(self) -> List[T]:
+        """要素をスコア降順で返す"""
+        return [item for _, item in self.results()]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items())
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    スコア配列の上位k件のインデックスを降順で返す（NumPy版）
+
+    partition で O(n) に境界を求めてから k 件だけを並べる。
+    同点は元のインデックスが小さい方を優先する。
+    """
+    n = len(scores)
+    k = min(max(int(k), 0), n)
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    values = np.asarray(scores)
+    # k番目のスコアを境界に、それより上は全件、同点はインデックス順に残り枠まで採用
+    boundary = -np.partition(-values, k - 1)[k - 1]
+    above = np.flatnonzero(values > boundary)
+    ties = np.flatnonzero(values == boundary)[:k - len(above)]
+    selected = np.concatenate([above, ties])
+    return selected[np.lexsort((selected, -values[selected]))]
@@ -4,12 +4,16 @@
 """
 
 import os
-from typing import Generator
+import threading
+from contextlib import contextmanager
+from typing import Generator, Iterator, Optional
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from psycopg2 import sql
 from dotenv import load_dotenv
 
+from app.config.database import ConnectionPool, PooledConnection
+
 load_dotenv()
 
 
@@ -37,21 +41,62 @@ class DatabaseConfig:
 db_config = DatabaseConfig()
 
 
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """プロセス共通の接続プールを取得（初回呼び出し時に作成）"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    db_config.get_connection_params,
+                    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+                    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                    check_interval=float(os.getenv("DB_POOL_CHECK_INTERVAL", "30")),
+                    max_idle=float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+                )
+    return _pool
+
+
+def close_pool() -> None:
+    """接続プールを閉じる（シャットダウン時）"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
 def get_db_conn():
     """
-    データベース接続を取得
+    データベース接続をプールから取得
+    
+    close() はプールへの返却になるため、呼び出し側は従来どおり conn.close() すればよい
     
     Returns:
-        psycopg2.connection: データベース接続オブジェクト
+        PooledConnection: データベース接続オブジェクト
     """
     try:
-        conn = psycopg2.connect(**db_config.get_connection_params())
-        return conn
+        return get_pool().getconn()
     except Exception as e:
         print(f"❌ データベース接続エラー: {e}")
         raise
 
 
+@contextmanager
+def db_connection() -> Iterator[PooledConnection]:
+    """with 文用のデータベース接続（ブロックを抜けるとプールに返却）"""
+    conn = get_db_conn()
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
 def get_db_cursor(conn, use_dict_cursor: bool = False):
     """
     データベースカーソルを取得
@@ -52,6 +52,9 @@ async def lifespan(app: FastAPI):
     print("🛑 FastAPI Job Matching System Shutting down...")
     print("=" * 60)
 
+    from config.database import close_pool
+    close_pool()
+
 app.include_router(conversation_router)
 
 # アプリケーション初期化
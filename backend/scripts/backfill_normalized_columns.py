@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+検索用の正規化カラムをバックフィルするスクリプト
+既存データの文字列・単位揺れのある項目から正規化カラムを埋めます
+  - jobs.salary_min/max → salary_min_yen/salary_max_yen（円）
+  - users.desired_salary_min/max → desired_salary_min_yen/desired_salary_max_yen（円）
+  - users.experience_years → experience_years_num（年）
+  - user_preferences_profile.salary_min → salary_min_yen（円）
+
+正規化カラムは事前に scripts/migrate.py apply で追加してください。
+
+使用方法:
+  python scripts/backfill_normalized_columns.py [--batch-size 1000] [--dry-run]
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+"""
+import argparse
+import sys
+import os
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect, text
+
+from app.db.session import SessionLocal
+from app.db.migrations import NORMALIZED_COLUMNS_MIGRATION, current_version
+from app.utils.normalization import salary_to_yen, experience_to_years
+
+# (テーブル名, 主キー, [(元カラム, 正規化カラム, 変換関数), ...])
+BACKFILL_TARGETS = [
+    ("jobs", "id", [
+        ("salary_min", "salary_min_yen", salary_to_yen),
+        ("salary_max", "salary_max_yen", salary_to_yen),
+    ]),
+    ("users", "id", [
+        ("desired_salary_min", "desired_salary_min_yen", salary_to_yen),
+        ("desired_salary_max", "desired_salary_max_yen", salary_to_yen),
+        ("experience_years", "experience_years_num", experience_to_years),
+    ]),
+    ("user_preferences_profile", "user_id", [
+        ("salary_min", "salary_min_yen", salary_to_yen),
+    ]),
+]
+
+
+def backfill_table(db, table: str, key: str, pairs, batch_size: int, dry_run: bool) -> int:
+    """1テーブル分の正規化カラムを更新し、更新件数を返す"""
+    source_columns = ", ".join(src for src, _, _ in pairs)
+    target_columns = ", ".join(dst for _, dst, _ in pairs)
+    set_clause = ", ".join(f"{dst} = :{dst}" for _, dst, _ in pairs)
+    update_sql = text(f"UPDATE {table} SET {set_clause} WHERE {key} = :key")
+
+    updated = 0
+    last_key = None
+
+    while True:
+        # キーセットでバッチ取得（OFFSETを使わない）
+        where = f"WHERE {key} > :last_key" if last_key is not None else ""
+        rows = db.execute(
+            text(f"""
+                SELECT {key}, {source_columns}, {target_columns}
+                FROM {table}
+                {where}
+                ORDER BY {key}
+                LIMIT :batch_size
+            """),
+            {"last_key": last_key, "batch_size": batch_size},
+        ).fetchall()
+
+        if not rows:
+            break
+
+        changes = []
+        for row in rows:
+            values = {}
+            for i, (_, dst, convert) in enumerate(pairs):
+                values[dst] = convert(row[1 + i])
+            current = tuple(row[1 + len(pairs):])
+            if tuple(values[dst] for _, dst, _ in pairs) != current:
+                values["key"] = row[0]
+                changes.append(values)
+
+        if changes and not dry_run:
+            db.execute(update_sql, changes)
+            db.commit()
+
+        updated += len(changes)
+        last_key = rows[-1][0]
+
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="検索用の正規化カラムをバックフィル")
+    parser.add_argument("--batch-size", type=int, default=1000, help="1バッチあたりの行数")
+    parser.add_argument("--dry-run", action="store_true", help="更新せずに件数のみ表示")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("正規化カラムを確認中...")
+        version = current_version(db.connection())
+        if version is None or version < NORMALIZED_COLUMNS_MIGRATION:
+            print("❌ 正規化カラムのマイグレーションが未適用です")
+            print("   python scripts/migrate.py apply を実行してください")
+            return
+
+        existing_tables = set(inspect(db.get_bind()).get_table_names())
+        for table, key, pairs in BACKFILL_TARGETS:
+            if table not in existing_tables:
+                print(f"  - {table}: テーブルが存在しないためスキップ")
+                continue
+            count = backfill_table(db, table, key, pairs, args.batch_size, args.dry_run)
+            label = "更新対象" if args.dry_run else "更新"
+            print(f"  - {table}: {count}件{label}")
+
+        print("\nバックフィルが完了しました！")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+APIの同時実行スループットを計測するスクリプト
+起動中のサーバー（uvicorn 1ワーカー想定）に並列でリクエストを送り、
+並列数ごとのスループット（req/s）とレイテンシ（p50/p95/max）を表示します
+
+使用方法:
+  python scripts/benchmark_concurrency.py [--url http://localhost:8000]
+      [--path /api/jobs/ --path /api/candidates/] [--concurrency 1,10,50]
+      [--requests 500] [--token <JWT>]
+
+比較例:
+  非同期化前後のコミットでそれぞれサーバーを起動し、同じ引数で実行して結果を比べる。
+  同期セッションのルートはスレッドプールと接続プール（pool_size + max_overflow）を超える並列数で
+  接続待ちのタイムアウト（エラー）が出始め、非同期セッションのルートはエラーにならずに処理し続ける。
+  スループットが並列数に応じて伸びるのは DB の待ち時間が支配的な場合（PostgreSQL・複数コア）で、
+  CPU 1コア・SQLite では非同期でもほぼ横ばいになる。
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/jobs/",
+    "/api/candidates/",
+    "/api/applications/",
+    "/api/scouts/",
+]
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    path: str,
+    concurrency: int,
+    total_requests: int,
+) -> Dict[str, float]:
+    """1つのパスを指定並列数で total_requests 回叩く"""
+    latencies: List[float] = []
+    errors = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(total_requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        nonlocal errors
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "throughput": total_requests / elapsed if elapsed else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_ms": latencies[-1] * 1000,
+        "errors": errors,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    paths = args.path or DEFAULT_PATHS
+
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=args.url, headers=headers, limits=limits, timeout=60.0) as client:
+        for path in paths:
+            print(f"\n📊 {path}")
+            print(f"{'並列数':>6} {'req/s':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10} {'エラー':>6}")
+
+            # ウォームアップ（接続プール・キャッシュを温める）
+            await run_level(client, path, 1, 5)
+
+            for concurrency in levels:
+                result = await run_level(client, path, concurrency, args.requests)
+                print(
+                    f"{concurrency:>6} {result['throughput']:>10.1f} {result['p50_ms']:>10.1f} "
+                    f"{result['p95_ms']:>10.1f} {result['max_ms']:>10.1f} {result['errors']:>6}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="APIの同時実行スループット計測")
+    parser.add_argument("--url", default="http://localhost:8000", help="サーバーのベースURL")
+    parser.add_argument("--path", action="append", help="計測するパス（複数指定可）")
+    parser.add_argument("--concurrency", default="1,10,50", help="並列数（カンマ区切り）")
+    parser.add_argument("--requests", type=int, default=500, help="並列数ごとのリクエスト数")
+    parser.add_argument("--token", help="認証が必要なルート用のJWT")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("同時実行スループット計測")
+    print("=" * 60)
+    print(f"対象: {args.url}")
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+求人一覧の読み込みプロファイルの効果を計測するスクリプト
+公開求人の一覧ページを「全カラム（従来）」と「一覧カード用（card プロファイル）」で取得し、
+1ページあたりの転送量（取得した値のバイト数）とレイテンシ（p50/p95）を比較します
+
+使用方法:
+  python scripts/benchmark_job_projection.py [--per-page 20] [--pages 5] [--iterations 50]
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+"""
+import argparse
+import statistics
+import sys
+import os
+import time
+from typing import Any, Dict, List
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import undefer
+
+from app.db.session import SessionLocal
+from app.models.job import DESCRIPTION_PREVIEW_LENGTH, JOB_CARD_COLUMNS, Job, JobStatus, job_load_options
+
+
+def value_size(value: Any) -> int:
+    """値のおおよそのバイト数"""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return len(str(value).encode("utf-8"))
+
+
+def page_bytes(db, columns: List[Any], per_page: int, pages: int) -> float:
+    """1ページあたりの取得バイト数（先頭 pages ページの平均）"""
+    total = 0
+    for page in range(pages):
+        rows = db.execute(
+            select(*columns)
+            .where(Job.status == JobStatus.PUBLISHED)
+            .order_by(Job.posted_date.desc(), Job.id.desc())
+            .offset(page * per_page)
+            .limit(per_page)
+        ).all()
+        total += sum(value_size(value) for row in rows for value in row)
+    return total / pages
+
+
+def measure(db, options: List[Any], per_page: int, pages: int, iterations: int) -> Dict[str, float]:
+    """ORM で一覧ページを取得するレイテンシ（ミリ秒）"""
+    timings = []
+    for i in range(iterations):
+        db.expunge_all()
+        started = time.perf_counter()
+        db.scalars(
+            select(Job)
+            .options(*options)
+            .where(Job.status == JobStatus.PUBLISHED)
+            .order_by(Job.posted_date.desc(), Job.id.desc())
+            .offset((i % pages) * per_page)
+            .limit(per_page)
+        ).all()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="求人一覧の読み込みプロファイルの計測")
+    parser.add_argument("--per-page", type=int, default=20, help="1ページあたりの件数")
+    parser.add_argument("--pages", type=int, default=5, help="計測に使うページ数")
+    parser.add_argument("--iterations", type=int, default=50, help="レイテンシの計測回数")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        published = db.scalar(select(func.count()).select_from(Job).where(Job.status == JobStatus.PUBLISHED))
+        print(f"公開求人: {published}件（1ページ {args.per_page}件 × {args.pages}ページで計測）\n")
+        if not published:
+            print("公開求人がないため計測できません")
+            return
+
+        full_columns = list(Job.__table__.columns)
+        card_columns = [
+            *(attr.expression for attr in JOB_CARD_COLUMNS),
+            func.substr(Job.description, 1, DESCRIPTION_PREVIEW_LENGTH + 1),
+        ]
+        profiles = [
+            ("全カラム（従来）", full_columns, [undefer(Job.embedding)]),
+            ("一覧カード（card）", card_columns, job_load_options("card")),
+        ]
+
+        results = []
+        for label, columns, options in profiles:
+            size = page_bytes(db, columns, args.per_page, args.pages)
+            latency = measure(db, options, args.per_page, args.pages, args.iterations)
+            results.append((label, size, latency))
+
+        print(f"  {'プロファイル':<16} {'転送量/ページ':>14} {'p50':>10} {'p95':>10}")
+        for label, size, latency in results:
+            print(f"  {label:<16} {size / 1024:>11.1f} KB {latency['p50']:>8.2f}ms {latency['p95']:>8.2f}ms")
+
+        (_, before_size, before), (_, after_size, after) = results
+        if after_size:
+            print(f"\n転送量: {before_size / after_size:.1f}分の1")
+        if after["p50"]:
+            print(f"p50: {before['p50'] / after['p50']:.1f}倍高速")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+チャット1ターンあたりのDBレイテンシを、プリペアドステートメントの有無で比較するスクリプト
+SessionManager（セッション取得・Step2情報取得・保存）と JobRecommender の求人検索を
+psycopg2 の接続プール経由で1ターン分ずつ実行し、p50/p95 を計測します
+（計測用のセッション行を作成し、終了時に削除します）
+
+使用方法:
+  python scripts/benchmark_prepared_statements.py [--turns 200] [--warmup 20] [--no-recommend]
+
+環境変数:
+  DATABASE_URL: PostgreSQLの接続URL（psycopg2 の接続プールを使用）
+  DB_PREPARED_STATEMENTS: 0 の場合は両方とも従来の実行になる
+"""
+import argparse
+import json
+import statistics
+import sys
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from psycopg2.extras import RealDictCursor
+
+from app.config.database import PreparedStatement, close_pool, db_connection
+from app.services.job_recommender import RECOMMEND_JOBS
+from app.utils.session_manager import GET_SESSION, GET_USER_PREFERENCES, SAVE_SESSION
+
+
+def plain_execute(cur, statement: PreparedStatement, params: Any) -> None:
+    """従来どおり SQL 文字列を毎回送って実行"""
+    cur.execute(statement.sql, params)
+
+
+def prepared_execute(cur, statement: PreparedStatement, params: Any) -> None:
+    """接続ごとに PREPARE 済みの文を EXECUTE で実行"""
+    statement.execute(cur, params)
+
+
+def run_turn(execute: Callable, session_id: str, user_id: str, session_data: Dict[str, Any], recommend: bool) -> None:
+    """チャット1ターン分のDBアクセス（サービスと同じく呼び出しごとにプールから接続を借りる）"""
+    with db_connection() as conn, conn.cursor() as cur:
+        execute(cur, GET_SESSION, (session_id,))
+        cur.fetchone()
+
+    with db_connection() as conn, conn.cursor() as cur:
+        execute(cur, GET_USER_PREFERENCES, (user_id,))
+        cur.fetchone()
+
+    if recommend:
+        with db_connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
+            execute(cur, RECOMMEND_JOBS, {
+                "title_pattern": "%エンジニア%",
+                "location_pattern": "%東京%",
+                "salary_min_yen": 5_000_000,
+                "limit": 25,
+            })
+            cur.fetchall()
+
+    with db_connection() as conn, conn.cursor() as cur:
+        execute(cur, SAVE_SESSION, (session_id, user_id, json.dumps(session_data), datetime.now()))
+        conn.commit()
+
+
+def measure(execute: Callable, turns: int, warmup: int, **kwargs) -> Dict[str, float]:
+    timings: List[float] = []
+    for i in range(warmup + turns):
+        started = time.perf_counter()
+        run_turn(execute, **kwargs)
+        if i >= warmup:
+            timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "mean": statistics.fmean(timings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="プリペアドステートメントの計測")
+    parser.add_argument("--turns", type=int, default=200, help="計測するターン数")
+    parser.add_argument("--warmup", type=int, default=20, help="計測前に実行するターン数")
+    parser.add_argument("--no-recommend", action="store_true", help="求人検索を含めない")
+    args = parser.parse_args()
+
+    session_id = f"benchmark-{uuid.uuid4()}"
+    user_id = "benchmark-user"
+    session_data = {
+        "session_id": session_id,
+        "user_id": user_id,
+        "turn_count": 3,
+        "conversation_history": [{"role": "user", "content": "東京でバックエンドエンジニアの求人を探しています", "turn": "1"}] * 6,
+        "user_preferences": {"job_title": "エンジニア", "location": "東京"},
+    }
+    options = dict(session_id=session_id, user_id=user_id, session_data=session_data, recommend=not args.no_recommend)
+
+    try:
+        print(f"1ターン = セッション取得 + Step2情報取得{'' if args.no_recommend else ' + 求人検索'} + セッション保存")
+        print(f"{args.turns}ターン計測（ウォームアップ {args.warmup}ターン）\n")
+
+        results = [
+            ("毎回SQLを送信（従来）", measure(plain_execute, args.turns, args.warmup, **options)),
+            ("PREPARE + EXECUTE", measure(prepared_execute, args.turns, args.warmup, **options)),
+        ]
+
+        print(f"  {'方式':<22} {'p50':>10} {'p95':>10} {'平均':>10}")
+        for label, result in results:
+            print(f"  {label:<22} {result['p50']:>8.2f}ms {result['p95']:>8.2f}ms {result['mean']:>8.2f}ms")
+
+        (_, before), (_, after) = results
+        if after["p50"]:
+            print(f"\np50: {before['p50'] / after['p50']:.2f}倍高速（1ターンあたり {before['p50'] - after['p50']:.2f}ms 短縮）")
+    finally:
+        with db_connection() as conn, conn.cursor() as cur:
+            cur.execute("DELETE FROM chat_sessions WHERE session_id = %s", (session_id,))
+            conn.commit()
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
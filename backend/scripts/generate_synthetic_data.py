@@ -0,0 +1,655 @@
+#!/usr/bin/env python
+"""
+負荷試験・ベンチマーク用の合成データを生成するスクリプト
+固定のシードから企業・求職者・求人・応募・スカウト・チャットセッション・希望条件を生成し、
+PostgreSQL では COPY、SQLite ではバルクINSERT でまとめて書き込みます
+
+値は本番に近い分布にしています:
+  - 都道府県は人口比（求人は東京・大阪などの都市部に偏らせる）
+  - スキル・職種は職種カテゴリごとの組み合わせ
+  - 年収は職種・経験年数に応じた対数正規分布（万円）
+  - 企業ごとの求人数・求人ごとの応募数は人気の偏り（少数の企業・求人に集中）を持たせる
+
+同じシード・同じ件数・同じ基準日なら同じデータになります（ID もシードから決まるため、
+別のシードなら既存のデータに追加できます）。アプリの書き込み時フックは通らないため、
+検索用の正規化カラム（*_yen, experience_years_num）はこのスクリプトで計算して書き込みます。
+
+使用方法:
+  python scripts/generate_synthetic_data.py [--scale 1.0] [--seed 42] [--batch-size 10000]
+      [--jobs 100000] [--seekers 1000000] [--employers 5000] [--applications 2000000]
+      [--scouts 300000] [--chat-sessions 200000] [--base-date 2025-01-01]
+
+  件数は --scale を掛けた値になります（例: --scale 0.01 で求人1,000件・求職者10,000人）
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+
+生成後:
+  python scripts/rebuild_employer_stats.py    # 企業ダッシュボードの統計
+"""
+import argparse
+import csv
+import enum
+import io
+import json
+import math
+import random
+import sys
+import os
+import time
+import uuid
+from array import array
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bcrypt
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Engine
+
+from app.db.migrations import LATEST_VERSION, current_version
+from app.db.session import get_engine
+from app.models.application import Application, ApplicationStatus
+from app.models.conversation import ChatSession
+from app.models.job import EmploymentType, Job, JobStatus
+from app.models.scout import Scout, ScoutStatus
+from app.models.user import User, UserRole
+from app.models.user_preferences import UserPreferencesProfile
+from app.utils.normalization import experience_to_years, salary_to_yen
+
+# === 語彙 ===
+
+# 都道府県と人口（万人、概数）
+PREFECTURES: List[Tuple[str, int]] = [
+    ("北海道", 514), ("青森県", 120), ("岩手県", 118), ("宮城県", 228), ("秋田県", 93),
+    ("山形県", 104), ("福島県", 179), ("茨城県", 284), ("栃木県", 191), ("群馬県", 191),
+    ("埼玉県", 734), ("千葉県", 628), ("東京都", 1404), ("神奈川県", 923), ("新潟県", 214),
+    ("富山県", 102), ("石川県", 111), ("福井県", 75), ("山梨県", 80), ("長野県", 202),
+    ("岐阜県", 195), ("静岡県", 358), ("愛知県", 748), ("三重県", 173), ("滋賀県", 141),
+    ("京都府", 254), ("大阪府", 878), ("兵庫県", 537), ("奈良県", 130), ("和歌山県", 90),
+    ("鳥取県", 54), ("島根県", 65), ("岡山県", 186), ("広島県", 276), ("山口県", 131),
+    ("徳島県", 70), ("香川県", 93), ("愛媛県", 131), ("高知県", 67), ("福岡県", 510),
+    ("佐賀県", 80), ("長崎県", 127), ("熊本県", 172), ("大分県", 111), ("宮崎県", 105),
+    ("鹿児島県", 156), ("沖縄県", 147),
+]
+
+# 求人が人口比以上に集中する都道府県の倍率
+JOB_CONCENTRATION = {"東京都": 4.0, "大阪府": 1.8, "神奈川県": 1.5, "愛知県": 1.5, "福岡県": 1.5}
+
+CITIES = {
+    "東京都": ["千代田区", "中央区", "港区", "新宿区", "渋谷区", "品川区", "目黒区", "豊島区", "江東区", "世田谷区"],
+    "大阪府": ["大阪市北区", "大阪市中央区", "大阪市西区", "大阪市淀川区", "吹田市", "堺市"],
+    "神奈川県": ["横浜市西区", "横浜市港北区", "川崎市中原区", "川崎市幸区", "藤沢市"],
+    "愛知県": ["名古屋市中村区", "名古屋市中区", "名古屋市東区", "豊田市"],
+    "福岡県": ["福岡市博多区", "福岡市中央区", "北九州市小倉北区"],
+    "北海道": ["札幌市中央区", "札幌市北区"],
+    "宮城県": ["仙台市青葉区", "仙台市宮城野区"],
+    "京都府": ["京都市下京区", "京都市中京区"],
+    "兵庫県": ["神戸市中央区", "西宮市"],
+    "広島県": ["広島市中区", "広島市南区"],
+}
+
+# 職種カテゴリ: (重み, 職種名, 主なスキル, 周辺スキル, 年収の中央値（万円）)
+JOB_CATEGORIES: List[Tuple[float, List[str], List[str], List[str], int]] = [
+    (0.24, ["バックエンドエンジニア", "サーバーサイドエンジニア", "Webアプリケーションエンジニア"],
+     ["Python", "Java", "Go", "Ruby", "PHP", "Node.js", "Kotlin", "C#", "Scala"],
+     ["PostgreSQL", "MySQL", "Redis", "AWS", "Docker", "GraphQL", "REST API", "Linux"], 600),
+    (0.16, ["フロントエンドエンジニア", "UIエンジニア"],
+     ["JavaScript", "TypeScript", "React", "Vue.js", "Next.js", "Angular"],
+     ["HTML/CSS", "Figma", "Storybook", "Jest", "Webpack", "Node.js"], 560),
+    (0.10, ["インフラエンジニア", "SRE", "クラウドエンジニア"],
+     ["AWS", "GCP", "Azure", "Kubernetes", "Terraform", "Linux"],
+     ["Docker", "Ansible", "Prometheus", "Datadog", "Python", "Go", "ネットワーク"], 650),
+    (0.08, ["データエンジニア", "データサイエンティスト", "機械学習エンジニア"],
+     ["Python", "SQL", "機械学習", "BigQuery", "Spark"],
+     ["統計解析", "PyTorch", "TensorFlow", "Airflow", "dbt", "AWS", "Tableau"], 720),
+    (0.07, ["モバイルアプリエンジニア", "iOSエンジニア", "Androidエンジニア"],
+     ["Swift", "Kotlin", "Flutter", "React Native"],
+     ["Firebase", "Dart", "Objective-C", "Java", "CI/CD"], 600),
+    (0.07, ["Webデザイナー", "UI/UXデザイナー"],
+     ["Figma", "UI/UX", "Adobe XD", "Photoshop", "Illustrator"],
+     ["HTML/CSS", "JavaScript", "ユーザーリサーチ", "プロトタイピング"], 480),
+    (0.06, ["プロジェクトマネージャー", "プロダクトマネージャー", "PMO"],
+     ["プロジェクトマネジメント", "要件定義", "スクラム"],
+     ["アジャイル開発", "Jira", "ステークホルダー調整", "予算管理", "SQL"], 780),
+    (0.08, ["社内SE", "システムエンジニア", "ヘルプデスク"],
+     ["Windows Server", "Active Directory", "ネットワーク", "Microsoft 365"],
+     ["Excel VBA", "SQL", "ITIL", "Linux", "セキュリティ"], 480),
+    (0.06, ["QAエンジニア", "テストエンジニア"],
+     ["テスト設計", "Selenium", "自動テスト"],
+     ["Python", "JavaScript", "Jenkins", "CI/CD", "JSTQB"], 500),
+    (0.08, ["営業", "カスタマーサクセス", "インサイドセールス"],
+     ["法人営業", "提案営業", "Salesforce"],
+     ["顧客折衝", "SaaS", "マーケティング", "Excel"], 460),
+]
+
+INDUSTRIES = ["IT・通信", "インターネット", "SaaS", "金融", "製造", "小売・EC", "広告・メディア", "医療・ヘルスケア",
+              "人材", "不動産", "教育", "ゲーム", "コンサルティング", "物流"]
+COMPANY_SIZES = ["1-10名", "11-50名", "51-100名", "101-300名", "301-1000名", "1001名以上"]
+COMPANY_WORDS = ["アオバ", "ミライ", "サクラ", "ヒカリ", "ツバサ", "アスカ", "ホシゾラ", "カエデ", "ミナト", "ソラ",
+                 "イロハ", "ハヤテ", "コトブキ", "ヤマト", "ワカバ", "ユウキ", "アカツキ", "シズク", "ナギ", "トモエ"]
+COMPANY_SUFFIXES = ["テック", "ソリューションズ", "システムズ", "デジタル", "ラボ", "ワークス", "ネットワークス",
+                    "インタラクティブ", "データ", "クラウド"]
+SURNAMES = ["佐藤", "鈴木", "高橋", "田中", "伊藤", "渡辺", "山本", "中村", "小林", "加藤", "吉田", "山田", "佐々木",
+            "山口", "松本", "井上", "木村", "林", "斎藤", "清水", "山崎", "森", "池田", "橋本", "阿部", "石川"]
+GIVEN_NAMES = ["太郎", "翔太", "大輔", "健太", "拓也", "直樹", "亮", "翼", "蓮", "悠斗", "花子", "美咲", "陽菜", "結衣",
+               "さくら", "愛", "彩", "葵", "真由", "由美", "優子", "智子", "和也", "浩二", "誠", "舞"]
+BENEFITS = ["各種社会保険完備", "交通費全額支給", "リモートワーク手当", "書籍購入補助", "資格取得支援",
+            "フレックスタイム制", "年間休日125日以上", "住宅手当", "退職金制度", "副業可", "PC・モニター支給"]
+TAGS = ["リモート可", "フレックス", "急募", "未経験歓迎", "土日祝休み", "副業OK", "服装自由", "残業少なめ",
+        "上場企業", "スタートアップ", "女性活躍", "英語を活かせる"]
+CHAT_MESSAGES = ["{loc}で{title}の求人を探しています", "年収は{salary}万円以上を希望です", "リモートワークできる会社がいいです",
+                 "{skill}の経験を活かしたいです", "残業が少ない環境を希望します", "チーム開発の経験があります",
+                 "おすすめの求人を見せてください", "自社サービスの会社に興味があります"]
+AI_MESSAGES = ["ありがとうございます。希望の働き方について教えていただけますか？",
+               "{skill}のご経験について、もう少し詳しく教えてください。",
+               "条件に合いそうな求人をいくつかご紹介しますね。",
+               "年収と勤務地ではどちらを優先されますか？",
+               "これまでのプロジェクトで担当された役割を教えてください。"]
+
+APPLICATION_STATUSES = [
+    (ApplicationStatus.SCREENING, 0.45, "書類選考中", "yellow"),
+    (ApplicationStatus.INTERVIEW, 0.20, "一次面接待ち", "blue"),
+    (ApplicationStatus.OFFERED, 0.05, "内定", "green"),
+    (ApplicationStatus.REJECTED, 0.22, "不合格", "red"),
+    (ApplicationStatus.WITHDRAWN, 0.08, "辞退", "gray"),
+]
+SCOUT_STATUSES = [(ScoutStatus.NEW, 0.45), (ScoutStatus.READ, 0.35), (ScoutStatus.REPLIED, 0.12), (ScoutStatus.DECLINED, 0.08)]
+JOB_STATUSES = [(JobStatus.PUBLISHED, 0.80), (JobStatus.CLOSED, 0.12), (JobStatus.DRAFT, 0.08)]
+EMPLOYMENT_TYPES = [
+    (EmploymentType.FULL_TIME, 0.75), (EmploymentType.CONTRACT, 0.12),
+    (EmploymentType.PART_TIME, 0.08), (EmploymentType.INTERNSHIP, 0.05),
+]
+EMPLOYMENT_TYPE_LABELS = {
+    EmploymentType.FULL_TIME: "正社員", EmploymentType.CONTRACT: "契約社員",
+    EmploymentType.PART_TIME: "パート・アルバイト", EmploymentType.INTERNSHIP: "インターン",
+}
+REMOTE_PREFERENCES = ["フルリモート希望", "一部リモート希望", "出社可"]
+
+DEFAULT_COUNTS = {
+    "employers": 5_000,
+    "jobs": 100_000,
+    "seekers": 1_000_000,
+    "applications": 2_000_000,
+    "scouts": 300_000,
+    "chat_sessions": 200_000,
+}
+
+
+# === 乱数ユーティリティ ===
+
+def make_rng(seed: int, kind: str) -> random.Random:
+    """テーブルごとに独立した乱数（他のテーブルの件数を変えても結果が変わらない）"""
+    return random.Random(f"{seed}-{kind}")
+
+
+def synthetic_id(seed: int, kind: str, n: int) -> str:
+    """シード・種類・連番から決まる ID（行を保持せずに参照先の ID を計算できる）"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"synthetic/{seed}/{kind}/{n}"))
+
+
+def skewed_index(rng: random.Random, n: int, skew: float = 2.0) -> int:
+    """先頭ほど選ばれやすい 0..n-1（人気の偏り）"""
+    return min(int(n * rng.random() ** skew), n - 1)
+
+
+class WeightedChoice:
+    """重み付きの選択（累積重みを事前計算）"""
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        self.items = list(items)
+        total = 0.0
+        self.cumulative = []
+        for weight in weights:
+            total += weight
+            self.cumulative.append(total)
+
+    def __call__(self, rng: random.Random) -> Any:
+        return rng.choices(self.items, cum_weights=self.cumulative)[0]
+
+
+SEEKER_PREFECTURE = WeightedChoice([p for p, _ in PREFECTURES], [w for _, w in PREFECTURES])
+JOB_PREFECTURE = WeightedChoice([p for p, _ in PREFECTURES], [w * JOB_CONCENTRATION.get(p, 1.0) for p, w in PREFECTURES])
+JOB_CATEGORY = WeightedChoice(JOB_CATEGORIES, [c[0] for c in JOB_CATEGORIES])
+JOB_STATUS = WeightedChoice([s for s, _ in JOB_STATUSES], [w for _, w in JOB_STATUSES])
+EMPLOYMENT_TYPE = WeightedChoice([t for t, _ in EMPLOYMENT_TYPES], [w for _, w in EMPLOYMENT_TYPES])
+APPLICATION_STATUS = WeightedChoice(APPLICATION_STATUSES, [s[1] for s in APPLICATION_STATUSES])
+SCOUT_STATUS = WeightedChoice([s for s, _ in SCOUT_STATUSES], [w for _, w in SCOUT_STATUSES])
+EXPERIENCE_YEARS = WeightedChoice(list(range(26)), [max(0.2, 8 - abs(y - 5) * 0.6) for y in range(26)])
+
+
+def city_of(rng: random.Random, prefecture: str) -> str:
+    cities = CITIES.get(prefecture)
+    return rng.choice(cities) if cities else ""
+
+
+def salary_man_yen(rng: random.Random, median: int, experience_years: int) -> int:
+    """経験年数で中央値を補正した対数正規分布の年収（万円、10万円単位）"""
+    center = median * (0.75 + min(experience_years, 20) * 0.035)
+    value = rng.lognormvariate(math.log(center), 0.22)
+    return int(min(max(value, 240), 2000) // 10 * 10)
+
+
+def pick_skills(rng: random.Random, category: Tuple, core: int, extra: int) -> List[str]:
+    _, _, main, related, _ = category
+    skills = rng.sample(main, min(core, len(main))) + rng.sample(related, min(extra, len(related)))
+    return list(dict.fromkeys(skills))
+
+
+def person_name(rng: random.Random) -> str:
+    return f"{rng.choice(SURNAMES)} {rng.choice(GIVEN_NAMES)}"
+
+
+def random_datetime(rng: random.Random, base: datetime, max_days_ago: float, skew: float = 1.0) -> datetime:
+    """base から最大 max_days_ago 日前までの日時（skew > 1 で最近に偏る）"""
+    return base - timedelta(days=max_days_ago * rng.random() ** skew, seconds=rng.randrange(86400))
+
+
+# === 生成 ===
+
+class SyntheticDataset:
+    """件数・シード・基準日から各テーブルの行を生成する"""
+
+    def __init__(self, counts: Dict[str, int], seed: int, base: datetime):
+        self.counts = counts
+        self.seed = seed
+        self.base = base
+        self.password_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=4)).decode("utf-8")
+
+        # 企業は件数が少ないので属性を保持し、求人・スカウトから参照する
+        rng = make_rng(seed, "employer-attrs")
+        self.employers = []
+        for n in range(counts["employers"]):
+            self.employers.append({
+                "id": synthetic_id(seed, "employer", n),
+                "company": f"株式会社{rng.choice(COMPANY_WORDS)}{rng.choice(COMPANY_SUFFIXES)}"
+                           + ("" if n < len(COMPANY_WORDS) * len(COMPANY_SUFFIXES) else f"{n}"),
+                "prefecture": JOB_PREFECTURE(rng),
+                "industry": rng.choice(INDUSTRIES),
+                "size": rng.choice(COMPANY_SIZES),
+            })
+
+        # 求人ごとの企業番号と掲載日（応募・スカウトで使う）
+        self.job_employer = array("i")
+        self.job_posted = array("d")
+
+    def seeker_id(self, n: int) -> str:
+        return synthetic_id(self.seed, "seeker", n)
+
+    def job_id(self, n: int) -> str:
+        return synthetic_id(self.seed, "job", n)
+
+    def employer_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = make_rng(self.seed, "employer")
+        for n, employer in enumerate(self.employers):
+            created = random_datetime(rng, self.base, 1500)
+            yield {
+                "id": employer["id"],
+                "email": f"synthetic-{self.seed}-employer-{n}@example.com",
+                "password_hash": self.password_hash,
+                "name": person_name(rng),
+                "role": UserRole.EMPLOYER,
+                "company_name": employer["company"],
+                "industry": employer["industry"],
+                "company_size": employer["size"],
+                "company_description": f"{employer['company']}は{employer['industry']}領域でサービスを展開する企業です。",
+                "company_location": f"{employer['prefecture']}{city_of(rng, employer['prefecture'])}",
+                "subscription_tier": rng.choices(["employer_free", "employer_starter", "employer_business"], [6, 3, 1])[0],
+                "is_active": True,
+                "is_verified": rng.random() < 0.8,
+                "created_at": created,
+                "updated_at": created,
+                "last_login_at": random_datetime(rng, self.base, 60, skew=2.0),
+            }
+
+    def seeker_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = make_rng(self.seed, "seeker")
+        for n in range(self.counts["seekers"]):
+            category = JOB_CATEGORY(rng)
+            years = EXPERIENCE_YEARS(rng)
+            salary_min = salary_man_yen(rng, category[4], years)
+            salary_max = int(salary_min * rng.uniform(1.15, 1.5)) // 10 * 10
+            prefecture = SEEKER_PREFECTURE(rng)
+            created = random_datetime(rng, self.base, 1000, skew=1.3)
+            experience = f"{years}年"
+            yield {
+                "id": self.seeker_id(n),
+                "email": f"synthetic-{self.seed}-seeker-{n}@example.com",
+                "password_hash": self.password_hash,
+                "name": person_name(rng),
+                "role": UserRole.SEEKER,
+                "skills": pick_skills(rng, category, rng.randint(1, 4), rng.randint(0, 4)),
+                "experience_years": experience,
+                "experience_years_num": experience_to_years(experience),
+                "desired_salary_min": str(salary_min),
+                "desired_salary_max": str(salary_max),
+                "desired_salary_min_yen": salary_to_yen(salary_min),
+                "desired_salary_max_yen": salary_to_yen(salary_max),
+                "desired_location": "リモート" if rng.random() < 0.1 else prefecture,
+                "desired_employment_type": "正社員" if rng.random() < 0.85 else "契約社員",
+                "profile_completion": str(rng.choice(range(30, 101, 10))),
+                "subscription_tier": "seeker_free" if rng.random() < 0.93 else "seeker_standard",
+                "is_active": rng.random() < 0.97,
+                "is_verified": rng.random() < 0.6,
+                "created_at": created,
+                "updated_at": created,
+                "last_login_at": random_datetime(rng, self.base, 180, skew=2.0),
+            }
+
+    def job_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = make_rng(self.seed, "job")
+        employers = len(self.employers)
+        for n in range(self.counts["jobs"]):
+            employer_index = skewed_index(rng, employers, skew=2.5)
+            employer = self.employers[employer_index]
+            category = JOB_CATEGORY(rng)
+            title = rng.choice(category[1])
+            required = pick_skills(rng, category, rng.randint(2, 4), rng.randint(0, 2))
+            preferred = [s for s in pick_skills(rng, category, 1, rng.randint(1, 3)) if s not in required]
+            employment_type = EMPLOYMENT_TYPE(rng)
+            years = rng.randint(1, 8)
+            salary_min = salary_man_yen(rng, category[4], years)
+            salary_max = int(salary_min * rng.uniform(1.2, 1.7)) // 10 * 10
+            remote = rng.random() < 0.35
+            # 企業の所在地を中心に、一部は別拠点の求人
+            prefecture = employer["prefecture"] if rng.random() < 0.8 else JOB_PREFECTURE(rng)
+            location = f"{prefecture}{city_of(rng, prefecture)}"
+            status = JOB_STATUS(rng)
+            posted = random_datetime(rng, self.base, 365, skew=1.6)
+            tags = rng.sample(TAGS, rng.randint(1, 4))
+            if remote and "リモート可" not in tags:
+                tags.insert(0, "リモート可")
+
+            self.job_employer.append(employer_index)
+            self.job_posted.append(posted.timestamp())
+
+            description = "\n\n".join([
+                f"【{employer['company']}】{title}を募集しています。",
+                f"{employer['industry']}領域の自社サービスの開発・運用を担当していただきます。"
+                f"主に{'、'.join(required)}を使用し、企画から設計・実装・リリースまで一貫して関わることができます。",
+                "チームはエンジニア・デザイナー・PMで構成され、スクラムで2週間ごとにリリースしています。"
+                "コードレビューやドキュメント文化が根付いており、技術的な挑戦を歓迎する環境です。" * rng.randint(1, 3),
+                f"勤務地: {location}{'（リモート可）' if remote else ''}",
+            ])
+            yield {
+                "id": self.job_id(n),
+                "employer_id": employer["id"],
+                "title": f"{title}（{'・'.join(required[:2])}）",
+                "company": employer["company"],
+                "description": description,
+                "location": location,
+                "employment_type": employment_type,
+                "salary_min": salary_min,
+                "salary_max": salary_max,
+                "salary_text": f"年収{salary_min}万円〜{salary_max}万円",
+                "salary_min_yen": salary_to_yen(salary_min),
+                "salary_max_yen": salary_to_yen(salary_max),
+                "required_skills": required,
+                "preferred_skills": preferred,
+                "requirements": f"{'、'.join(required)}を用いた開発経験{years}年以上",
+                "benefits": "、".join(rng.sample(BENEFITS, rng.randint(3, 6))),
+                "tags": tags,
+                "remote": remote,
+                "status": status,
+                "featured": rng.random() < 0.03,
+                "view_count": int(rng.paretovariate(1.3) * 20),
+                "posted_date": posted if status != JobStatus.DRAFT else None,
+                "created_at": posted - timedelta(days=rng.randint(0, 14)),
+                "updated_at": posted,
+            }
+
+    def preference_rows(self) -> Iterator[Dict[str, Any]]:
+        """チャットを利用した求職者の Step2 の希望条件"""
+        rng = make_rng(self.seed, "preference")
+        seekers = self.counts["seekers"]
+        for n in range(min(self.counts["chat_sessions"], seekers)):
+            category = JOB_CATEGORY(rng)
+            prefecture = SEEKER_PREFECTURE(rng)
+            salary_min = salary_man_yen(rng, category[4], EXPERIENCE_YEARS(rng))
+            created = random_datetime(rng, self.base, 365, skew=1.5).replace(tzinfo=None)
+            yield {
+                "user_id": self.seeker_id(n),
+                "job_title": rng.choice(category[1]),
+                "location_prefecture": prefecture,
+                "location_city": city_of(rng, prefecture) or None,
+                "salary_min": salary_min,
+                "salary_max": int(salary_min * 1.3) // 10 * 10,
+                "salary_min_yen": salary_to_yen(salary_min),
+                "remote_work_preference": rng.choice(REMOTE_PREFERENCES),
+                "employment_type": "正社員",
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def application_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = make_rng(self.seed, "application")
+        jobs, seekers = len(self.job_employer), self.counts["seekers"]
+        for n in range(self.counts["applications"]):
+            job_index = skewed_index(rng, jobs, skew=2.0)
+            status, _, detail, color = APPLICATION_STATUS(rng)
+            posted = datetime.fromtimestamp(self.job_posted[job_index], tz=timezone.utc)
+            days_open = max((self.base - posted).total_seconds() / 86400, 0.1)
+            applied = posted + timedelta(days=days_open * rng.random() ** 1.5)
+            updated = applied + timedelta(days=rng.uniform(0, min(days_open, 30)))
+            yield {
+                "id": synthetic_id(self.seed, "application", n),
+                "seeker_id": self.seeker_id(skewed_index(rng, seekers, skew=1.5)),
+                "job_id": self.job_id(job_index),
+                "status": status,
+                "status_detail": detail,
+                "status_color": color,
+                "match_score": int(min(max(rng.gauss(68, 12), 20), 99)),
+                "next_step": "面接日程の調整" if status == ApplicationStatus.INTERVIEW else None,
+                "interview_date": updated + timedelta(days=rng.randint(3, 14)) if status == ApplicationStatus.INTERVIEW else None,
+                "resume_submitted": "true",
+                "portfolio_submitted": "true" if rng.random() < 0.3 else "false",
+                "message": "ご検討のほどよろしくお願いいたします。" if rng.random() < 0.4 else None,
+                "applied_at": applied,
+                "created_at": applied,
+                "updated_at": min(updated, self.base),
+            }
+
+    def scout_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = make_rng(self.seed, "scout")
+        jobs, seekers = len(self.job_employer), self.counts["seekers"]
+        for n in range(self.counts["scouts"]):
+            job_index = skewed_index(rng, jobs, skew=1.5)
+            employer = self.employers[self.job_employer[job_index]]
+            status = SCOUT_STATUS(rng)
+            created = random_datetime(rng, self.base, 180, skew=1.5)
+            read_at = created + timedelta(hours=rng.uniform(1, 72)) if status != ScoutStatus.NEW else None
+            yield {
+                "id": synthetic_id(self.seed, "scout", n),
+                "employer_id": employer["id"],
+                "seeker_id": self.seeker_id(rng.randrange(seekers)),
+                "job_id": self.job_id(job_index),
+                "title": f"{employer['company']}からのスカウト",
+                "message": f"はじめまして。{employer['company']}の採用担当です。"
+                           "ご経歴を拝見し、ぜひ一度カジュアルにお話しできればと思いご連絡しました。",
+                "match_score": int(min(max(rng.gauss(75, 10), 30), 99)),
+                "status": status,
+                "tags": json.dumps(rng.sample(TAGS, rng.randint(1, 3)), ensure_ascii=False),
+                "created_at": created,
+                "updated_at": read_at or created,
+                "read_at": read_at,
+                "replied_at": read_at + timedelta(hours=rng.uniform(1, 48)) if status == ScoutStatus.REPLIED else None,
+            }
+
+    def chat_session_rows(self) -> Iterator[Dict[str, Any]]:
+        rng = make_rng(self.seed, "chat")
+        seekers = self.counts["seekers"]
+        for n in range(self.counts["chat_sessions"]):
+            session_id = synthetic_id(self.seed, "chat", n)
+            # 希望条件（preference_rows）を持つ求職者のセッション
+            user_id = self.seeker_id(n % seekers)
+            category = JOB_CATEGORY(rng)
+            skill = rng.choice(category[2])
+            values = {
+                "loc": SEEKER_PREFECTURE(rng),
+                "title": rng.choice(category[1]),
+                "salary": salary_man_yen(rng, category[4], 5),
+                "skill": skill,
+            }
+            turns = min(int(rng.expovariate(1 / 4)) + 1, 15)
+            history = []
+            for turn in range(1, turns + 1):
+                history.append({"role": "user", "content": rng.choice(CHAT_MESSAGES).format(**values), "turn": str(turn)})
+                history.append({"role": "assistant", "content": rng.choice(AI_MESSAGES).format(**values), "turn": str(turn)})
+            scores = [round(min(20 + turn * rng.uniform(4, 9), 95), 1) for turn in range(1, turns + 1)]
+            created = random_datetime(rng, self.base, 180, skew=1.5).replace(tzinfo=None)
+            updated = created + timedelta(minutes=turns * rng.uniform(0.5, 3))
+            yield {
+                "session_id": session_id,
+                "user_id": user_id,
+                "session_data": {
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "turn_count": turns,
+                    "current_score": scores[-1],
+                    "score_history": scores,
+                    "is_deep_dive_previous": rng.random() < 0.3,
+                    "deep_dive_count": rng.randint(0, 2),
+                    "conversation_history": history,
+                    "user_preferences": {"job_title": values["title"], "location": values["loc"]},
+                    "created_at": created.isoformat(),
+                    "updated_at": updated.isoformat(),
+                },
+                "created_at": created,
+                "updated_at": updated,
+            }
+
+
+# === 書き込み ===
+
+def batched(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def copy_value(value: Any) -> Any:
+    """COPY (FORMAT csv) 用の値（Enum はカラムと同じく名前で保存）"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class BulkWriter:
+    """PostgreSQL は COPY、その他（SQLite）は executemany のバルクINSERTで書き込む"""
+
+    def __init__(self, engine: Engine, batch_size: int):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.postgres = engine.dialect.name == "postgresql"
+
+    def write(self, table: Table, rows: Iterable[Dict[str, Any]]) -> int:
+        started = time.perf_counter()
+        total = 0
+        if self.postgres:
+            raw = self.engine.raw_connection()
+            try:
+                cursor = raw.cursor()
+                for batch in batched(rows, self.batch_size):
+                    columns = list(batch[0])
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer)
+                    for row in batch:
+                        writer.writerow([copy_value(row[c]) for c in columns])
+                    buffer.seek(0)
+                    cursor.copy_expert(
+                        f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                        buffer,
+                    )
+                    raw.commit()
+                    total += len(batch)
+                    self._progress(table.name, total, started)
+                cursor.close()
+            finally:
+                raw.close()
+        else:
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA synchronous = OFF")
+                conn.commit()  # PRAGMA で自動的に始まったトランザクションを閉じる
+                for batch in batched(rows, self.batch_size):
+                    with conn.begin():
+                        conn.execute(table.insert(), batch)
+                    total += len(batch)
+                    self._progress(table.name, total, started)
+
+        elapsed = time.perf_counter() - started
+        print(f"\r  {table.name:<26} {total:>10,}件  {elapsed:>7.1f}秒  ({total / elapsed if elapsed else 0:,.0f}件/秒)")
+        return total
+
+    @staticmethod
+    def _progress(name: str, total: int, started: float) -> None:
+        print(f"\r  {name:<26} {total:>10,}件  {time.perf_counter() - started:>7.1f}秒", end="", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="負荷試験・ベンチマーク用の合成データを生成")
+    parser.add_argument("--scale", type=float, default=1.0, help="すべての件数に掛ける倍率")
+    parser.add_argument("--seed", type=int, default=42, help="乱数シード（ID もシードから決まる）")
+    parser.add_argument("--batch-size", type=int, default=10000, help="COPY / INSERT 1回あたりの行数")
+    parser.add_argument("--base-date", type=date.fromisoformat, default=date.today(),
+                        help="日時の基準日（YYYY-MM-DD、既定は今日）")
+    for name, default in DEFAULT_COUNTS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default, help=f"件数（既定 {default:,}）")
+    args = parser.parse_args()
+
+    counts = {name: max(int(getattr(args, name) * args.scale), 1) for name in DEFAULT_COUNTS}
+    base = datetime.combine(args.base_date, dt_time(12, 0), tzinfo=timezone.utc)
+
+    engine = get_engine()
+    print(f"接続先: {engine.url.render_as_string(hide_password=True)}")
+    with engine.connect() as connection:
+        version = current_version(connection)
+    if version is None or version < LATEST_VERSION:
+        print("❌ 未適用のマイグレーションがあります。先に python scripts/migrate.py apply を実行してください")
+        sys.exit(1)
+
+    dataset = SyntheticDataset(counts, args.seed, base)
+    with engine.connect() as connection:
+        exists = connection.execute(
+            text("SELECT 1 FROM users WHERE id = :id"), {"id": dataset.employers[0]["id"]}
+        ).first()
+    if exists:
+        print(f"❌ シード {args.seed} のデータは生成済みです（別の --seed を指定するか、データベースを作り直してください）")
+        sys.exit(1)
+
+    print(f"シード {args.seed} / 基準日 {args.base_date} / " + ", ".join(f"{k} {v:,}" for k, v in counts.items()) + "\n")
+    writer = BulkWriter(engine, args.batch_size)
+    started = time.perf_counter()
+
+    writer.write(User.__table__, dataset.employer_rows())
+    writer.write(User.__table__, dataset.seeker_rows())
+    writer.write(Job.__table__, dataset.job_rows())
+    writer.write(UserPreferencesProfile.__table__, dataset.preference_rows())
+    writer.write(Application.__table__, dataset.application_rows())
+    writer.write(Scout.__table__, dataset.scout_rows())
+    writer.write(ChatSession.__table__, dataset.chat_session_rows())
+
+    # 大量投入後の統計情報を更新（プランナが新しい件数で計画を立てるように）
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE"))
+
+    print(f"\n合計 {time.perf_counter() - started:.1f}秒で生成しました！")
+    print("企業ダッシュボードの統計は python scripts/rebuild_employer_stats.py で作成してください")
+
+
+if __name__ == "__main__":
+    main()
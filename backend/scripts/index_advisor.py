@@ -0,0 +1,377 @@
+#!/usr/bin/env python
+"""
+インデックス候補を EXPLAIN と実測で検証するスクリプト
+アプリで記録したクエリ（QUERY_CAPTURE_PATH）をローカルのデータベースで再実行し、
+実行計画でシーケンシャルスキャン・ソートになっているテーブルについて
+WHERE / JOIN / ORDER BY のカラムから複合インデックスの候補を作り、
+1つずつ作成して実行時間の改善を計測します（計測後は削除、--keep で残す）
+
+前提:
+  1. 代表的なデータを入れたローカルDBで、QUERY_CAPTURE_PATH を設定してアプリ・ベンチマークを動かし、
+     終了時にクエリを記録しておく（例: QUERY_CAPTURE_PATH=./data/query_capture.jsonl）
+  2. 同じDBに対してこのスクリプトを実行する
+
+使用方法:
+  python scripts/index_advisor.py [--capture ./data/query_capture.jsonl] [--top 20] [--repeat 5]
+                                  [--min-gain 0.2] [--keep] [--allow-remote]
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+"""
+import argparse
+import json
+import re
+import statistics
+import sys
+import os
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+
+from app.core.query_log import normalize_statement
+from app.db.session import get_engine
+
+# 候補インデックスのカラム数の上限
+MAX_INDEX_COLUMNS = 4
+
+# FROM / JOIN の直後に来てもテーブルの別名ではない語
+_NOT_ALIAS = {
+    "where", "join", "left", "right", "inner", "outer", "full", "cross", "on", "using", "order",
+    "group", "limit", "offset", "having", "union", "for", "lateral", "natural", "as",
+}
+
+_TABLE_RE = re.compile(r"\b(?:from|join)\s+(\w+)(?:\s+(?:as\s+)?(\w+))?")
+_COLUMN = r"(?:(\w+)\.)?(\w+)"
+_EQ_RE = re.compile(_COLUMN + r"\s*(?:=\s*\?|in\s*\(|is\s+(?:not\s+)?null)")
+_RANGE_RE = re.compile(_COLUMN + r"\s*(?:<=|>=|<|>|between\b|like\b|ilike\b)\s*(?:\?|lower|upper|\()")
+_JOIN_RE = re.compile(_COLUMN + r"\s*=\s*" + _COLUMN + r"(?!\s*\()")
+_ORDER_RE = re.compile(r"\border by\s+(.+?)(?:\blimit\b|\boffset\b|\bfor\b|\)|$)")
+
+
+def load_captures(path: str, dialect: str) -> List[Dict[str, Any]]:
+    """記録したクエリを読み込み、フィンガープリントごとにまとめる（再実行できる SELECT だけ）"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            statement = entry.get("statement") or ""
+            if entry.get("dialect") != dialect or entry.get("params") is None:
+                continue
+            if not re.match(r"\s*(select|with)\b", statement, re.I):
+                continue
+
+            current = merged.get(entry["fingerprint"])
+            if current is None:
+                merged[entry["fingerprint"]] = entry
+                continue
+            # 複数ワーカー・複数回の記録は合算し、サンプルは遅い方を使う
+            count = current["count"] + entry["count"]
+            total_ms = current["total_ms"] + entry["total_ms"]
+            if entry["max_ms"] > current["max_ms"]:
+                current = merged[entry["fingerprint"]] = entry
+            current["count"], current["total_ms"] = count, total_ms
+
+    return sorted(merged.values(), key=lambda e: e["total_ms"], reverse=True)
+
+
+def run_query(cursor, statement: str, params: Any) -> None:
+    cursor.execute(statement, params)
+    if cursor.description is not None:
+        cursor.fetchall()
+
+
+def measure(raw, statement: str, params: Any, repeat: int) -> float:
+    """実行時間の中央値（ミリ秒、初回のウォームアップを除く）"""
+    cursor = raw.cursor()
+    try:
+        run_query(cursor, statement, params)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run_query(cursor, statement, params)
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+    finally:
+        cursor.close()
+        raw.rollback()
+
+
+def explain(raw, dialect: str, statement: str, params: Any) -> Tuple[List[str], Set[str]]:
+    """
+    実行計画
+
+    Returns:
+        (計画の各行, シーケンシャルスキャン・ソートになっているテーブル名または別名)
+    """
+    cursor = raw.cursor()
+    lines: List[str] = []
+    flagged: Set[str] = set()
+    try:
+        if dialect == "postgresql":
+            cursor.execute("EXPLAIN (FORMAT JSON) " + statement, params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            _walk_pg_plan(plan[0]["Plan"], 0, lines, flagged)
+        else:
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, params)
+            for row in cursor.fetchall():
+                detail = row[-1]
+                lines.append(detail)
+                match = re.match(r"SCAN (?:TABLE )?(\w+)(?: AS (\w+))?", detail)
+                if match and "USING" not in detail:
+                    flagged.add((match.group(2) or match.group(1)).lower())
+                if "TEMP B-TREE" in detail:
+                    flagged.add("*sort*")
+    finally:
+        cursor.close()
+        raw.rollback()
+    return lines, flagged
+
+
+def _walk_pg_plan(node: Dict[str, Any], depth: int, lines: List[str], flagged: Set[str]) -> None:
+    node_type = node.get("Node Type", "")
+    relation = node.get("Relation Name")
+    label = f"{'  ' * depth}{node_type}"
+    if relation:
+        label += f" on {relation}"
+        if node.get("Alias") and node["Alias"] != relation:
+            label += f" {node['Alias']}"
+    if node.get("Index Name"):
+        label += f" using {node['Index Name']}"
+    label += f" (rows={node.get('Plan Rows')}, cost={node.get('Total Cost')})"
+    lines.append(label)
+
+    if node_type == "Seq Scan" and relation:
+        flagged.add((node.get("Alias") or relation).lower())
+    if node_type in ("Sort", "Incremental Sort"):
+        flagged.add("*sort*")
+    for child in node.get("Plans", []):
+        _walk_pg_plan(child, depth + 1, lines, flagged)
+
+
+def parse_aliases(normalized: str) -> Dict[str, str]:
+    """別名（またはテーブル名）→ テーブル名"""
+    aliases: Dict[str, str] = {}
+    for table, alias in _TABLE_RE.findall(normalized):
+        if table in _NOT_ALIAS or table == "?":
+            continue
+        aliases[table] = table
+        if alias and alias not in _NOT_ALIAS:
+            aliases[alias] = table
+    return aliases
+
+
+def propose_indexes(
+    statement: str,
+    flagged: Set[str],
+    table_columns: Dict[str, Set[str]],
+) -> List[Tuple[str, Tuple[str, ...]]]:
+    """
+    インデックス候補 (テーブル, カラム) を作る
+
+    等価条件（= / IN / IS NULL / JOIN の結合キー）のカラムを先に、
+    範囲条件か ORDER BY のカラムを後に並べる
+    """
+    normalized = normalize_statement(statement)
+    aliases = parse_aliases(normalized)
+    tables = set(aliases.values())
+    default_table = next(iter(tables)) if len(tables) == 1 else None
+
+    def resolve(qualifier: str, column: str) -> Optional[Tuple[str, str]]:
+        table = aliases.get(qualifier) if qualifier else default_table
+        if table is None or column not in table_columns.get(table, set()):
+            return None
+        return table, column
+
+    equality: Dict[str, List[str]] = {}
+    ranges: Dict[str, List[str]] = {}
+    ordering: Dict[str, List[str]] = {}
+
+    def add(target: Dict[str, List[str]], resolved: Optional[Tuple[str, str]]) -> None:
+        if resolved and resolved[1] not in target.setdefault(resolved[0], []):
+            target[resolved[0]].append(resolved[1])
+
+    for qualifier, column in _EQ_RE.findall(normalized):
+        add(equality, resolve(qualifier, column))
+    for left_q, left_c, right_q, right_c in _JOIN_RE.findall(normalized):
+        if left_q and right_q:
+            add(equality, resolve(left_q, left_c))
+            add(equality, resolve(right_q, right_c))
+    for qualifier, column in _RANGE_RE.findall(normalized):
+        add(ranges, resolve(qualifier, column))
+
+    order_match = _ORDER_RE.search(normalized)
+    if order_match:
+        for part in order_match.group(1).split(","):
+            match = re.match(r"\s*" + _COLUMN + r"(?:\s+(?:asc|desc))?(?:\s+nulls\s+(?:first|last))?\s*$", part)
+            if match:
+                add(ordering, resolve(match.group(1), match.group(2)))
+
+    # 計画で問題のあったテーブルだけを対象にする（ソートはどのテーブルでも対象）
+    flagged_tables = {aliases.get(name, name) for name in flagged}
+    targets = tables if "*sort*" in flagged else tables & flagged_tables
+
+    candidates: List[Tuple[str, Tuple[str, ...]]] = []
+    for table in sorted(targets):
+        eq = equality.get(table, [])
+        order = [c for c in ordering.get(table, []) if c not in eq]
+        rng = [c for c in ranges.get(table, []) if c not in eq]
+        tail = order or rng[:1]
+        for columns in (eq + tail, eq):
+            columns = tuple(columns[:MAX_INDEX_COLUMNS])
+            if columns and (table, columns) not in candidates:
+                candidates.append((table, columns))
+    return candidates
+
+
+def existing_index_prefixes(inspector, table: str) -> List[Tuple[str, ...]]:
+    """既存のインデックス（主キー・ユニーク制約を含む）のカラム列"""
+    prefixes = []
+    pk = inspector.get_pk_constraint(table).get("constrained_columns") or []
+    if pk:
+        prefixes.append(tuple(pk))
+    for index in inspector.get_indexes(table):
+        prefixes.append(tuple(c for c in index.get("column_names", []) if c))
+    for constraint in inspector.get_unique_constraints(table):
+        prefixes.append(tuple(constraint.get("column_names", [])))
+    return prefixes
+
+
+def is_covered(columns: Tuple[str, ...], prefixes: List[Tuple[str, ...]]) -> bool:
+    """既存インデックスの先頭カラムで候補を満たせるか"""
+    return any(prefix[:len(columns)] == columns for prefix in prefixes)
+
+
+def index_name(table: str, columns: Tuple[str, ...]) -> str:
+    return f"ix_{table}_{'_'.join(columns)}"[:63]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="記録したクエリからインデックス候補を検証")
+    parser.add_argument("--capture", default="./data/query_capture.jsonl", help="QUERY_CAPTURE_PATH に記録したファイル")
+    parser.add_argument("--top", type=int, default=20, help="合計実行時間の上位何件のクエリを対象にするか")
+    parser.add_argument("--repeat", type=int, default=5, help="1クエリあたりの計測回数")
+    parser.add_argument("--min-gain", type=float, default=0.2, help="採用する改善率の下限（0.2 = 20%%短縮）")
+    parser.add_argument("--keep", action="store_true", help="採用したインデックスを削除せずに残す")
+    parser.add_argument("--allow-remote", action="store_true", help="localhost 以外のDBでも実行する")
+    args = parser.parse_args()
+
+    engine = get_engine()
+    dialect = engine.dialect.name
+    host = engine.url.host
+    print(f"接続先: {engine.url.render_as_string(hide_password=True)}")
+    if host not in (None, "", "localhost", "127.0.0.1", "::1") and not args.allow_remote:
+        print("❌ インデックスを作成・削除するため、ローカル以外のDBでは --allow-remote が必要です")
+        sys.exit(1)
+
+    if not os.path.exists(args.capture):
+        print(f"❌ {args.capture} がありません（QUERY_CAPTURE_PATH を設定してアプリを動かし、記録してください）")
+        sys.exit(1)
+
+    captures = load_captures(args.capture, dialect)[:args.top]
+    print(f"対象クエリ: {len(captures)}件（{dialect}）\n")
+    if not captures:
+        return
+
+    inspector = inspect(engine)
+    table_columns = {
+        table: {column["name"] for column in inspector.get_columns(table)}
+        for table in inspector.get_table_names()
+    }
+
+    raw = engine.raw_connection()
+    try:
+        # 1. 現状の計測と候補の洗い出し
+        baselines: Dict[str, float] = {}
+        candidates: Dict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]] = {}
+        for entry in captures:
+            statement, params = entry["statement"], entry["params"]
+            try:
+                baselines[entry["fingerprint"]] = measure(raw, statement, params, args.repeat)
+                _, flagged = explain(raw, dialect, statement, params)
+            except Exception as e:
+                print(f"  ⚠️  [{entry['fingerprint']}] 再実行できません: {e}")
+                raw.rollback()
+                continue
+
+            print(f"[{entry['fingerprint']}] {entry['count']}回 / 計 {entry['total_ms']:.0f}ms / 再実行 {baselines[entry['fingerprint']]:.2f}ms")
+            print(f"  {normalize_statement(statement)[:200]}")
+            for table, columns in propose_indexes(statement, flagged, table_columns):
+                if is_covered(columns, existing_index_prefixes(inspector, table)):
+                    continue
+                candidates.setdefault((table, columns), []).append(entry)
+                print(f"  → 候補: {table}({', '.join(columns)})")
+
+        if not candidates:
+            print("\nインデックスの候補はありません")
+            return
+
+        # 2. 候補を1つずつ作成して計測
+        print(f"\n{len(candidates)}件の候補を検証します\n")
+        results = []
+        for (table, columns), entries in candidates.items():
+            name = index_name(table, columns)
+            cursor = raw.cursor()
+            try:
+                cursor.execute(f"CREATE INDEX {name} ON {table} ({', '.join(columns)})")
+                cursor.execute(f"ANALYZE {table}")
+                raw.commit()
+            except Exception as e:
+                raw.rollback()
+                print(f"  ⚠️  {name} を作成できません: {e}")
+                continue
+            finally:
+                cursor.close()
+
+            before_total = after_total = saved_ms = 0.0
+            used = False
+            for entry in entries:
+                before = baselines[entry["fingerprint"]]
+                after = measure(raw, entry["statement"], entry["params"], args.repeat)
+                plan, _ = explain(raw, dialect, entry["statement"], entry["params"])
+                used = used or any(name in line for line in plan)
+                before_total += before
+                after_total += after
+                # 本番での実行回数で重み付けした短縮時間
+                saved_ms += (before - after) * entry["count"]
+
+            gain = 1 - after_total / before_total if before_total else 0.0
+            accepted = used and gain >= args.min_gain
+            results.append((table, columns, name, before_total, after_total, gain, saved_ms, used, accepted))
+
+            if not (accepted and args.keep):
+                cursor = raw.cursor()
+                cursor.execute(f"DROP INDEX {name}")
+                raw.commit()
+                cursor.close()
+
+        # 3. 結果
+        results.sort(key=lambda r: r[6], reverse=True)
+        print(f"  {'インデックス':<50} {'前':>9} {'後':>9} {'改善':>7} {'短縮(回数重み)':>14}  判定")
+        for table, columns, name, before, after, gain, saved, used, accepted in results:
+            verdict = "✅ 採用" if accepted else ("❌ 未使用" if not used else "➖ 効果小")
+            print(
+                f"  {table + '(' + ', '.join(columns) + ')':<50} {before:>7.2f}ms {after:>7.2f}ms "
+                f"{gain * 100:>6.1f}% {saved:>12.0f}ms  {verdict}"
+            )
+
+        accepted = [r for r in results if r[8]]
+        if accepted:
+            print("\napp/db/migrations.py に追加するマイグレーションの例:\n")
+            for table, columns, name, *_ in accepted:
+                print(f'    _create_indexes(connection, "{table}", [("{name}", "{", ".join(columns)}")])')
+            if args.keep:
+                print("\n採用したインデックスはDBに残しています（--keep）")
+    finally:
+        raw.close()
+
+
+if __name__ == "__main__":
+    main()
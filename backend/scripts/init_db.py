@@ -16,12 +16,13 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.db.session import get_engine
-from app.db.base import Base
+from app.db.migrations import MigrationRunner
 
 # すべてのモデルをインポート（テーブル作成に必要）
 from app.models.user import User
 from app.models.job import Job
 from app.models.application import Application
+from app.models.employer_stats import EmployerStats
 from app.models.scout import Scout
 from app.models.resume import Resume
 from app.models.company import Company
@@ -37,9 +38,10 @@ def init_database():
     engine = get_engine()
     print(f"接続先: {engine.url}")
 
-    # テーブルを作成
+    # テーブルを作成（マイグレーションとして適用し、台帳に記録する）
     print("テーブルを作成中...")
-    Base.metadata.create_all(bind=engine)
+    applied = MigrationRunner(engine).apply()
+    print(f"マイグレーションを{len(applied)}件適用しました")
 
     # 作成されたテーブルを確認
     from sqlalchemy import inspect
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+データベースマイグレーションを確認・適用するスクリプト
+app/db/migrations.py に定義したマイグレーションのうち未適用のものをバージョン順に適用し、
+schema_migrations（台帳）に記録します。アプリの起動時にはスキーマ変更を行わないため、
+デプロイ時にアプリの起動前に実行してください。
+
+使用方法:
+  python scripts/migrate.py status
+  python scripts/migrate.py apply [--target <バージョン>]
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+"""
+import argparse
+import sys
+import os
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.migrations import MigrationError, MigrationRunner
+
+STATE_LABELS = {
+    "applied": "✅ 適用済み",
+    "pending": "⏳ 未適用",
+    "changed": "❌ 適用後に変更あり",
+    "unknown": "❓ 定義なし",
+}
+
+
+def show_status(runner: MigrationRunner) -> None:
+    print(f"接続先: {runner.engine.url.render_as_string(hide_password=True)}\n")
+    for item in runner.status():
+        applied_at = f"（{item['applied_at']}）" if item["applied_at"] else ""
+        print(f"  {item['version']:04d}_{item['name']:<30} {STATE_LABELS[item['state']]}{applied_at}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="データベースマイグレーション")
+    parser.add_argument("command", nargs="?", choices=["status", "apply"], default="status")
+    parser.add_argument("--target", type=int, help="このバージョンまで適用")
+    args = parser.parse_args()
+
+    runner = MigrationRunner()
+
+    if args.command == "status":
+        show_status(runner)
+        return
+
+    try:
+        applied = runner.apply(target=args.target)
+    except MigrationError as e:
+        print(f"❌ マイグレーションを中止しました: {e}")
+        sys.exit(1)
+
+    if applied:
+        for m in applied:
+            print(f"  + {m.version:04d}_{m.name}")
+        print(f"\n{len(applied)}件のマイグレーションを適用しました！")
+    else:
+        print("適用するマイグレーションはありません")
+
+
+if __name__ == "__main__":
+    main()
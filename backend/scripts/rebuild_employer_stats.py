@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+"""
+企業統計（employer_stats）を再集計するスクリプト
+求人・応募のステータス別件数を FILTER 集計で数え直し、カウンターのずれを修正します
+（ORMを経由しない一括更新や手動でのデータ修正の後に実行してください）
+employer_stats テーブルは事前に scripts/migrate.py apply で作成してください。
+
+使用方法:
+  python scripts/rebuild_employer_stats.py [--employer-id <ID>]
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+"""
+import argparse
+import sys
+import os
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.models.employer_stats import rebuild_employer_stats
+from app.services.employer_stats_service import EmployerStatsService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="企業統計の再集計")
+    parser.add_argument("--employer-id", help="指定した企業のみ再集計")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.employer_id:
+            counts = rebuild_employer_stats(db.connection(), args.employer_id)
+            db.commit()
+            print(f"企業 {args.employer_id} を再集計しました")
+            for name, value in counts.items():
+                print(f"  - {name}: {value}")
+            return
+
+        print("全企業の統計を再集計中...")
+        result = EmployerStatsService(db).reconcile_all()
+        print(f"  - 作成: {result['created']}件")
+        print(f"  - 修正: {result['updated']}件")
+        print(f"  - 0にリセット: {result['reset']}件")
+        print(f"  - 変更なし: {result['unchanged']}件")
+        print("\n再集計が完了しました！")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
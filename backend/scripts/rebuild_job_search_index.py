@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+求人の全文検索インデックスを作成・再構築するスクリプト
+SQLite では FTS5 テーブルを jobs から作り直し、PostgreSQL では検索用インデックスを再構築します
+（インデックス・同期用のトリガー・生成列は scripts/migrate.py apply で作成してください）
+
+使用方法:
+  python scripts/rebuild_job_search_index.py [--query キーワード]
+
+環境変数:
+  DATABASE_URL: データベース接続URL (未設定の場合はSQLiteを使用)
+"""
+import argparse
+import sys
+import os
+import time
+
+# プロジェクトルートをパスに追加
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.session import SessionLocal
+from app.db.job_search import setup_job_search
+from app.models.job import Job, JobStatus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="求人の全文検索インデックスを再構築")
+    parser.add_argument("--query", help="再構築後に試しに検索するキーワード")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        backend = setup_job_search(db.connection())
+        print(f"検索バックエンド: {backend.name}")
+        if not backend.ready:
+            print("❌ 全文検索インデックスが作成されていません（LIKE 検索で動作します）")
+            print("   python scripts/migrate.py apply を実行してください")
+            return
+
+        started = time.perf_counter()
+        count = backend.rebuild(db)
+        print(f"✅ {count}件をインデックスしました（{time.perf_counter() - started:.2f}秒）")
+
+        if args.query:
+            query, relevance_order = backend.apply(
+                db.query(Job).filter(Job.status == JobStatus.PUBLISHED), args.query
+            )
+            if relevance_order is not None:
+                query = query.order_by(*relevance_order)
+            started = time.perf_counter()
+            jobs = query.limit(10).all()
+            print(f"\n🔍 「{args.query}」: {len(jobs)}件（{(time.perf_counter() - started) * 1000:.1f}ms）")
+            for job in jobs:
+                print(f"  - {job.title} / {job.company}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,6 @@ import sys
 import os
 import uuid
 from datetime import datetime, timedelta
-import json
 
 # プロジェクトルートをパスに追加
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -48,7 +47,7 @@ def seed_users(db):
             "password_hash": get_password_hash("password123"),
             "name": "山田 太郎",
             "role": UserRole.SEEKER,
-            "skills": json.dumps(["Python", "JavaScript", "React", "AWS"]),
+            "skills": ["Python", "JavaScript", "React", "AWS"],
             "experience_years": "5",
             "desired_salary_min": "600",
             "desired_salary_max": "800",
@@ -62,7 +61,7 @@ def seed_users(db):
             "password_hash": get_password_hash("password123"),
             "name": "佐藤 花子",
             "role": UserRole.SEEKER,
-            "skills": json.dumps(["UI/UX", "Figma", "Adobe XD", "HTML/CSS"]),
+            "skills": ["UI/UX", "Figma", "Adobe XD", "HTML/CSS"],
             "experience_years": "3",
             "desired_salary_min": "500",
             "desired_salary_max": "700",
@@ -76,7 +75,7 @@ def seed_users(db):
             "password_hash": get_password_hash("password123"),
             "name": "鈴木 一郎",
             "role": UserRole.SEEKER,
-            "skills": json.dumps(["Java", "Spring Boot", "MySQL", "Docker"]),
+            "skills": ["Java", "Spring Boot", "MySQL", "Docker"],
             "experience_years": "7",
             "desired_salary_min": "700",
             "desired_salary_max": "1000",
@@ -258,8 +257,8 @@ def seed_jobs(db, employers):
                 salary_min=job_data["salary_min"],
                 salary_max=job_data["salary_max"],
                 employment_type=job_data["employment_type"],
-                required_skills=json.dumps(job_data["required_skills"]),
-                preferred_skills=json.dumps(job_data["preferred_skills"]),
+                required_skills=job_data["required_skills"],
+                preferred_skills=job_data["preferred_skills"],
                 remote=job_data["remote"],
                 status=job_data["status"],
             )
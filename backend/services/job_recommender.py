@@ -5,6 +5,10 @@
 from typing import List, Dict, Any, Tuple
 from config.database import get_db_conn
 from models.chat_models import JobRecommendation
+from app.utils.topk import TopK
+
+# _calculate_job_score の上限
+MAX_JOB_SCORE = 95.0
 
 
 class JobRecommender:
@@ -122,22 +126,20 @@ class JobRecommender:
                 return []
 
             # スコアリングして上位だけ返す
-            scored_jobs = []
+            top = TopK(limit)
             for job in jobs:
+                # 上位がすべてスコア上限に達していれば残りは入らない
+                if not top.can_accept(MAX_JOB_SCORE):
+                    break
                 score = JobRecommender._calculate_job_score(
                     job,
                     user_preferences,
                     conversation_keywords
                 )
-                scored_jobs.append({'job': job, 'score': score})
-
-            scored_jobs.sort(key=lambda x: x['score'], reverse=True)
+                top.push(score, job)
 
             recommendations: List[JobRecommendation] = []
-            for item in scored_jobs[:limit]:
-                job = item['job']
-                score = item['score']
-
+            for score, job in top.results():
                 recommendations.append(JobRecommendation(
                     job_id=str(job['job_id']),
                     job_title=job.get('job_title', ''),
@@ -206,7 +208,7 @@ class JobRecommender:
                 matched_keywords += 1
         score += min(matched_keywords * 3, 15)
 
-        return min(score, 95.0)
+        return min(score, MAX_JOB_SCORE)
 
     @staticmethod
     def _generate_reasoning(job: Dict[str, Any], keywords: List[str]) -> str:
@@ -8,6 +8,7 @@ from config.database import get_db_conn
 from utils.scoring_utils import hybrid_scoring
 from utils.helpers import clean_dict_for_json, merge_accumulated_insights
 from utils.ai_utils import extract_user_intent
+from app.utils.topk import TopK
 import json
 
 
@@ -123,8 +124,9 @@ class MatchingService:
         cur.close()
         conn.close()
         
-        # スコアリング
-        scored_jobs = []
+        # スコアリング（上位limit件のみ保持）
+        top = TopK(limit)
+        matched_count = 0
         for job in jobs:
             job_dict = clean_dict_for_json(dict(job))
             
@@ -136,19 +138,17 @@ class MatchingService:
             )
             
             if score_result['score'] >= min_score:
-                scored_jobs.append({
+                matched_count += 1
+                top.push(score_result['score'], {
                     **job_dict,
                     "match_score": score_result['score'],
                     "matched_features": score_result.get('matched_features', []),
                     "concerns": score_result.get('concerns', [])
                 })
         
-        # スコア順にソート
-        scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
-        
         return {
-            "recommendations": scored_jobs[:limit],
-            "total_count": len(scored_jobs),
+            "recommendations": top.items(),
+            "total_count": matched_count,
             "user_preferences": user_preferences
         }
     
@@ -201,8 +201,8 @@ class MatchingService:
         cur.close()
         conn.close()
         
-        # スコアリング
-        scored_jobs = []
+        # スコアリング（上位limit件のみ保持）
+        top = TopK(limit)
         for job in jobs:
             job_dict = clean_dict_for_json(dict(job))
             
@@ -213,7 +213,7 @@ class MatchingService:
                 use_ai=use_ai
             )
             
-            scored_jobs.append({
+            top.push(score_result['score'], {
                 **job_dict,
                 "match_score": score_result['score'],
                 "reasoning": score_result.get('reasoning', ''),
@@ -221,10 +221,8 @@ class MatchingService:
                 "concerns": score_result.get('concerns', [])
             })
         
-        # スコア順にソート
-        scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        return scored_jobs[:limit]
+        # スコア順に返す
+        return top.items()
     
     @staticmethod
     def find_alternative_jobs(
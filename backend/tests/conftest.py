@@ -0,0 +1,52 @@
+# tests/conftest.py
+"""
+テスト共通の設定
+一時ディレクトリの SQLite にマイグレーションを適用し、アプリはそのデータベースに接続する
+"""
+import os
+import tempfile
+
+# アプリ（設定・エンジン）を読み込む前に接続先を差し替える
+_db_dir = tempfile.mkdtemp(prefix="job-matching-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import pytest
+from fastapi.testclient import TestClient
+
+pytest_plugins = ["app.core.pytest_n_plus_one"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database():
+    """テスト用データベースにマイグレーションを適用"""
+    from app.db.migrations import MigrationRunner
+
+    MigrationRunner().apply()
+    yield
+
+
+@pytest.fixture
+def db():
+    from app.db.session import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def auth_headers(user_id: str) -> dict:
+    """ユーザーのアクセストークンを付けたヘッダー"""
+    from app.api.endpoints.auth import create_access_token
+
+    token, _ = create_access_token(user_id)
+    return {"Authorization": f"Bearer {token}"}
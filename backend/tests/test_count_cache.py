@@ -0,0 +1,72 @@
+# tests/test_count_cache.py
+"""件数キャッシュの破棄タイミングのテスト"""
+import uuid
+
+from sqlalchemy import func, select
+
+from app.db.session import SessionLocal
+from app.models.job import EmploymentType, Job
+from app.models.user import User, UserRole
+from app.utils.count_cache import get_count_cache
+
+
+def _job(employer_id: str) -> Job:
+    return Job(
+        id=str(uuid.uuid4()),
+        employer_id=employer_id,
+        title="バックエンドエンジニア",
+        company="株式会社テスト",
+        description="API 開発",
+        location="東京都",
+        employment_type=EmploymentType.FULL_TIME,
+    )
+
+
+def _employer(db) -> str:
+    employer = User(
+        id=str(uuid.uuid4()),
+        email=f"{uuid.uuid4()}@example.com",
+        password_hash="x",
+        name="企業ユーザー",
+        role=UserRole.EMPLOYER,
+        subscription_tier="employer_free",
+    )
+    db.add(employer)
+    db.commit()
+    return employer.id
+
+
+def _count_jobs() -> int:
+    with SessionLocal() as other:
+        return other.scalar(select(func.count(Job.id)))
+
+
+def test_invalidated_after_commit_not_at_flush(db):
+    """flush 中に別リクエストが計算した件数は、コミット後に残らない"""
+    cache = get_count_cache()
+    employer_id = _employer(db)
+    generation = cache.generation("jobs")
+
+    db.add(_job(employer_id))
+    db.flush()
+    assert cache.generation("jobs") == generation
+
+    # コミット前に別のセッションで数えた件数（追加した求人を含まない）
+    stale = cache.get_or_compute("jobs", "total", _count_jobs)
+    assert cache.get("jobs", "total") == stale
+
+    db.commit()
+    assert cache.generation("jobs") == generation + 1
+    assert cache.get("jobs", "total") is None
+    assert cache.get_or_compute("jobs", "total", _count_jobs) == stale + 1
+
+
+def test_not_invalidated_on_rollback(db):
+    cache = get_count_cache()
+    employer_id = _employer(db)
+    generation = cache.generation("jobs")
+
+    db.add(_job(employer_id))
+    db.flush()
+    db.rollback()
+    assert cache.generation("jobs") == generation
@@ -0,0 +1,40 @@
+# tests/test_debug_endpoints.py
+"""デバッグエンドポイントの登録条件のテスト"""
+import importlib
+
+import pytest
+
+import app.main
+from app.core.config import get_settings
+
+DEBUG_PATHS = {"/debug/db-pool", "/debug/counters", "/debug/loop-blocking", "/debug/slow-queries"}
+
+
+def _paths() -> set:
+    return {route.path for route in app.main.app.routes}
+
+
+@pytest.fixture
+def reload_main(monkeypatch):
+    """設定を変えて app.main を読み込み直す（終了後は元の設定で読み込み直す）"""
+    def reload(**overrides):
+        for name, value in overrides.items():
+            monkeypatch.setattr(get_settings(), name, value)
+        importlib.reload(app.main)
+
+    yield reload
+    monkeypatch.undo()
+    importlib.reload(app.main)
+
+
+def test_debug_endpoints_registered_outside_production(client):
+    assert DEBUG_PATHS <= _paths()
+    assert client.get("/debug/loop-blocking").status_code == 200
+
+
+def test_debug_endpoints_not_registered_in_production(reload_main):
+    reload_main(env="production", debug=False)
+    assert not DEBUG_PATHS & _paths()
+
+    reload_main(env="production", debug=True)
+    assert DEBUG_PATHS <= _paths()
@@ -0,0 +1,98 @@
+# tests/test_employer_stats.py
+"""企業統計（employer_stats）のカウンター更新のテスト"""
+import uuid
+
+from sqlalchemy import select
+
+from app.db.session import get_engine
+from app.models import employer_stats
+from app.models.application import Application, ApplicationStatus
+from app.models.employer_stats import EmployerStats, _apply_delta, compute_employer_stats
+from app.models.job import EmploymentType, Job, JobStatus
+from app.models.user import User, UserRole
+
+
+def _employer(connection) -> str:
+    employer_id = str(uuid.uuid4())
+    connection.execute(User.__table__.insert().values(
+        id=employer_id,
+        email=f"{employer_id}@example.com",
+        password_hash="x",
+        name="企業ユーザー",
+        role=UserRole.EMPLOYER,
+        subscription_tier="employer_free",
+        is_active=True,
+        is_verified=True,
+    ))
+    return employer_id
+
+
+def _stats(connection, employer_id: str):
+    table = EmployerStats.__table__
+    return connection.execute(select(table).where(table.c.employer_id == employer_id)).mappings().one()
+
+
+def test_apply_delta_creates_missing_row():
+    with get_engine().begin() as connection:
+        employer_id = _employer(connection)
+        _apply_delta(connection, employer_id, {"jobs_draft": 1})
+
+        # 求人はないので集計値（0）で作成される
+        assert _stats(connection, employer_id)["jobs_draft"] == 0
+        _apply_delta(connection, employer_id, {"jobs_draft": 1})
+        assert _stats(connection, employer_id)["jobs_draft"] == 1
+
+
+def test_apply_delta_when_row_created_concurrently(monkeypatch):
+    """UPDATE と INSERT の間に別のトランザクションが行を作成しても失敗せず、差分を適用する"""
+    compute = employer_stats.compute_employer_stats
+
+    def compute_while_other_inserts(connection, employer_id):
+        counts = compute(connection, employer_id)
+        connection.execute(EmployerStats.__table__.insert().values(
+            employer_id=employer_id, **dict(counts, jobs_published=3)
+        ))
+        return counts
+
+    monkeypatch.setattr(employer_stats, "compute_employer_stats", compute_while_other_inserts)
+
+    with get_engine().begin() as connection:
+        employer_id = _employer(connection)
+        _apply_delta(connection, employer_id, {"jobs_published": 1})
+
+        assert _stats(connection, employer_id)["jobs_published"] == 4
+
+
+def test_status_change_on_expired_instance_updates_counters(db):
+    """commit 後（期限切れ）のインスタンスに status を代入しても状態遷移を反映する"""
+    employer_id = _employer(db.connection())
+    seeker_id = _employer(db.connection())
+    job = Job(
+        id=str(uuid.uuid4()),
+        employer_id=employer_id,
+        title="バックエンドエンジニア",
+        company="株式会社テスト",
+        description="API 開発",
+        location="東京都",
+        employment_type=EmploymentType.FULL_TIME,
+        status=JobStatus.PUBLISHED,
+    )
+    application = Application(
+        id=str(uuid.uuid4()), seeker_id=seeker_id, job_id=job.id, status=ApplicationStatus.SCREENING
+    )
+    db.add(job)
+    db.flush()
+    db.add(application)
+    db.commit()
+
+    # expire_on_commit で status は未ロードの状態
+    job.status = JobStatus.CLOSED
+    db.commit()
+    application.status = ApplicationStatus.INTERVIEW
+    db.commit()
+
+    connection = db.connection()
+    stats = _stats(connection, employer_id)
+    assert {name: stats[name] for name in employer_stats.COUNTER_COLUMNS} == compute_employer_stats(connection, employer_id)
+    assert stats["jobs_closed"] == 1 and stats["jobs_published"] == 0
+    assert stats["applications_interview"] == 1 and stats["applications_screening"] == 0
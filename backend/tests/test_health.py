@@ -0,0 +1,19 @@
+# tests/test_health.py
+"""ヘルスチェック（スキーマバージョンの確認）のテスト"""
+from app.db import migrations
+
+
+def test_health_reports_schema_version(client):
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "schema_version": migrations.LATEST_VERSION}
+
+
+def test_health_unhealthy_while_migrations_pending(client, monkeypatch):
+    monkeypatch.setattr(migrations, "LATEST_VERSION", migrations.LATEST_VERSION + 1)
+
+    response = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "unhealthy"
@@ -0,0 +1,61 @@
+# tests/test_migrations.py
+"""バージョン付きマイグレーションのテスト"""
+import json
+
+from sqlalchemy import Column, Integer, create_engine, inspect, text
+
+import app.models  # noqa: F401  テーブル定義を metadata に登録
+from app.db.base import Base
+from app.db.frozen_schema import frozen_metadata
+from app.db.migrations import MIGRATIONS, MigrationRunner
+
+
+def _columns(engine, table: str) -> set:
+    return {c["name"] for c in inspect(engine).get_columns(table)}
+
+
+def test_baseline_does_not_create_later_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    MigrationRunner(engine).apply(target=1)
+
+    assert "desired_salary_min_yen" not in _columns(engine, "users")
+    assert "view_count" not in _columns(engine, "jobs")
+    assert not inspect(engine).has_table("employer_stats")
+
+
+def test_migrations_produce_model_schema(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'latest.db'}")
+    MigrationRunner(engine).apply()
+
+    for table in Base.metadata.sorted_tables:
+        assert _columns(engine, table.name) == set(table.columns.keys()), table.name
+
+
+def test_checksum_covers_frozen_table_definitions():
+    baseline = MIGRATIONS[0]
+    before = baseline.checksum
+    users = frozen_metadata.tables["users"]
+    column = Column("checksum_probe", Integer)
+    users.append_column(column)
+    try:
+        assert baseline.checksum != before
+    finally:
+        users._columns.remove(column)
+    assert baseline.checksum == before
+
+
+def test_native_json_splits_comma_separated_skills(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'json.db'}")
+    runner = MigrationRunner(engine)
+    runner.apply(target=9)
+    with engine.begin() as connection:
+        # 変換前はカンマ区切りのテキストで保存されていた値
+        connection.execute(frozen_metadata.tables["users"].insert().values(
+            id="u1", email="u1@example.com", password_hash="x", name="求職者", role="SEEKER",
+            subscription_tier="seeker_free", is_active=True, is_verified=True, skills="Python, Go、 SQL",
+        ))
+
+    runner.apply()
+    with engine.connect() as connection:
+        skills = connection.execute(text("SELECT skills FROM users WHERE id = 'u1'")).scalar()
+    assert json.loads(skills) == ["Python", "Go", "SQL"]
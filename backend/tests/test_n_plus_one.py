@@ -0,0 +1,125 @@
+# tests/test_n_plus_one.py
+"""N+1 クエリ検知（NPlusOneMiddleware と n_plus_one フィクスチャ）のテスト"""
+import uuid
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import NPlusOneQueryError
+from app.core.query_counter import NPlusOneMiddleware, override_detection, track_queries
+from app.db.session import get_db
+from app.models.application import Application, ApplicationStatus
+from app.models.job import EmploymentType, Job, JobStatus
+from app.models.user import User, UserRole
+from conftest import auth_headers
+
+
+def _user(role: UserRole, **kwargs) -> User:
+    user_id = str(uuid.uuid4())
+    return User(
+        id=user_id,
+        email=f"{user_id}@example.com",
+        password_hash="x",
+        name="テストユーザー",
+        role=role,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def employer_with_applications(db: Session) -> User:
+    """求人3件・応募6件を持つ企業"""
+    employer = _user(UserRole.EMPLOYER, company_name="株式会社テスト")
+    seekers = [_user(UserRole.SEEKER, skills=["Python", "SQL"]) for _ in range(6)]
+    db.add_all([employer, *seekers])
+    db.flush()
+
+    jobs = [
+        Job(
+            id=str(uuid.uuid4()),
+            employer_id=employer.id,
+            title=f"バックエンドエンジニア{n}",
+            company="株式会社テスト",
+            description="Python での API 開発",
+            location="東京都渋谷区",
+            employment_type=EmploymentType.FULL_TIME,
+            salary_min=600,
+            salary_max=800,
+            status=JobStatus.PUBLISHED,
+        )
+        for n in range(3)
+    ]
+    db.add_all(jobs)
+    db.flush()
+
+    db.add_all([
+        Application(
+            id=str(uuid.uuid4()),
+            seeker_id=seeker.id,
+            job_id=jobs[n % len(jobs)].id,
+            status=ApplicationStatus.SCREENING,
+        )
+        for n, seeker in enumerate(seekers)
+    ])
+    db.commit()
+    return employer
+
+
+@pytest.mark.max_query_repeats(2)
+def test_fixture_counts_queries_from_test_client_requests(client, employer_with_applications, n_plus_one):
+    # データの投入はフィクスチャの計測が始まる前に済ませる（引数の順に準備される）
+    response = client.get("/api/applications/employer", headers=auth_headers(employer_with_applications.id))
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 6
+    # 認証のユーザー取得と結合クエリ1本（応募件数に比例しない）
+    assert len(n_plus_one.requests) == 1
+    assert 0 < n_plus_one.total <= 3
+
+
+def test_fixture_counts_queries_from_test_body(n_plus_one, db):
+    db.execute(select(User.id).limit(1)).all()
+
+    assert n_plus_one.total == 1
+    assert n_plus_one.requests == []
+
+
+def _n_plus_one_app() -> FastAPI:
+    """行ごとにクエリを発行する（N+1 の）ルートだけを持つアプリ"""
+    app = FastAPI()
+    app.add_middleware(NPlusOneMiddleware)
+
+    @app.get("/users")
+    def list_users(db: Session = Depends(get_db)):
+        ids = db.scalars(select(User.id).limit(5)).all()
+        return [db.scalar(select(User.name).where(User.id == user_id)) for user_id in ids]
+
+    return app
+
+
+def test_repeated_statement_in_request_fails(employer_with_applications):
+    client = TestClient(_n_plus_one_app())
+
+    with pytest.raises(NPlusOneQueryError) as excinfo:
+        with track_queries(threshold=2, mode="raise") as counter:
+            with override_detection("raise", 2, collector=counter):
+                client.get("/users")
+
+    assert "GET /users" in str(excinfo.value)
+
+
+def test_same_request_repeated_is_not_n_plus_one(employer_with_applications):
+    client = TestClient(_n_plus_one_app())
+
+    with track_queries(threshold=2, mode="raise") as counter:
+        with override_detection("raise", 10, collector=counter):
+            for _ in range(3):
+                client.get("/users")
+
+    # リクエストをまたいだ繰り返しは N+1 として扱わない
+    assert len(counter.requests) == 3
+    assert counter.repeated() == []
+    assert counter.total == 3 * 6
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
-Iizumiロジック移植用テーブルセットアップスクリプト
+Iizumiロジック移植用テーブルの確認スクリプト
+
+テーブルの作成は backend/scripts/migrate.py apply で行います（このスクリプトは適用状況と件数を確認します）
 
 使用方法:
     python scripts/setup_iizumi_tables.py
@@ -24,6 +26,10 @@ except ImportError:
     sys.exit(1)
 
 
+# chat_sessions / user_preferences_profile を作成するマイグレーション（backend/app/db/migrations.py）
+IIZUMI_MIGRATION_VERSION = 3
+
+
 def get_connection():
     """データベース接続を取得"""
     database_url = os.getenv("DATABASE_URL")
@@ -47,65 +53,29 @@ def get_connection():
 
 
 def run_migration():
-    """マイグレーションを実行"""
+    """マイグレーションの適用状況とテーブルの件数を確認"""
     conn = get_connection()
     cur = conn.cursor()
 
     try:
         print("\n=== Iizumi Migration Start ===\n")
 
-        # 1. chat_sessions テーブル作成
-        print("1. Creating chat_sessions table...")
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS chat_sessions (
-                session_id VARCHAR(255) PRIMARY KEY,
-                user_id VARCHAR(255) NOT NULL,
-                session_data JSONB NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_chat_sessions_user_id
-            ON chat_sessions(user_id)
-        """)
-
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_chat_sessions_updated_at
-            ON chat_sessions(updated_at)
-        """)
+        # 1. chat_sessions / user_preferences_profile はマイグレーションで作成する
+        print("1. Checking migration ledger...")
+        cur.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        applied = False
+        if cur.fetchone()[0]:
+            cur.execute("SELECT 1 FROM schema_migrations WHERE version = %s", (IIZUMI_MIGRATION_VERSION,))
+            applied = cur.fetchone() is not None
+        if not applied:
+            print("   ERROR: iizumi_tables migration is not applied.")
+            print("   Run: python backend/scripts/migrate.py apply")
+            return
         print("   chat_sessions: OK")
-
-        # 2. user_preferences_profile テーブル作成
-        print("2. Creating user_preferences_profile table...")
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS user_preferences_profile (
-                id SERIAL PRIMARY KEY,
-                user_id VARCHAR(36) UNIQUE NOT NULL,
-                job_title VARCHAR(200),
-                location_prefecture VARCHAR(50),
-                location_city VARCHAR(100),
-                salary_min INTEGER,
-                salary_max INTEGER,
-                remote_work_preference VARCHAR(50),
-                employment_type VARCHAR(50),
-                industry_preferences JSONB,
-                work_hours_preference VARCHAR(100),
-                company_size_preference VARCHAR(50),
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-
-        cur.execute("""
-            CREATE INDEX IF NOT EXISTS idx_user_preferences_profile_user_id
-            ON user_preferences_profile(user_id)
-        """)
         print("   user_preferences_profile: OK")
 
-        # 3. jobs テーブル確認
-        print("3. Checking jobs table...")
+        # 2. jobs テーブル確認
+        print("2. Checking jobs table...")
         cur.execute("""
             SELECT EXISTS (
                 SELECT FROM pg_tables WHERE tablename = 'jobs'
@@ -116,8 +86,8 @@ def run_migration():
         else:
             print("   WARNING: jobs table does not exist!")
 
-        # 4. テーブル状況確認
-        print("\n4. Table statistics:")
+        # 3. テーブル状況確認
+        print("\n3. Table statistics:")
 
         cur.execute("SELECT COUNT(*) FROM chat_sessions")
         chat_count = cur.fetchone()[0]
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
-サブスクリプション関連テーブルの作成とシードデータ投入スクリプト
+サブスクリプションプランのシードデータ投入スクリプト
+
+テーブルの作成は backend/scripts/migrate.py apply で行います（このスクリプトは作成済みかを確認するだけです）
 
 Azure Database for PostgreSQL への接続に対応
 
@@ -29,105 +31,8 @@ except ImportError:
     exit(1)
 
 
-# =============================================================================
-# テーブル作成SQL
-# =============================================================================
-
-CREATE_SUBSCRIPTION_PLANS_TABLE = """
-CREATE TABLE IF NOT EXISTS subscription_plans (
-    id VARCHAR(36) PRIMARY KEY,
-    name VARCHAR(50) UNIQUE NOT NULL,
-    display_name VARCHAR(100) NOT NULL,
-    user_role VARCHAR(20) NOT NULL,
-    tier VARCHAR(30) NOT NULL,
-    price_jpy INTEGER NOT NULL DEFAULT 0,
-    features TEXT,
-    description TEXT,
-    display_order INTEGER DEFAULT 0,
-    is_active BOOLEAN NOT NULL DEFAULT TRUE,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
-);
-"""
-
-CREATE_SUBSCRIPTIONS_TABLE = """
-CREATE TABLE IF NOT EXISTS subscriptions (
-    id VARCHAR(36) PRIMARY KEY,
-    user_id VARCHAR(36) NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    plan_id VARCHAR(36) NOT NULL REFERENCES subscription_plans(id),
-    status VARCHAR(20) NOT NULL DEFAULT 'active',
-    gmo_member_id VARCHAR(100),
-    gmo_subscription_id VARCHAR(100) UNIQUE,
-    current_period_start TIMESTAMP WITH TIME ZONE NOT NULL,
-    current_period_end TIMESTAMP WITH TIME ZONE NOT NULL,
-    cancel_at_period_end BOOLEAN NOT NULL DEFAULT FALSE,
-    canceled_at TIMESTAMP WITH TIME ZONE,
-    trial_end TIMESTAMP WITH TIME ZONE,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
-);
-
-CREATE INDEX IF NOT EXISTS idx_subscriptions_user_id ON subscriptions(user_id);
-"""
-
-CREATE_USAGE_TRACKING_TABLE = """
-CREATE TABLE IF NOT EXISTS usage_tracking (
-    id VARCHAR(36) PRIMARY KEY,
-    user_id VARCHAR(36) NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    period_start TIMESTAMP WITH TIME ZONE NOT NULL,
-    period_end TIMESTAMP WITH TIME ZONE NOT NULL,
-    ai_chat_count INTEGER NOT NULL DEFAULT 0,
-    application_count INTEGER NOT NULL DEFAULT 0,
-    scout_count INTEGER NOT NULL DEFAULT 0,
-    job_posting_count INTEGER NOT NULL DEFAULT 0,
-    candidate_view_count INTEGER NOT NULL DEFAULT 0,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
-);
-
-CREATE INDEX IF NOT EXISTS idx_usage_tracking_user_id ON usage_tracking(user_id);
-"""
-
-CREATE_PAYMENT_HISTORY_TABLE = """
-CREATE TABLE IF NOT EXISTS payment_history (
-    id VARCHAR(36) PRIMARY KEY,
-    user_id VARCHAR(36) NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-    subscription_id VARCHAR(36) REFERENCES subscriptions(id),
-    gmo_order_id VARCHAR(100) UNIQUE,
-    gmo_tran_id VARCHAR(100),
-    amount_jpy INTEGER NOT NULL,
-    currency VARCHAR(3) NOT NULL DEFAULT 'JPY',
-    status VARCHAR(20) NOT NULL DEFAULT 'pending',
-    payment_method VARCHAR(50),
-    description VARCHAR(500),
-    error_message TEXT,
-    receipt_url VARCHAR(500),
-    paid_at TIMESTAMP WITH TIME ZONE,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
-);
-
-CREATE INDEX IF NOT EXISTS idx_payment_history_user_id ON payment_history(user_id);
-"""
-
-# usersテーブルへのカラム追加
-ALTER_USERS_TABLE = """
-DO $$
-BEGIN
-    -- gmo_member_id カラムを追加
-    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
-                   WHERE table_name = 'users' AND column_name = 'gmo_member_id') THEN
-        ALTER TABLE users ADD COLUMN gmo_member_id VARCHAR(100) UNIQUE;
-        CREATE INDEX idx_users_gmo_member_id ON users(gmo_member_id);
-    END IF;
-
-    -- subscription_tier カラムを追加
-    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
-                   WHERE table_name = 'users' AND column_name = 'subscription_tier') THEN
-        ALTER TABLE users ADD COLUMN subscription_tier VARCHAR(50) NOT NULL DEFAULT 'free';
-    END IF;
-END $$;
-"""
+# テーブル・usersへのカラム追加はマイグレーション（backend/scripts/migrate.py）で作成する
+SUBSCRIPTION_MIGRATION_VERSION = 2
 
 
 # =============================================================================
@@ -264,26 +169,25 @@ def get_connection(args):
     )
 
 
-def create_tables(cursor):
-    """テーブルを作成"""
-    print("\n=== テーブル作成 ===")
+def check_tables(cursor):
+    """マイグレーションでテーブルが作成済みか確認"""
+    print("\n=== テーブル確認 ===")
 
-    tables = [
-        ("subscription_plans", CREATE_SUBSCRIPTION_PLANS_TABLE),
-        ("subscriptions", CREATE_SUBSCRIPTIONS_TABLE),
-        ("usage_tracking", CREATE_USAGE_TRACKING_TABLE),
-        ("payment_history", CREATE_PAYMENT_HISTORY_TABLE),
-    ]
-
-    for table_name, create_sql in tables:
-        print(f"  Creating table: {table_name}...", end=" ")
-        cursor.execute(create_sql)
-        print("OK")
+    cursor.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+    applied = False
+    if cursor.fetchone()[0]:
+        cursor.execute(
+            "SELECT 1 FROM schema_migrations WHERE version = %s",
+            (SUBSCRIPTION_MIGRATION_VERSION,),
+        )
+        applied = cursor.fetchone() is not None
 
-    # usersテーブルにカラム追加
-    print(f"  Altering table: users...", end=" ")
-    cursor.execute(ALTER_USERS_TABLE)
-    print("OK")
+    if not applied:
+        raise RuntimeError(
+            "サブスクリプション関連テーブルのマイグレーションが未適用です。\n"
+            "先に python backend/scripts/migrate.py apply を実行してください。"
+        )
+    print("  subscription_plans / subscriptions / usage_tracking / payment_history: OK")
 
 
 def insert_seed_data(cursor):
@@ -350,7 +254,7 @@ def verify_data(cursor):
 
 def main():
     parser = argparse.ArgumentParser(
-        description="サブスクリプション関連テーブルの作成とシードデータ投入"
+        description="サブスクリプションプランのシードデータ投入"
     )
     parser.add_argument("--host", help="PostgreSQLホスト (例: your-server.postgres.database.azure.com)")
     parser.add_argument("--port", type=int, default=5432, help="ポート番号 (デフォルト: 5432)")
@@ -358,20 +262,12 @@ def main():
     parser.add_argument("--user", help="ユーザー名")
     parser.add_argument("--password", help="パスワード")
     parser.add_argument("--skip-seed", action="store_true", help="シードデータ投入をスキップ")
-    parser.add_argument("--dry-run", action="store_true", help="実行せずにSQLを表示のみ")
+    parser.add_argument("--dry-run", action="store_true", help="実行せずに投入内容を表示のみ")
 
     args = parser.parse_args()
 
     if args.dry_run:
-        print("=== DRY RUN: 実行されるSQL ===\n")
-        print("-- テーブル作成")
-        print(CREATE_SUBSCRIPTION_PLANS_TABLE)
-        print(CREATE_SUBSCRIPTIONS_TABLE)
-        print(CREATE_USAGE_TRACKING_TABLE)
-        print(CREATE_PAYMENT_HISTORY_TABLE)
-        print("\n-- usersテーブル変更")
-        print(ALTER_USERS_TABLE)
-        print("\n-- シードデータ")
+        print("=== DRY RUN: 投入されるシードデータ ===\n")
         for plan in SUBSCRIPTION_PLANS_SEED:
             print(f"-- {plan['name']}: {plan['display_name']} (¥{plan['price_jpy']})")
         return
@@ -382,8 +278,8 @@ def main():
 
         print("データベースに接続しました。")
 
-        # テーブル作成
-        create_tables(cursor)
+        # テーブル確認
+        check_tables(cursor)
 
         # シードデータ投入
         if not args.skip_seed: